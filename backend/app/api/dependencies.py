@@ -1,7 +1,9 @@
+import logging
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from app.core.database import get_db
 from app.core.security import decode_token
+from app.services.token_revocation import get_revocation_list
 from app.repositories.user_repository import UserRepository
 from app.repositories.vendor_repository import VendorRepository
 from app.repositories.booking_repository import BookingRepository
@@ -9,6 +11,11 @@ from app.repositories.service_repository import ServiceRepository
 from app.repositories.review_repository import ReviewRepository
 from app.repositories.checklist_repository import ChecklistRepository
 from app.repositories.favorite_repository import FavoriteRepository
+from app.repositories.recommendation_repository import RecommendationRepository
+from app.repositories.availability_repository import AvailabilityRepository
+from app.repositories.job_repository import JobRepository
+from app.repositories.email_campaign_repository import EmailCampaignRepository
+from app.repositories.vendor_digest_repository import VendorDigestRepository
 from app.services.user_service import UserService
 from app.services.vendor_service import VendorService
 from app.services.booking_service import BookingService
@@ -16,6 +23,12 @@ from app.services.vendor_stats_service import VendorStatsService
 from app.services.review_service import ReviewService
 from app.services.checklist_service import ChecklistService
 from app.services.favorite_service import FavoriteService
+from app.services.budget_service import BudgetService
+from app.services.recommendation_service import RecommendationService
+from app.services.availability_service import AvailabilityService
+from app.services.bulk_email_service import BulkEmailService
+
+logger = logging.getLogger(__name__)
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login")
 
@@ -48,19 +61,46 @@ async def get_favorite_repository(db = Depends(get_db)):
     return FavoriteRepository(db)
 
 
+async def get_availability_repository(db = Depends(get_db)):
+    return AvailabilityRepository(db)
+
+
+async def get_job_repository(db = Depends(get_db)):
+    return JobRepository(db)
+
+
+async def get_email_campaign_repository(db = Depends(get_db)):
+    return EmailCampaignRepository(db)
+
+
+async def get_vendor_digest_repository(db = Depends(get_db)):
+    return VendorDigestRepository(db)
+
+
 async def get_user_service(user_repo: UserRepository = Depends(get_user_repository)):
     return UserService(user_repo)
 
 
+async def get_availability_service(
+    availability_repo: AvailabilityRepository = Depends(get_availability_repository),
+    vendor_repo: VendorRepository = Depends(get_vendor_repository)
+):
+    return AvailabilityService(availability_repo, vendor_repo)
+
+
 async def get_vendor_service(
     vendor_repo: VendorRepository = Depends(get_vendor_repository),
-    user_repo: UserRepository = Depends(get_user_repository)
+    user_repo: UserRepository = Depends(get_user_repository),
+    availability_service: AvailabilityService = Depends(get_availability_service)
 ):
-    return VendorService(vendor_repo, user_repo)
+    return VendorService(vendor_repo, user_repo, availability_service)
 
 
-async def get_booking_service(booking_repo: BookingRepository = Depends(get_booking_repository)):
-    return BookingService(booking_repo)
+async def get_booking_service(
+    booking_repo: BookingRepository = Depends(get_booking_repository),
+    availability_service: AvailabilityService = Depends(get_availability_service)
+):
+    return BookingService(booking_repo, availability_service)
 
 
 async def get_vendor_stats_service(
@@ -79,6 +119,14 @@ async def get_review_service(
     return ReviewService(review_repo, user_repo, booking_repo)
 
 
+async def get_bulk_email_service(
+    campaign_repo: EmailCampaignRepository = Depends(get_email_campaign_repository),
+    vendor_repo: VendorRepository = Depends(get_vendor_repository),
+    digest_repo: VendorDigestRepository = Depends(get_vendor_digest_repository)
+):
+    return BulkEmailService(campaign_repo, vendor_repo, digest_repo)
+
+
 async def get_checklist_service(
     checklist_repo: ChecklistRepository = Depends(get_checklist_repository)
 ):
@@ -91,6 +139,19 @@ async def get_favorite_service(
     return FavoriteService(favorite_repo)
 
 
+async def get_budget_service(
+    vendor_repo: VendorRepository = Depends(get_vendor_repository)
+):
+    return BudgetService(vendor_repo)
+
+
+async def get_recommendation_service(db = Depends(get_db)):
+    return RecommendationService(
+        RecommendationRepository(db, "vendor_recommendations"),
+        RecommendationRepository(db, "user_recommendations")
+    )
+
+
 async def get_current_user(
     token: str = Depends(oauth2_scheme),
     user_service: UserService = Depends(get_user_service)
@@ -103,14 +164,14 @@ async def get_current_user(
     
     payload = decode_token(token)
     if payload is None:
-        print(f"[AUTH ERROR] Token decode returned None for token: {token[:20]}...")
+        logger.debug("Rejected access token that failed verification")
         raise credentials_exception
     
     user_id: str = payload.get("sub")
-    if user_id is None:
+    if user_id is None or get_revocation_list().is_revoked(payload):
         raise credentials_exception
     
-    user = await user_service.get_user_by_id(user_id)
+    user = await user_service.get_principal(user_id)
     if user is None:
         raise credentials_exception
     
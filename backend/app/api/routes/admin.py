@@ -1,13 +1,23 @@
+import asyncio
 from fastapi import APIRouter, Depends, HTTPException, status, Request
 from fastapi.exceptions import RequestValidationError
-from typing import List
+from fastapi.responses import FileResponse, JSONResponse, PlainTextResponse
+from typing import List, Optional
 from app.services.vendor_service import VendorService
 from app.services.user_service import UserService
 from app.services.review_service import ReviewService
-from app.api.dependencies import get_vendor_service, get_current_admin, get_user_service, get_review_service, get_vendor_stats_service
+from app.api.dependencies import get_vendor_service, get_current_admin, get_user_service, get_review_service, get_vendor_stats_service, get_job_repository, get_bulk_email_service, get_email_campaign_repository
+from app.repositories.job_repository import JobRepository
+from app.repositories.email_campaign_repository import EmailCampaignRepository
+from app.services.bulk_email_service import BulkEmailService
+from app.models.email_campaign import AnnouncementRequest, EmailCampaignResponse
 from app.models.vendor import VendorResponse, VendorCreate
 from app.models.user import UserResponse
-import traceback
+from app.core.profiling import get_continuous_profiler, list_profiles, profile_path
+from app.core.memory_profiling import get_memory_profiler
+import logging
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
@@ -51,8 +61,7 @@ async def approve_vendor(
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Vendor not found")
         return vendor
     except Exception as e:
-        print(f"[ERROR] Error approving vendor {vendor_id}: {e}")
-        traceback.print_exc()
+        logger.exception(f"Error approving vendor {vendor_id}: {e}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to approve vendor: {str(e)}"
@@ -71,8 +80,7 @@ async def reject_vendor(
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Vendor not found")
         return vendor
     except Exception as e:
-        print(f"[ERROR] Error rejecting vendor {vendor_id}: {e}")
-        traceback.print_exc()
+        logger.exception(f"Error rejecting vendor {vendor_id}: {e}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to reject vendor: {str(e)}"
@@ -86,9 +94,9 @@ async def create_vendor(
     vendor_service: VendorService = Depends(get_vendor_service)
 ):
     try:
-        print(f"[DEBUG] Creating vendor with data: {vendor_data.model_dump()}")
+        logger.debug(f"Creating vendor for: {vendor_data.email}")
         vendor = await vendor_service.create_vendor_as_admin(vendor_data)
-        print(f"[DEBUG] Vendor created, preparing response...")
+        logger.debug(f"Vendor created, preparing response...")
         
         vendor_id = vendor.get("_id") or vendor.get("id")
         if vendor_id:
@@ -102,17 +110,14 @@ async def create_vendor(
         vendor.pop("hashed_password", None)
         vendor.pop("updated_at", None)
         
-        print(f"[DEBUG] Returning vendor response with ID: {vendor.get('id')}")
+        logger.debug(f"Returning vendor response with ID: {vendor.get('id')}")
         return vendor
     except ValueError as e:
-        print(f"[ERROR] ValueError creating vendor: {str(e)}")
+        logger.error(f"ValueError creating vendor: {str(e)}")
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
-        import traceback
         error_msg = str(e)
-        traceback_str = traceback.format_exc()
-        print(f"[ERROR] Error creating vendor: {error_msg}")
-        print(traceback_str)
+        logger.exception(f"Error creating vendor: {error_msg}")
         if "validation" in error_msg.lower() or "pydantic" in error_msg.lower():
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -148,8 +153,7 @@ async def get_all_users(
         
         return formatted_users
     except Exception as e:
-        print(f"[ERROR] Error fetching users: {e}")
-        traceback.print_exc()
+        logger.exception(f"Error fetching users: {e}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to fetch users: {str(e)}"
@@ -184,8 +188,7 @@ async def get_pending_admin_approvals(
         
         return formatted_users
     except Exception as e:
-        print(f"[ERROR] Error fetching pending admin approvals: {e}")
-        traceback.print_exc()
+        logger.exception(f"Error fetching pending admin approvals: {e}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to fetch pending admin approvals: {str(e)}"
@@ -206,10 +209,7 @@ async def approve_admin(
         if user.get("role") != "admin":
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="User is not an admin")
         
-        updated_user = await user_service.user_repo.update(
-            user_id,
-            {"is_admin_approved": True, "is_active": True}
-        )
+        updated_user = await user_service.approve_admin(user_id)
         
         if not updated_user:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
@@ -228,8 +228,7 @@ async def approve_admin(
     except HTTPException:
         raise
     except Exception as e:
-        print(f"[ERROR] Error approving admin: {e}")
-        traceback.print_exc()
+        logger.exception(f"Error approving admin: {e}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to approve admin: {str(e)}"
@@ -243,7 +242,7 @@ async def reject_admin(
     user_service: UserService = Depends(get_user_service)
 ):
     try:
-        print(f"[DEBUG] Reject admin called with user_id: {user_id}")
+        logger.debug(f"Reject admin called with user_id: {user_id}")
         user = await user_service.get_user_by_id(user_id)
         if not user:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"User not found with ID: {user_id}")
@@ -251,17 +250,16 @@ async def reject_admin(
         if user.get("role") != "admin":
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="User is not an admin")
         
-        deleted = await user_service.user_repo.delete(user_id)
+        deleted = await user_service.delete_user(user_id)
         if not deleted:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"User not found with ID: {user_id}")
         
-        print(f"[DEBUG] Admin rejection successful, user deleted: {user_id}")
+        logger.debug(f"Admin rejection successful, user deleted: {user_id}")
         return {"message": "Admin registration rejected and removed"}
     except HTTPException:
         raise
     except Exception as e:
-        print(f"[ERROR] Error rejecting admin: {e}")
-        traceback.print_exc()
+        logger.exception(f"Error rejecting admin: {e}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to reject admin: {str(e)}"
@@ -280,7 +278,7 @@ async def toggle_user_active(
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
         
         new_status = not user.get("is_active", True)
-        updated_user = await user_service.user_repo.update(user_id, {"is_active": new_status})
+        updated_user = await user_service.set_active(user_id, new_status)
         
         if not updated_user:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
@@ -299,8 +297,7 @@ async def toggle_user_active(
     except HTTPException:
         raise
     except Exception as e:
-        print(f"[ERROR] Error toggling user status: {e}")
-        traceback.print_exc()
+        logger.exception(f"Error toggling user status: {e}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to toggle user status: {str(e)}"
@@ -338,14 +335,138 @@ async def get_admin_stats(
             "flaggedReviews": flagged_reviews_count
         }
     except Exception as e:
-        print(f"[ERROR] Error fetching admin stats: {e}")
-        traceback.print_exc()
+        logger.exception(f"Error fetching admin stats: {e}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to fetch stats: {str(e)}"
         )
 
 
+@router.get("/jobs")
+async def get_job_stats(
+    current_admin: dict = Depends(get_current_admin),
+    job_repo: JobRepository = Depends(get_job_repository)
+):
+    return await job_repo.count_by_status()
+
+
+@router.get("/profiles")
+async def get_profiles(current_admin: dict = Depends(get_current_admin)):
+    profiler = get_continuous_profiler()
+    return {
+        "profiles": list_profiles(),
+        "continuous": {
+            "running": profiler.running,
+            "interval_ms": profiler.interval * 1000,
+            "routes": profiler.rolling.routes()
+        }
+    }
+
+
+@router.get("/profiles/rolling")
+async def download_rolling_profile(
+    route: Optional[str] = None,
+    format: str = "speedscope",
+    current_admin: dict = Depends(get_current_admin)
+):
+    if format not in ("speedscope", "collapsed"):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="format must be speedscope or collapsed")
+    
+    profile = get_continuous_profiler().rolling.merged(route)
+    if format == "collapsed":
+        return PlainTextResponse(
+            profile.to_collapsed(),
+            headers={"Content-Disposition": 'attachment; filename="rolling-profile.folded"'}
+        )
+    return JSONResponse(
+        profile.to_speedscope(route or "all routes"),
+        headers={"Content-Disposition": 'attachment; filename="rolling-profile.speedscope.json"'}
+    )
+
+
+@router.get("/profiles/{name}")
+async def download_profile(name: str, current_admin: dict = Depends(get_current_admin)):
+    path = profile_path(name)
+    if path is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Profile not found")
+    return FileResponse(path, media_type="application/json", filename=name)
+
+
+@router.get("/memory")
+async def get_memory_status(current_admin: dict = Depends(get_current_admin)):
+    return get_memory_profiler().status()
+
+
+@router.post("/memory/start")
+async def start_memory_tracing(frames: int = 0, current_admin: dict = Depends(get_current_admin)):
+    if frames < 0 or frames > 64:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="frames must be between 0 and 64")
+    get_memory_profiler().start(frames)
+    return get_memory_profiler().status()
+
+
+@router.post("/memory/stop")
+async def stop_memory_tracing(current_admin: dict = Depends(get_current_admin)):
+    get_memory_profiler().stop()
+    return get_memory_profiler().status()
+
+
+@router.post("/memory/snapshots", status_code=status.HTTP_201_CREATED)
+async def take_memory_snapshot(current_admin: dict = Depends(get_current_admin)):
+    return await asyncio.to_thread(get_memory_profiler().take_snapshot)
+
+
+@router.get("/memory/snapshots")
+async def get_memory_snapshots(current_admin: dict = Depends(get_current_admin)):
+    return get_memory_profiler().list_snapshots()
+
+
+@router.get("/memory/snapshots/{snapshot_id}/top")
+async def get_memory_top(
+    snapshot_id: int,
+    group_by: str = "module",
+    limit: int = 25,
+    current_admin: dict = Depends(get_current_admin)
+):
+    return await asyncio.to_thread(get_memory_profiler().top, snapshot_id, group_by, limit)
+
+
+@router.delete("/memory/snapshots/{snapshot_id}")
+async def delete_memory_snapshot(snapshot_id: int, current_admin: dict = Depends(get_current_admin)):
+    get_memory_profiler().delete_snapshot(snapshot_id)
+    return {"message": "Snapshot deleted successfully"}
+
+
+@router.get("/memory/diff")
+async def get_memory_diff(
+    from_id: int,
+    to_id: Optional[int] = None,
+    group_by: str = "module",
+    limit: int = 25,
+    current_admin: dict = Depends(get_current_admin)
+):
+    return await asyncio.to_thread(get_memory_profiler().diff, from_id, to_id, group_by, limit)
+
+
+@router.post("/announcements", response_model=EmailCampaignResponse, status_code=status.HTTP_202_ACCEPTED)
+async def send_announcement(
+    announcement: AnnouncementRequest,
+    current_admin: dict = Depends(get_current_admin),
+    bulk_email_service: BulkEmailService = Depends(get_bulk_email_service)
+):
+    return await bulk_email_service.create_announcement(announcement.subject, announcement.message)
+
+
+@router.get("/campaigns", response_model=List[EmailCampaignResponse])
+async def get_email_campaigns(
+    skip: int = 0,
+    limit: int = 50,
+    current_admin: dict = Depends(get_current_admin),
+    campaign_repo: EmailCampaignRepository = Depends(get_email_campaign_repository)
+):
+    return await campaign_repo.get_recent(skip, limit)
+
+
 @router.get("/reviews")
 async def get_all_reviews(
     skip: int = 0,
@@ -381,8 +502,7 @@ async def get_all_reviews(
         
         return formatted_reviews
     except Exception as e:
-        print(f"[ERROR] Error fetching reviews: {e}")
-        traceback.print_exc()
+        logger.exception(f"Error fetching reviews: {e}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to fetch reviews: {str(e)}"
@@ -405,8 +525,7 @@ async def delete_review(
     except HTTPException:
         raise
     except Exception as e:
-        print(f"[ERROR] Error deleting review: {e}")
-        traceback.print_exc()
+        logger.exception(f"Error deleting review: {e}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to delete review: {str(e)}"
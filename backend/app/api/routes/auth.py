@@ -1,12 +1,13 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
 from datetime import timedelta, datetime
-from app.services.user_service import UserService
-from app.api.dependencies import get_user_service
-from app.core.security import create_access_token
+from app.services.user_service import UserService, invalidate_principal
+from app.api.dependencies import get_user_service, oauth2_scheme
+from app.core.security import create_access_token, decode_token
 from app.core.config import settings
 from app.models.user import UserCreate, UserResponse
 from app.services.email_service import email_service
+from app.services.token_revocation import get_revocation_list
 from pydantic import BaseModel, EmailStr
 from app.core.password_validator import validate_password_strength, get_password_requirements
 import secrets
@@ -33,18 +34,6 @@ async def login(
     form_data: OAuth2PasswordRequestForm = Depends(),
     user_service: UserService = Depends(get_user_service)
 ):
-    user_check = await user_service.user_repo.get_by_email(form_data.username)
-    if user_check:
-        from app.core.security import verify_password
-        if (user_check.get("role") == "admin" and 
-            user_check.get("is_admin_approved") is False and
-            verify_password(form_data.password, user_check["hashed_password"])):
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Your admin registration is pending approval. Please wait for an existing admin to approve your request.",
-                headers={"WWW-Authenticate": "Bearer"},
-            )
-    
     user = await user_service.authenticate_user(form_data.username, form_data.password)
     if not user:
         raise HTTPException(
@@ -71,6 +60,24 @@ async def login(
     }
 
 
+@router.post("/logout")
+async def logout(token: str = Depends(oauth2_scheme)):
+    payload = decode_token(token)
+    if payload is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    
+    if payload.get("jti"):
+        await get_revocation_list().revoke_token(payload["jti"], payload["exp"])
+    else:
+        # Tokens issued before jti existed can only be revoked together with the user's other sessions
+        await get_revocation_list().revoke_user(payload["sub"])
+    return {"message": "Logged out successfully"}
+
+
 @router.post("/check-email")
 async def check_email(
     email_data: dict,
@@ -166,9 +173,7 @@ async def forgot_password(
         return {"message": "If an account exists with this email, a password reset link has been sent"}
     
     except Exception as e:
-        print(f"[FORGOT PASSWORD] Error: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception(f"[FORGOT PASSWORD] Error: {str(e)}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to process password reset request"
@@ -267,15 +272,15 @@ async def reset_password(
                 detail=f"Password is too weak: {', '.join(issues)}"
             )
         
-        from app.core.security import hash_password, verify_password
+        from app.core.security import hash_password_async, verify_password_async
         old_hashed_password = user.get("hashed_password")
-        if old_hashed_password and verify_password(request.new_password, old_hashed_password):
+        if old_hashed_password and await verify_password_async(request.new_password, old_hashed_password):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="New password cannot be the same as your previous password"
             )
         
-        hashed_password = hash_password(request.new_password)
+        hashed_password = await hash_password_async(request.new_password)
         
         logger.info(f"[RESET PASSWORD] Resetting password for user: {user.get('email')}")
         result = await user_service.user_repo.collection.update_one(
@@ -286,13 +291,15 @@ async def reset_password(
             }
         )
         logger.info(f"[RESET PASSWORD] Password updated - matched: {result.matched_count}, modified: {result.modified_count}")
+        invalidate_principal(str(user["_id"]))
+        await get_revocation_list().revoke_user(str(user["_id"]))
         
         return {"message": "Password has been reset successfully"}
     
     except HTTPException:
         raise
     except Exception as e:
-        print(f"Error in reset_password: {str(e)}")
+        logger.exception(f"Error in reset_password: {str(e)}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to reset password"
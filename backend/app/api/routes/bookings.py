@@ -3,6 +3,9 @@ from typing import List
 from app.services.booking_service import BookingService
 from app.api.dependencies import get_booking_service, get_current_user, get_vendor_stats_service
 from app.models.booking import BookingCreate, BookingCreateRequest, BookingUpdate, BookingResponse
+import logging
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
@@ -22,7 +25,10 @@ async def create_booking(
     
     from app.models.booking import BookingCreate
     booking_create = BookingCreate(**booking_dict)
-    booking = await booking_service.create_booking(booking_create, stats_service)
+    try:
+        booking = await booking_service.create_booking(booking_create, stats_service)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     
     if "_id" in booking:
         booking["id"] = str(booking["_id"])
@@ -95,9 +101,7 @@ async def get_my_bookings(
             
             formatted_bookings.append(formatted_booking)
         except Exception as e:
-            import traceback
-            print(f"Error formatting booking {booking.get('_id', 'unknown')}: {e}")
-            print(traceback.format_exc())
+            logger.exception(f"Error formatting booking {booking.get('_id', 'unknown')}: {e}")
             continue
     
     return formatted_bookings
@@ -120,9 +124,13 @@ async def update_booking(
     booking_id: str,
     booking_data: BookingUpdate,
     current_user: dict = Depends(get_current_user),
-    booking_service: BookingService = Depends(get_booking_service)
+    booking_service: BookingService = Depends(get_booking_service),
+    stats_service = Depends(get_vendor_stats_service)
 ):
-    updated_booking = await booking_service.update_booking(booking_id, booking_data)
+    try:
+        updated_booking = await booking_service.update_booking(booking_id, booking_data, stats_service)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     if not updated_booking:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Booking not found")
     return updated_booking
@@ -132,10 +140,8 @@ async def update_booking(
 async def cancel_booking(
     booking_id: str,
     current_user: dict = Depends(get_current_user),
-    booking_service: BookingService = Depends(get_booking_service)
+    booking_service: BookingService = Depends(get_booking_service),
+    stats_service = Depends(get_vendor_stats_service)
 ):
-    cancelled_booking = await booking_service.cancel_booking(booking_id)
-    if not cancelled_booking:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Booking not found")
-    return cancelled_booking
+    return await booking_service.cancel_booking(booking_id, str(current_user["_id"]), stats_service)
 
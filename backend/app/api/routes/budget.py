@@ -0,0 +1,24 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+from app.services.budget_service import BudgetService
+from app.api.dependencies import get_budget_service
+from app.models.budget import BudgetOptimizeRequest, BudgetOptimizeResponse
+
+router = APIRouter()
+
+
+@router.post("/optimize", response_model=BudgetOptimizeResponse)
+async def optimize_budget(
+    request: BudgetOptimizeRequest,
+    budget_service: BudgetService = Depends(get_budget_service)
+):
+    try:
+        return await budget_service.optimize(
+            total_budget=request.total_budget,
+            categories=request.categories,
+            guest_count=request.guest_count,
+            preferences=request.preferences,
+            min_rating=request.min_rating,
+            top_n=request.top_n
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
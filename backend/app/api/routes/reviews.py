@@ -3,6 +3,9 @@ from typing import List
 from app.services.review_service import ReviewService
 from app.api.dependencies import get_review_service, get_current_user, get_vendor_stats_service, get_vendor_service
 from app.models.review import ReviewCreate, ReviewResponse
+import logging
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
@@ -52,35 +55,36 @@ async def get_my_vendor_reviews(
         if not vendor_id:
             raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Invalid vendor ID")
         
-        print(f"[DEBUG GET REVIEWS] Vendor found - _id: {vendor.get('_id')}, id: {vendor.get('id')}, vendor_id: {vendor_id}")
+        logger.debug(f"Vendor found - _id: {vendor.get('_id')}, id: {vendor.get('id')}, vendor_id: {vendor_id}")
         
-        all_reviews_debug = await review_service.review_repo.find_many({}, 0, 1000)
-        print(f"[DEBUG GET REVIEWS] Total reviews in database: {len(all_reviews_debug)}")
-        for r in all_reviews_debug[:10]:
-            vendor_id_in_review = r.get('vendor_id')
-            vendor_id_str = str(vendor_id_in_review) if vendor_id_in_review else None
-            print(f"[DEBUG GET REVIEWS] Review ID: {r.get('_id')}, vendor_id: {vendor_id_in_review} (type: {type(vendor_id_in_review)}, as string: {vendor_id_str})")
-            print(f"[DEBUG GET REVIEWS] Comparing: review vendor_id '{vendor_id_str}' == query vendor_id '{vendor_id}': {vendor_id_str == vendor_id}")
+        if logger.isEnabledFor(logging.DEBUG):
+            all_reviews_debug = await review_service.review_repo.find_many({}, 0, 1000)
+            logger.debug(f"Total reviews in database: {len(all_reviews_debug)}")
+            for r in all_reviews_debug[:10]:
+                vendor_id_in_review = r.get('vendor_id')
+                vendor_id_str = str(vendor_id_in_review) if vendor_id_in_review else None
+                logger.debug(f"Review ID: {r.get('_id')}, vendor_id: {vendor_id_in_review} (type: {type(vendor_id_in_review)}, as string: {vendor_id_str})")
+                logger.debug(f"Comparing: review vendor_id '{vendor_id_str}' == query vendor_id '{vendor_id}': {vendor_id_str == vendor_id}")
         
-        print(f"[DEBUG GET REVIEWS] Fetching reviews for vendor_id: {vendor_id}")
+        logger.debug(f"Fetching reviews for vendor_id: {vendor_id}")
         reviews = await review_service.get_reviews_by_vendor(vendor_id, skip, limit)
-        print(f"[DEBUG GET REVIEWS] Found {len(reviews)} reviews for vendor_id {vendor_id}")
+        logger.debug(f"Found {len(reviews)} reviews for vendor_id {vendor_id}")
         
         if len(reviews) == 0:
             from bson import ObjectId
             try:
                 vendor_obj_id = ObjectId(vendor_id)
-                print(f"[DEBUG GET REVIEWS] Trying direct query with ObjectId: {vendor_obj_id}")
+                logger.debug(f"Trying direct query with ObjectId: {vendor_obj_id}")
                 cursor = review_service.review_repo.collection.find({"vendor_id": vendor_obj_id})
                 direct_reviews = await cursor.to_list(length=100)
-                print(f"[DEBUG GET REVIEWS] Direct query found {len(direct_reviews)} reviews")
+                logger.debug(f"Direct query found {len(direct_reviews)} reviews")
                 if direct_reviews:
                     for dr in direct_reviews:
                         if "_id" in dr:
                             dr["_id"] = str(dr["_id"])
                     reviews = direct_reviews
             except Exception as e:
-                print(f"[DEBUG GET REVIEWS] Direct ObjectId query failed: {e}")
+                logger.debug(f"Direct ObjectId query failed: {e}")
         
         formatted_reviews = []
         for review in reviews:
@@ -102,14 +106,12 @@ async def get_my_vendor_reviews(
             
             formatted_reviews.append(formatted_review)
         
-        print(f"[DEBUG] Returning {len(formatted_reviews)} formatted reviews")
+        logger.debug(f"Returning {len(formatted_reviews)} formatted reviews")
         return formatted_reviews
     except HTTPException:
         raise
     except Exception as e:
-        print(f"[ERROR] Error fetching vendor reviews: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception(f"Error fetching vendor reviews: {e}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to fetch reviews: {str(e)}"
@@ -157,17 +159,17 @@ async def create_review(
         if "vendor_id" in review_dict:
             review_dict["vendor_id"] = str(review_dict["vendor_id"])
         
-        print(f"[DEBUG CREATE REVIEW] Original vendor_id: {original_vendor_id}, Converted: {review_dict['vendor_id']}")
+        logger.debug(f"Original vendor_id: {original_vendor_id}, Converted: {review_dict['vendor_id']}")
         
         if "booking_id" in review_dict and review_dict["booking_id"]:
             review_dict["booking_id"] = str(review_dict["booking_id"])
-            print(f"[DEBUG CREATE REVIEW] Booking ID: {review_dict['booking_id']}")
+            logger.debug(f"Booking ID: {review_dict['booking_id']}")
         
         from app.models.review import ReviewBase
         review_create = ReviewBase(**review_dict)
         review = await review_service.create_review(review_create, stats_service)
         
-        print(f"[DEBUG CREATE REVIEW] Review created with vendor_id: {review.get('vendor_id')} (type: {type(review.get('vendor_id'))})")
+        logger.debug(f"Review created with vendor_id: {review.get('vendor_id')} (type: {type(review.get('vendor_id'))})")
         
         if "_id" in review:
             review["id"] = str(review["_id"])
@@ -184,9 +186,7 @@ async def create_review(
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
-        print(f"[ERROR] Error creating review: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception(f"Error creating review: {e}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to create review: {str(e)}"
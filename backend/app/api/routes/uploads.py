@@ -3,6 +3,9 @@ from pathlib import Path
 from app.api.dependencies import get_current_user, get_current_vendor, get_current_admin
 from app.services.cloudinary_service import CloudinaryService
 import uuid
+import logging
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
@@ -192,11 +195,8 @@ async def upload_vendor_image_admin(
     except HTTPException:
         raise
     except Exception as e:
-        import traceback
         error_msg = str(e)
-        traceback_str = traceback.format_exc()
-        print(f"Error uploading admin vendor image: {error_msg}")
-        print(traceback_str)
+        logger.exception(f"Error uploading admin vendor image: {error_msg}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to upload image: {error_msg}"
@@ -1,15 +1,34 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status, Query
+from typing import List
 from app.services.user_service import UserService
-from app.api.dependencies import get_user_service, get_current_user
-from app.models.user import UserUpdate, UserResponse
+from app.services.recommendation_service import RecommendationService
+from app.api.dependencies import get_user_service, get_current_user, get_recommendation_service
+from app.models.user import UserUpdate, UserResponse, PasswordUpdateResponse
+from app.core.security import create_access_token
+from app.models.recommendation import RecommendedVendor
 from app.core.constants import MIN_PASSWORD_LENGTH, ERROR_USER_NOT_FOUND
 
 router = APIRouter()
 
 
 @router.get("/me", response_model=UserResponse)
-async def get_current_user_profile(current_user: dict = Depends(get_current_user)):
-    return current_user
+async def get_current_user_profile(
+    current_user: dict = Depends(get_current_user),
+    user_service: UserService = Depends(get_user_service)
+):
+    user = await user_service.get_user_by_id(current_user["_id"])
+    if not user:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=ERROR_USER_NOT_FOUND)
+    return user
+
+
+@router.get("/me/recommendations", response_model=List[RecommendedVendor])
+async def get_my_recommendations(
+    limit: int = Query(12, ge=1, le=50),
+    current_user: dict = Depends(get_current_user),
+    recommendation_service: RecommendationService = Depends(get_recommendation_service)
+):
+    return await recommendation_service.get_user_recommendations(str(current_user["_id"]), limit)
 
 
 @router.put("/me", response_model=UserResponse)
@@ -24,7 +43,7 @@ async def update_current_user(
     return updated_user
 
 
-@router.put("/me/password", response_model=UserResponse)
+@router.put("/me/password", response_model=PasswordUpdateResponse)
 async def update_password(
     password_data: dict,
     current_user: dict = Depends(get_current_user),
@@ -65,5 +84,7 @@ async def update_password(
         del updated_user["_id"]
     
     updated_user.pop("hashed_password", None)
+    # Changing the password revokes every existing token, including this one, so hand back a new one
+    updated_user["access_token"] = create_access_token(data={"sub": updated_user["id"], "role": current_user["role"]})
     
     return updated_user
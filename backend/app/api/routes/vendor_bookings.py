@@ -4,6 +4,9 @@ from app.services.booking_service import BookingService
 from app.services.vendor_service import VendorService
 from app.api.dependencies import get_booking_service, get_current_vendor, get_vendor_service, get_vendor_stats_service
 from app.models.booking import BookingResponse
+import logging
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
@@ -34,14 +37,13 @@ async def get_vendor_bookings(
                 obj_id = ObjectId(user_id)
                 vendor = await vendor_service.vendor_repo.find_one({"user_id": obj_id})
             except Exception as e:
-                print(f"Error converting user_id to ObjectId: {e}")
+                logger.debug(f"Error converting user_id to ObjectId: {e}")
         
         if not vendor:
             vendor = await vendor_service.vendor_repo.find_one({"user_id": str(user_id)})
         
         if not vendor:
-            print(f"Vendor lookup failed for user_id: {user_id} (type: {type(user_id)})")
-            print(f"Current user: {current_user}")
+            logger.warning(f"Vendor lookup failed for user_id: {user_id} (type: {type(user_id)})")
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND, 
                 detail=f"Vendor profile not found. Please ensure you have registered as a vendor."
@@ -57,9 +59,7 @@ async def get_vendor_bookings(
     except HTTPException:
         raise
     except Exception as e:
-        import traceback
-        print(f"Error in get_vendor_bookings: {e}")
-        print(traceback.format_exc())
+        logger.exception(f"Error in get_vendor_bookings: {e}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to retrieve bookings: {str(e)}"
@@ -113,9 +113,7 @@ async def get_vendor_bookings(
             
             formatted_bookings.append(formatted_booking)
         except Exception as e:
-            import traceback
-            print(f"Error formatting booking {booking.get('_id', 'unknown')}: {e}")
-            print(traceback.format_exc())
+            logger.exception(f"Error formatting booking {booking.get('_id', 'unknown')}: {e}")
             continue
     
     return formatted_bookings
@@ -130,11 +128,6 @@ async def approve_booking(
     stats_service = Depends(get_vendor_stats_service)
 ):
     try:
-        booking = await booking_service.get_booking_by_id(booking_id)
-        if not booking:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Booking not found")
-        
-        from bson import ObjectId
         user_id = current_user.get("_id") or current_user.get("id")
         if not user_id:
             raise HTTPException(
@@ -148,14 +141,7 @@ async def approve_booking(
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Vendor profile not found")
         
         vendor_id = str(vendor["_id"])
-        booking_vendor_id = str(booking.get("vendor_id"))
-        
-        if booking_vendor_id != vendor_id:
-            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="You can only approve your own bookings")
-        
-        approved_booking = await booking_service.approve_booking(booking_id, stats_service)
-        if not approved_booking:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Booking not found")
+        approved_booking = await booking_service.approve_booking(booking_id, vendor_id, stats_service)
         
         if "_id" in approved_booking:
             approved_booking["id"] = str(approved_booking["_id"])
@@ -196,9 +182,7 @@ async def approve_booking(
     except HTTPException:
         raise
     except Exception as e:
-        import traceback
-        print(f"[ERROR] Error approving booking {booking_id}: {e}")
-        print(traceback.format_exc())
+        logger.exception(f"Error approving booking {booking_id}: {e}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to approve booking: {str(e)}"
@@ -214,11 +198,6 @@ async def reject_booking(
     stats_service = Depends(get_vendor_stats_service)
 ):
     try:
-        booking = await booking_service.get_booking_by_id(booking_id)
-        if not booking:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Booking not found")
-        
-        from bson import ObjectId
         user_id = current_user.get("_id") or current_user.get("id")
         if not user_id:
             raise HTTPException(
@@ -232,14 +211,7 @@ async def reject_booking(
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Vendor profile not found")
         
         vendor_id = str(vendor["_id"])
-        booking_vendor_id = str(booking.get("vendor_id"))
-        
-        if booking_vendor_id != vendor_id:
-            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="You can only reject your own bookings")
-        
-        rejected_booking = await booking_service.reject_booking(booking_id, stats_service)
-        if not rejected_booking:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Booking not found")
+        rejected_booking = await booking_service.reject_booking(booking_id, vendor_id, stats_service)
         
         if "_id" in rejected_booking:
             rejected_booking["id"] = str(rejected_booking["_id"])
@@ -280,9 +252,7 @@ async def reject_booking(
     except HTTPException:
         raise
     except Exception as e:
-        import traceback
-        print(f"[ERROR] Error rejecting booking {booking_id}: {e}")
-        print(traceback.format_exc())
+        logger.exception(f"Error rejecting booking {booking_id}: {e}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to reject booking: {str(e)}"
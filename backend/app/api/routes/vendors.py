@@ -1,8 +1,17 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query, Body
 from typing import List
+from datetime import date
 from app.services.vendor_service import VendorService
-from app.api.dependencies import get_vendor_service, get_current_vendor
+from app.services.vendor_stats_service import LEADERBOARD_SIZE
+from app.services.recommendation_service import RecommendationService
+from app.services.availability_service import AvailabilityService
+from app.api.dependencies import get_vendor_service, get_current_vendor, get_recommendation_service, get_availability_service
 from app.models.vendor import VendorCreate, VendorUpdate, VendorResponse
+from app.models.recommendation import RecommendedVendor
+from app.models.availability import AvailabilityMonthResponse, AvailabilityBlockRequest
+import logging
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
@@ -18,9 +27,7 @@ async def register_vendor(
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
-        print(f"[ERROR] Error registering vendor: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception(f"Error registering vendor: {e}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to register vendor: {str(e)}"
@@ -30,22 +37,39 @@ async def register_vendor(
 @router.get("/", response_model=List[VendorResponse])
 async def get_vendors(
     category: str = Query(None),
+    near: str = Query(None, description="City, area or 'lat,lng' to search around"),
+    radius_km: float = Query(25, gt=0, le=1000),
+    min_price: float = Query(None, ge=0),
+    max_price: float = Query(None, ge=0),
+    sort: str = Query(None, pattern="^(price_asc|price_desc|top_rated)$"),
+    available_on: date = Query(None, description="Only vendors with free capacity on this date"),
     skip: int = 0,
     limit: int = Query(200, ge=1, le=1000),
     vendor_service: VendorService = Depends(get_vendor_service)
 ):
     try:
-        if category:
+        if near:
+            try:
+                vendors = await vendor_service.search_vendors_near(
+                    near, radius_km, category, min_price, max_price, sort, skip, limit, available_on
+                )
+            except ValueError as e:
+                raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+        elif sort == "top_rated" and category and min_price is None and max_price is None and not available_on and skip + limit <= LEADERBOARD_SIZE:
+            vendors = await vendor_service.get_top_vendors(category, skip, limit)
+        elif min_price is not None or max_price is not None or sort or available_on:
+            vendors = await vendor_service.search_vendors(category, min_price, max_price, sort, skip, limit, available_on)
+        elif category:
             vendors = await vendor_service.get_vendors_by_category(category, skip, limit)
         else:
             query = {"is_approved": True, "is_active": True}
-            print(f"[DEBUG] Fetching vendors with query: {query}")
+            logger.debug(f"Fetching vendors with query: {query}")
             vendors = await vendor_service.vendor_repo.find_many(query, skip, limit)
-            print(f"[DEBUG] Found {len(vendors)} approved vendors")
+            logger.debug(f"Found {len(vendors)} approved vendors")
             
             if vendors and len(vendors) > 0:
                 first_vendor = vendors[0]
-                print(f"[DEBUG] First vendor: {first_vendor.get('business_name')}, is_approved: {first_vendor.get('is_approved')}, is_active: {first_vendor.get('is_active')}")
+                logger.debug(f"First vendor: {first_vendor.get('business_name')}, is_approved: {first_vendor.get('is_approved')}, is_active: {first_vendor.get('is_active')}")
         
         formatted_vendors = []
         for vendor in vendors:
@@ -76,12 +100,12 @@ async def get_vendors(
             
             formatted_vendors.append(formatted_vendor)
         
-        print(f"[DEBUG] Returning {len(formatted_vendors)} formatted vendors")
+        logger.debug(f"Returning {len(formatted_vendors)} formatted vendors")
         return formatted_vendors
+    except HTTPException:
+        raise
     except Exception as e:
-        print(f"[ERROR] Error fetching vendors: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception(f"Error fetching vendors: {e}")
         raise
 
 
@@ -177,6 +201,46 @@ async def get_vendor(
     return vendor
 
 
+@router.put("/me/availability", response_model=AvailabilityMonthResponse)
+async def update_my_availability(
+    availability_data: AvailabilityBlockRequest,
+    current_user: dict = Depends(get_current_vendor),
+    vendor_service: VendorService = Depends(get_vendor_service),
+    availability_service: AvailabilityService = Depends(get_availability_service)
+):
+    vendor = await vendor_service.vendor_repo.get_by_user_id(current_user["_id"])
+    if not vendor:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Vendor profile not found")
+    
+    try:
+        return await availability_service.set_blocked_days(
+            str(vendor["_id"]), availability_data.month, availability_data.blocked_days
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
+@router.get("/{vendor_id}/availability", response_model=AvailabilityMonthResponse)
+async def get_vendor_availability(
+    vendor_id: str,
+    month: str = Query(..., pattern=r"^\d{4}-\d{2}$", description="Month in YYYY-MM format"),
+    availability_service: AvailabilityService = Depends(get_availability_service)
+):
+    try:
+        return await availability_service.get_month(vendor_id, month)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
+@router.get("/{vendor_id}/similar", response_model=List[RecommendedVendor])
+async def get_similar_vendors(
+    vendor_id: str,
+    limit: int = Query(12, ge=1, le=50),
+    recommendation_service: RecommendationService = Depends(get_recommendation_service)
+):
+    return await recommendation_service.get_similar_vendors(vendor_id, limit)
+
+
 @router.patch("/me/image", response_model=VendorResponse)
 async def update_vendor_image(
     image_url: str = Body(..., embed=True),
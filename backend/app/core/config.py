@@ -10,9 +10,44 @@ class Settings(BaseSettings):
     SECRET_KEY: str = "your-secret-key-change-in-production"
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 120
+    JWT_BACKEND: str = "jose"
+    JWT_PRIVATE_KEY_FILE: str = ""
+    JWT_PUBLIC_KEY_FILE: str = ""
     
     BACKEND_CORS_ORIGINS: list = ["http://localhost:3000"]
     
+    RATE_LIMIT_ENABLED: bool = True
+    RATE_LIMIT_BACKEND: str = "memory"
+    RATE_LIMIT_MAX_KEYS: int = 100000
+    RATE_LIMIT_TRUST_FORWARDED: bool = False
+    
+    METRICS_SHARED_DIR: str = ""
+    
+    OUTBOX_REQUIRE_TRANSACTIONS: bool = False
+    
+    LOG_LEVEL: str = "INFO"
+    LOG_FORMAT: str = "json"
+    LOG_LEVELS: dict = {"pymongo": "WARNING"}
+    LOG_DEBUG_SAMPLE_RATES: dict = {
+        "app.core.patterns.singleton": 0.001,
+        "app.api.routes.vendors": 0.01,
+        "app.api.routes.reviews": 0.01
+    }
+    
+    PROFILING_SECRET: str = ""
+    PROFILING_DIR: str = "profiles"
+    PROFILING_REQUEST_INTERVAL_MS: int = 1
+    PROFILING_SAMPLE_INTERVAL_MS: int = 0
+    PROFILING_WINDOW_SECONDS: int = 600
+    PROFILING_SLICE_SECONDS: int = 60
+    PROFILING_MAX_STACKS: int = 5000
+    PROFILING_MAX_FILES: int = 50
+    
+    MEMORY_PROFILING_START: bool = False
+    MEMORY_PROFILING_FRAMES: int = 1
+    MEMORY_PROFILING_MAX_SNAPSHOTS: int = 4
+    MEMORY_ROUTE_SAMPLE_RATE: float = 0.05
+    
     CLOUDINARY_CLOUD_NAME: str = ""
     CLOUDINARY_API_KEY: str = ""
     CLOUDINARY_API_SECRET: str = ""
@@ -23,6 +58,8 @@ class Settings(BaseSettings):
     SMTP_PASSWORD: str = ""
     SMTP_FROM_EMAIL: str = ""
     SMTP_FROM_NAME: str = "PakWedding Portal"
+    SMTP_START_TLS: bool = True
+    SMTP_POOL_SIZE: int = 4
     FRONTEND_URL: str = "http://localhost:3000"
     
     class Config:
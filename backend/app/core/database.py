@@ -1,5 +1,9 @@
+import logging
 from motor.motor_asyncio import AsyncIOMotorClient
 from app.core.config import settings
+from app.core.request_metrics import command_timing_listener
+
+logger = logging.getLogger(__name__)
 
 class Database:
     
@@ -7,19 +11,19 @@ class Database:
     
     @classmethod
     async def connect_db(cls):
-        cls.client = AsyncIOMotorClient(settings.DATABASE_URL)
+        cls.client = AsyncIOMotorClient(settings.DATABASE_URL, event_listeners=[command_timing_listener])
         try:
             await cls.client.admin.command('ping')
-            print(f"Connected to MongoDB successfully")
+            logger.info("Connected to MongoDB successfully")
         except Exception as e:
-            print(f"MongoDB connection error: {e}")
+            logger.error(f"MongoDB connection error: {e}")
             raise
     
     @classmethod
     async def close_db(cls):
         if cls.client:
             cls.client.close()
-            print("MongoDB connection closed")
+            logger.info("MongoDB connection closed")
     
     @classmethod
     def get_database(cls):
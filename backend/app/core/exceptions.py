@@ -54,6 +54,26 @@ class BadRequestException(BaseAPIException):
         )
 
 
+class ServiceUnavailableException(BaseAPIException):
+    def __init__(self, detail: str = "Service temporarily unavailable"):
+        super().__init__(
+            detail=detail,
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE
+        )
+
+
+class AdminApprovalPendingException(ForbiddenException):
+    def __init__(self):
+        super().__init__(
+            detail="Your admin registration is pending approval. Please wait for an existing admin to approve your request."
+        )
+
+
+class SlotUnavailableException(ConflictException):
+    def __init__(self):
+        super().__init__(detail="Vendor is fully booked on the selected date")
+
+
 class UserNotFoundException(NotFoundException):
     def __init__(self):
         super().__init__(resource="User")
@@ -0,0 +1,102 @@
+PAKISTAN_CITIES = [
+    {"name": "Karachi", "province": "Sindh", "lat": 24.8607, "lng": 67.0011, "aliases": ["khi"]},
+    {"name": "Lahore", "province": "Punjab", "lat": 31.5204, "lng": 74.3587, "aliases": ["lhr"]},
+    {"name": "Islamabad", "province": "Islamabad Capital Territory", "lat": 33.6844, "lng": 73.0479, "aliases": ["isb", "isl"]},
+    {"name": "Rawalpindi", "province": "Punjab", "lat": 33.5651, "lng": 73.0169, "aliases": ["pindi", "rwp"]},
+    {"name": "Faisalabad", "province": "Punjab", "lat": 31.4504, "lng": 73.1350, "aliases": ["lyallpur", "fsd"]},
+    {"name": "Multan", "province": "Punjab", "lat": 30.1575, "lng": 71.5249, "aliases": []},
+    {"name": "Peshawar", "province": "Khyber Pakhtunkhwa", "lat": 34.0151, "lng": 71.5249, "aliases": ["psh"]},
+    {"name": "Quetta", "province": "Balochistan", "lat": 30.1798, "lng": 66.9750, "aliases": []},
+    {"name": "Hyderabad", "province": "Sindh", "lat": 25.3960, "lng": 68.3578, "aliases": []},
+    {"name": "Gujranwala", "province": "Punjab", "lat": 32.1877, "lng": 74.1945, "aliases": []},
+    {"name": "Sialkot", "province": "Punjab", "lat": 32.4945, "lng": 74.5229, "aliases": []},
+    {"name": "Sargodha", "province": "Punjab", "lat": 32.0740, "lng": 72.6861, "aliases": []},
+    {"name": "Bahawalpur", "province": "Punjab", "lat": 29.3956, "lng": 71.6836, "aliases": []},
+    {"name": "Sukkur", "province": "Sindh", "lat": 27.7052, "lng": 68.8574, "aliases": []},
+    {"name": "Larkana", "province": "Sindh", "lat": 27.5570, "lng": 68.2264, "aliases": []},
+    {"name": "Nawabshah", "province": "Sindh", "lat": 26.2442, "lng": 68.4100, "aliases": ["shaheed benazirabad"]},
+    {"name": "Abbottabad", "province": "Khyber Pakhtunkhwa", "lat": 34.1688, "lng": 73.2215, "aliases": ["abbotabad"]},
+    {"name": "Mardan", "province": "Khyber Pakhtunkhwa", "lat": 34.1986, "lng": 72.0404, "aliases": []},
+    {"name": "Mingora", "province": "Khyber Pakhtunkhwa", "lat": 34.7717, "lng": 72.3602, "aliases": ["swat"]},
+    {"name": "Kohat", "province": "Khyber Pakhtunkhwa", "lat": 33.5869, "lng": 71.4429, "aliases": []},
+    {"name": "Dera Ismail Khan", "province": "Khyber Pakhtunkhwa", "lat": 31.8314, "lng": 70.9019, "aliases": ["di khan", "d i khan"]},
+    {"name": "Mansehra", "province": "Khyber Pakhtunkhwa", "lat": 34.3300, "lng": 73.1968, "aliases": []},
+    {"name": "Nowshera", "province": "Khyber Pakhtunkhwa", "lat": 34.0153, "lng": 71.9747, "aliases": []},
+    {"name": "Gujrat", "province": "Punjab", "lat": 32.5739, "lng": 74.0776, "aliases": []},
+    {"name": "Sahiwal", "province": "Punjab", "lat": 30.6682, "lng": 73.1114, "aliases": []},
+    {"name": "Sheikhupura", "province": "Punjab", "lat": 31.7167, "lng": 73.9850, "aliases": []},
+    {"name": "Rahim Yar Khan", "province": "Punjab", "lat": 28.4202, "lng": 70.2952, "aliases": ["ryk"]},
+    {"name": "Jhelum", "province": "Punjab", "lat": 32.9405, "lng": 73.7276, "aliases": []},
+    {"name": "Dera Ghazi Khan", "province": "Punjab", "lat": 30.0561, "lng": 70.6348, "aliases": ["dg khan", "d g khan"]},
+    {"name": "Okara", "province": "Punjab", "lat": 30.8138, "lng": 73.4534, "aliases": []},
+    {"name": "Kasur", "province": "Punjab", "lat": 31.1187, "lng": 74.4507, "aliases": []},
+    {"name": "Chiniot", "province": "Punjab", "lat": 31.7200, "lng": 72.9789, "aliases": []},
+    {"name": "Wah Cantt", "province": "Punjab", "lat": 33.7715, "lng": 72.7510, "aliases": ["wah cantonment"]},
+    {"name": "Taxila", "province": "Punjab", "lat": 33.7463, "lng": 72.8397, "aliases": []},
+    {"name": "Murree", "province": "Punjab", "lat": 33.9070, "lng": 73.3943, "aliases": []},
+    {"name": "Gwadar", "province": "Balochistan", "lat": 25.1216, "lng": 62.3254, "aliases": []},
+    {"name": "Mirpur", "province": "Azad Kashmir", "lat": 33.1478, "lng": 73.7510, "aliases": []},
+    {"name": "Muzaffarabad", "province": "Azad Kashmir", "lat": 34.3700, "lng": 73.4711, "aliases": []},
+    {"name": "Gilgit", "province": "Gilgit-Baltistan", "lat": 35.9208, "lng": 74.3144, "aliases": []},
+    {"name": "Skardu", "province": "Gilgit-Baltistan", "lat": 35.2971, "lng": 75.6333, "aliases": []},
+]
+
+PAKISTAN_AREAS = [
+    {"name": "DHA Lahore", "city": "Lahore", "lat": 31.4735, "lng": 74.4066, "aliases": ["dha", "defence", "defense"]},
+    {"name": "Gulberg", "city": "Lahore", "lat": 31.5102, "lng": 74.3441, "aliases": ["gulberg"]},
+    {"name": "Johar Town", "city": "Lahore", "lat": 31.4697, "lng": 74.2728, "aliases": ["johar town"]},
+    {"name": "Model Town", "city": "Lahore", "lat": 31.4834, "lng": 74.3260, "aliases": ["model town"]},
+    {"name": "Garden Town", "city": "Lahore", "lat": 31.5021, "lng": 74.3219, "aliases": ["garden town"]},
+    {"name": "Faisal Town", "city": "Lahore", "lat": 31.4790, "lng": 74.3040, "aliases": ["faisal town"]},
+    {"name": "Allama Iqbal Town", "city": "Lahore", "lat": 31.5108, "lng": 74.2867, "aliases": ["iqbal town", "allama iqbal town"]},
+    {"name": "Wapda Town", "city": "Lahore", "lat": 31.4330, "lng": 74.2660, "aliases": ["wapda town"]},
+    {"name": "Bahria Town Lahore", "city": "Lahore", "lat": 31.3695, "lng": 74.1768, "aliases": ["bahria town", "bahria"]},
+    {"name": "Lahore Cantt", "city": "Lahore", "lat": 31.5132, "lng": 74.3851, "aliases": ["cantt", "cantonment"]},
+    {"name": "Shadman", "city": "Lahore", "lat": 31.5363, "lng": 74.3294, "aliases": ["shadman"]},
+    {"name": "Township", "city": "Lahore", "lat": 31.4500, "lng": 74.3120, "aliases": ["township"]},
+    {"name": "Valencia", "city": "Lahore", "lat": 31.4180, "lng": 74.2540, "aliases": ["valencia"]},
+    {"name": "Raiwind Road", "city": "Lahore", "lat": 31.4000, "lng": 74.2200, "aliases": ["raiwind road", "raiwind"]},
+    {"name": "Mall Road", "city": "Lahore", "lat": 31.5580, "lng": 74.3290, "aliases": ["mall road"]},
+    {"name": "DHA Karachi", "city": "Karachi", "lat": 24.8143, "lng": 67.0684, "aliases": ["dha", "defence", "defense"]},
+    {"name": "Clifton", "city": "Karachi", "lat": 24.8138, "lng": 67.0300, "aliases": ["clifton"]},
+    {"name": "Gulshan-e-Iqbal", "city": "Karachi", "lat": 24.9200, "lng": 67.0930, "aliases": ["gulshan e iqbal", "gulshan iqbal", "gulshan"]},
+    {"name": "Gulistan-e-Jauhar", "city": "Karachi", "lat": 24.9170, "lng": 67.1240, "aliases": ["gulistan e jauhar", "gulistan e johar", "jauhar", "johar"]},
+    {"name": "North Nazimabad", "city": "Karachi", "lat": 24.9420, "lng": 67.0350, "aliases": ["north nazimabad"]},
+    {"name": "Nazimabad", "city": "Karachi", "lat": 24.9140, "lng": 67.0300, "aliases": ["nazimabad"]},
+    {"name": "PECHS", "city": "Karachi", "lat": 24.8700, "lng": 67.0600, "aliases": ["pechs"]},
+    {"name": "Tariq Road", "city": "Karachi", "lat": 24.8730, "lng": 67.0640, "aliases": ["tariq road"]},
+    {"name": "Shahrah-e-Faisal", "city": "Karachi", "lat": 24.8750, "lng": 67.1000, "aliases": ["shahrah e faisal", "shahra e faisal"]},
+    {"name": "Federal B Area", "city": "Karachi", "lat": 24.9400, "lng": 67.0700, "aliases": ["federal b area", "fb area"]},
+    {"name": "Saddar Karachi", "city": "Karachi", "lat": 24.8560, "lng": 67.0300, "aliases": ["saddar"]},
+    {"name": "Korangi", "city": "Karachi", "lat": 24.8300, "lng": 67.1300, "aliases": ["korangi"]},
+    {"name": "Malir", "city": "Karachi", "lat": 24.8940, "lng": 67.2010, "aliases": ["malir"]},
+    {"name": "Bahria Town Karachi", "city": "Karachi", "lat": 25.0100, "lng": 67.3100, "aliases": ["bahria town", "bahria"]},
+    {"name": "Blue Area", "city": "Islamabad", "lat": 33.7100, "lng": 73.0600, "aliases": ["blue area"]},
+    {"name": "F-6", "city": "Islamabad", "lat": 33.7295, "lng": 73.0747, "aliases": ["f6"]},
+    {"name": "F-7", "city": "Islamabad", "lat": 33.7215, "lng": 73.0550, "aliases": ["f7"]},
+    {"name": "F-8", "city": "Islamabad", "lat": 33.7100, "lng": 73.0380, "aliases": ["f8"]},
+    {"name": "F-10", "city": "Islamabad", "lat": 33.6950, "lng": 73.0120, "aliases": ["f10"]},
+    {"name": "F-11", "city": "Islamabad", "lat": 33.6840, "lng": 72.9890, "aliases": ["f11"]},
+    {"name": "E-7", "city": "Islamabad", "lat": 33.7290, "lng": 73.0450, "aliases": ["e7"]},
+    {"name": "E-11", "city": "Islamabad", "lat": 33.6990, "lng": 72.9760, "aliases": ["e11"]},
+    {"name": "G-9", "city": "Islamabad", "lat": 33.6880, "lng": 73.0300, "aliases": ["g9"]},
+    {"name": "G-11", "city": "Islamabad", "lat": 33.6700, "lng": 73.0000, "aliases": ["g11"]},
+    {"name": "G-13", "city": "Islamabad", "lat": 33.6500, "lng": 72.9650, "aliases": ["g13"]},
+    {"name": "I-8", "city": "Islamabad", "lat": 33.6680, "lng": 73.0750, "aliases": ["i8"]},
+    {"name": "Bani Gala", "city": "Islamabad", "lat": 33.7200, "lng": 73.1500, "aliases": ["bani gala", "banigala"]},
+    {"name": "DHA Islamabad", "city": "Islamabad", "lat": 33.5300, "lng": 73.1500, "aliases": ["dha", "defence", "defense"]},
+    {"name": "Bahria Town Islamabad", "city": "Islamabad", "lat": 33.5200, "lng": 73.1000, "aliases": ["bahria town", "bahria"]},
+    {"name": "Saddar Rawalpindi", "city": "Rawalpindi", "lat": 33.5960, "lng": 73.0530, "aliases": ["saddar"]},
+    {"name": "Satellite Town", "city": "Rawalpindi", "lat": 33.6350, "lng": 73.0700, "aliases": ["satellite town"]},
+    {"name": "Chaklala", "city": "Rawalpindi", "lat": 33.5900, "lng": 73.0800, "aliases": ["chaklala"]},
+    {"name": "Bahria Town Rawalpindi", "city": "Rawalpindi", "lat": 33.5200, "lng": 73.1000, "aliases": ["bahria town", "bahria"]},
+    {"name": "D Ground", "city": "Faisalabad", "lat": 31.4180, "lng": 73.0790, "aliases": ["d ground"]},
+    {"name": "Madina Town", "city": "Faisalabad", "lat": 31.4330, "lng": 73.1150, "aliases": ["madina town"]},
+    {"name": "Peoples Colony", "city": "Faisalabad", "lat": 31.4000, "lng": 73.0900, "aliases": ["peoples colony"]},
+    {"name": "Multan Cantt", "city": "Multan", "lat": 30.1900, "lng": 71.4500, "aliases": ["cantt", "cantonment"]},
+    {"name": "Gulgasht", "city": "Multan", "lat": 30.2200, "lng": 71.4800, "aliases": ["gulgasht"]},
+    {"name": "Bosan Road", "city": "Multan", "lat": 30.2250, "lng": 71.4750, "aliases": ["bosan road"]},
+    {"name": "Hayatabad", "city": "Peshawar", "lat": 33.9800, "lng": 71.4400, "aliases": ["hayatabad"]},
+    {"name": "University Town", "city": "Peshawar", "lat": 34.0000, "lng": 71.4900, "aliases": ["university town"]},
+    {"name": "Saddar Peshawar", "city": "Peshawar", "lat": 34.0050, "lng": 71.5400, "aliases": ["saddar"]},
+]
@@ -0,0 +1,97 @@
+import math
+import time
+from collections import deque
+from typing import Dict, Optional
+
+HISTOGRAM_PRECISION = 0.01
+HISTOGRAM_MIN_VALUE = 1e-3
+HISTOGRAM_MAX_VALUE = 1e12
+WINDOW_SECONDS = 60
+WINDOW_SLICE_SECONDS = 10
+
+
+class StreamingHistogram:
+    
+    def __init__(self, precision: float = HISTOGRAM_PRECISION):
+        self.precision = precision
+        self._log_base = math.log1p(2 * precision)
+        self._buckets: Dict[int, int] = {}
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+    
+    def bucket_index(self, value: float) -> int:
+        value = min(max(value, HISTOGRAM_MIN_VALUE), HISTOGRAM_MAX_VALUE)
+        return math.floor(math.log(value) / self._log_base)
+    
+    def record(self, value: float):
+        index = self.bucket_index(value)
+        self._buckets[index] = self._buckets.get(index, 0) + 1
+        self.count += 1
+        self.sum += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+    
+    def add_bucket(self, index: int, count: int):
+        self._buckets[index] = self._buckets.get(index, 0) + count
+    
+    def merge(self, other: "StreamingHistogram"):
+        for index, count in other._buckets.items():
+            self._buckets[index] = self._buckets.get(index, 0) + count
+        self.count += other.count
+        self.sum += other.sum
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+    
+    def percentile(self, quantile: float) -> Optional[float]:
+        if not self.count:
+            return None
+        rank = max(1, math.ceil(quantile * self.count))
+        seen = 0
+        for index in sorted(self._buckets):
+            seen += self._buckets[index]
+            if seen >= rank:
+                value = math.exp((index + 0.5) * self._log_base)
+                return min(max(value, self.min), self.max)
+        return self.max
+    
+    def mean(self) -> Optional[float]:
+        return self.sum / self.count if self.count else None
+    
+    def bucket_count(self) -> int:
+        return len(self._buckets)
+
+
+class RollingHistogram:
+    
+    def __init__(self, window_seconds: int = WINDOW_SECONDS, slice_seconds: int = WINDOW_SLICE_SECONDS):
+        self.window_seconds = window_seconds
+        self.slice_seconds = slice_seconds
+        self.total = StreamingHistogram()
+        self._slices: deque = deque()
+    
+    def _expire(self, now: float):
+        oldest = now - self.window_seconds
+        while self._slices and self._slices[0][0] + self.slice_seconds <= oldest:
+            self._slices.popleft()
+    
+    def record(self, value: float, now: Optional[float] = None):
+        now = time.monotonic() if now is None else now
+        slice_start = now - now % self.slice_seconds
+        if not self._slices or self._slices[-1][0] != slice_start:
+            self._expire(now)
+            self._slices.append((slice_start, StreamingHistogram()))
+        self._slices[-1][1].record(value)
+        self.total.record(value)
+    
+    def window(self, now: Optional[float] = None) -> StreamingHistogram:
+        now = time.monotonic() if now is None else now
+        self._expire(now)
+        merged = StreamingHistogram()
+        for _, histogram in self._slices:
+            merged.merge(histogram)
+        return merged
+
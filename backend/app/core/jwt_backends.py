@@ -0,0 +1,93 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+from jose import JWTError, jwt as jose_jwt
+from app.core.config import settings
+
+
+class TokenError(Exception):
+    pass
+
+
+class JWTBackend(ABC):
+    
+    @abstractmethod
+    def encode(self, claims: dict) -> str:
+        pass
+    
+    @abstractmethod
+    def decode(self, token: str, leeway: int = 0) -> dict:
+        pass
+
+
+class JoseBackend(JWTBackend):
+    
+    def __init__(self, secret: str, algorithm: str = "HS256"):
+        self.secret = secret
+        self.algorithm = algorithm
+    
+    def encode(self, claims: dict) -> str:
+        return jose_jwt.encode(claims, self.secret, algorithm=self.algorithm)
+    
+    def decode(self, token: str, leeway: int = 0) -> dict:
+        try:
+            return jose_jwt.decode(token, self.secret, algorithms=[self.algorithm], options={"leeway": leeway})
+        except JWTError as e:
+            raise TokenError(f"{type(e).__name__}: {str(e)}") from e
+
+
+class PyJWTBackend(JWTBackend):
+    
+    def __init__(self, signing_key, verifying_key=None, algorithm: str = "HS256"):
+        try:
+            import jwt
+        except ImportError:
+            raise RuntimeError("JWT_BACKEND=pyjwt requires the PyJWT package (pip install 'PyJWT[crypto]')")
+        if verifying_key is None and signing_key is not None and not algorithm.startswith("HS"):
+            from cryptography.hazmat.primitives.serialization import load_pem_private_key
+            verifying_key = load_pem_private_key(signing_key, password=None).public_key()
+        self._jwt = jwt
+        self.signing_key = signing_key
+        self.verifying_key = verifying_key if verifying_key is not None else signing_key
+        self.algorithm = algorithm
+    
+    def encode(self, claims: dict) -> str:
+        if self.signing_key is None:
+            raise TokenError("This backend only holds a public key and cannot sign tokens")
+        return self._jwt.encode(claims, self.signing_key, algorithm=self.algorithm)
+    
+    def decode(self, token: str, leeway: int = 0) -> dict:
+        try:
+            return self._jwt.decode(token, self.verifying_key, algorithms=[self.algorithm], leeway=leeway)
+        except self._jwt.PyJWTError as e:
+            raise TokenError(f"{type(e).__name__}: {str(e)}") from e
+
+
+def _read_key(path: str) -> Optional[bytes]:
+    if not path:
+        return None
+    with open(path, "rb") as key_file:
+        return key_file.read()
+
+
+def create_jwt_backend() -> JWTBackend:
+    if settings.JWT_BACKEND == "jose":
+        return JoseBackend(settings.SECRET_KEY, settings.ALGORITHM)
+    if settings.JWT_BACKEND == "pyjwt":
+        if settings.ALGORITHM.startswith("HS"):
+            return PyJWTBackend(settings.SECRET_KEY, algorithm=settings.ALGORITHM)
+        return PyJWTBackend(
+            _read_key(settings.JWT_PRIVATE_KEY_FILE),
+            _read_key(settings.JWT_PUBLIC_KEY_FILE),
+            algorithm=settings.ALGORITHM
+        )
+    raise RuntimeError(f"Unknown JWT_BACKEND '{settings.JWT_BACKEND}'")
+
+
+_jwt_backend = None
+
+
+def get_jwt_backend() -> JWTBackend:
+    global _jwt_backend
+    if _jwt_backend is None:
+        _jwt_backend = create_jwt_backend()
+    return _jwt_backend
@@ -0,0 +1,266 @@
+import os
+import sys
+import threading
+import tracemalloc
+from collections import OrderedDict
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+from app.core.config import settings
+from app.core.exceptions import BadRequestException, NotFoundException
+from app.core.patterns.singleton import get_cache, get_metrics, metric_key
+from app.core.request_metrics import HTTP_METHODS, UNMATCHED_ROUTE
+import logging
+
+logger = logging.getLogger(__name__)
+
+GROUP_BY_OPTIONS = ("module", "filename", "lineno", "traceback")
+
+_SNAPSHOT_FILTERS = [
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>"),
+]
+_path_prefixes = sorted({os.path.abspath(path) + os.sep for path in sys.path}, key=len, reverse=True)
+_module_names: Dict[str, str] = {}
+
+
+def module_name(filename: str) -> str:
+    name = _module_names.get(filename)
+    if name is None:
+        relative = filename
+        for prefix in _path_prefixes:
+            if filename.startswith(prefix):
+                relative = filename[len(prefix):]
+                break
+        if relative.endswith(".py"):
+            relative = relative[:-3]
+            if relative.endswith("__init__"):
+                relative = relative[:-len("__init__")]
+            relative = relative.strip(os.sep).replace(os.sep, ".")
+        name = _module_names[filename] = relative
+    return name
+
+
+def _rss_bytes() -> Optional[int]:
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def _frame_lines(traceback: tracemalloc.Traceback) -> List[str]:
+    return [f"{frame.filename}:{frame.lineno}" for frame in traceback]
+
+
+def _statistic_entry(key: str, size: int, count: int, traceback: Optional[List[str]] = None) -> dict:
+    entry = {"site": key, "size_kb": round(size / 1024, 1), "count": count}
+    if traceback is not None:
+        entry["traceback"] = traceback
+    return entry
+
+
+def _diff_entry(key: str, size: int, size_diff: int, count: int, count_diff: int, traceback: Optional[List[str]] = None) -> dict:
+    entry = {
+        "site": key,
+        "size_kb": round(size / 1024, 1),
+        "size_diff_kb": round(size_diff / 1024, 1),
+        "count": count,
+        "count_diff": count_diff
+    }
+    if traceback is not None:
+        entry["traceback"] = traceback
+    return entry
+
+
+def _group_by_module(statistics) -> Dict[str, Tuple[int, int]]:
+    grouped: Dict[str, Tuple[int, int]] = {}
+    for stat in statistics:
+        name = module_name(stat.traceback[-1].filename)
+        size, count = grouped.get(name, (0, 0))
+        grouped[name] = (size + stat.size, count + stat.count)
+    return grouped
+
+
+class MemoryProfiler:
+    
+    def __init__(self):
+        self._snapshots: "OrderedDict[int, Tuple[dict, tracemalloc.Snapshot]]" = OrderedDict()
+        self._next_id = 1
+        self._lock = threading.Lock()
+    
+    def start(self, frames: int = 0):
+        frames = frames or settings.MEMORY_PROFILING_FRAMES
+        if tracemalloc.is_tracing():
+            if tracemalloc.get_traceback_limit() == frames:
+                return
+            tracemalloc.stop()
+        tracemalloc.start(frames)
+        logger.info(f"MemoryProfiler: tracing allocations with {frames} frame(s)")
+    
+    def stop(self):
+        if not tracemalloc.is_tracing():
+            return
+        tracemalloc.stop()
+        with self._lock:
+            self._snapshots.clear()
+        logger.info("MemoryProfiler: tracing stopped")
+    
+    def status(self) -> dict:
+        status = {
+            "tracing": tracemalloc.is_tracing(),
+            "rss_kb": None,
+            "cache_entries": get_cache().size(),
+            "snapshots": self.list_snapshots()
+        }
+        rss = _rss_bytes()
+        if rss is not None:
+            status["rss_kb"] = round(rss / 1024)
+        if tracemalloc.is_tracing():
+            current, peak = tracemalloc.get_traced_memory()
+            status.update({
+                "frames": tracemalloc.get_traceback_limit(),
+                "traced_kb": round(current / 1024),
+                "traced_peak_kb": round(peak / 1024),
+                "tracemalloc_overhead_kb": round(tracemalloc.get_tracemalloc_memory() / 1024)
+            })
+        return status
+    
+    def take_snapshot(self) -> dict:
+        if not tracemalloc.is_tracing():
+            raise BadRequestException("Memory tracing is not running")
+        snapshot = tracemalloc.take_snapshot().filter_traces(_SNAPSHOT_FILTERS)
+        # Summed once here, in the caller's worker thread, so listing snapshots never walks the traces
+        traced = sum(trace.size for trace in snapshot.traces)
+        with self._lock:
+            snapshot_id = self._next_id
+            self._next_id += 1
+            summary = {
+                "id": snapshot_id,
+                "taken_at": datetime.utcnow(),
+                "traced_kb": round(traced / 1024),
+                "frames": snapshot.traceback_limit
+            }
+            self._snapshots[snapshot_id] = (summary, snapshot)
+            while len(self._snapshots) > settings.MEMORY_PROFILING_MAX_SNAPSHOTS:
+                self._snapshots.popitem(last=False)
+        return dict(summary)
+    
+    def delete_snapshot(self, snapshot_id: int):
+        with self._lock:
+            if self._snapshots.pop(snapshot_id, None) is None:
+                raise NotFoundException("Snapshot")
+    
+    def list_snapshots(self) -> List[dict]:
+        with self._lock:
+            return [dict(summary) for summary, _ in self._snapshots.values()]
+    
+    def _get_snapshot(self, snapshot_id: Optional[int]) -> Tuple[int, tracemalloc.Snapshot]:
+        with self._lock:
+            if snapshot_id is None:
+                if not self._snapshots:
+                    raise NotFoundException("Snapshot")
+                snapshot_id = next(reversed(self._snapshots))
+            entry = self._snapshots.get(snapshot_id)
+        if entry is None:
+            raise NotFoundException("Snapshot")
+        return snapshot_id, entry[1]
+    
+    def top(self, snapshot_id: Optional[int] = None, group_by: str = "module", limit: int = 25) -> dict:
+        if group_by not in GROUP_BY_OPTIONS:
+            raise BadRequestException(f"group_by must be one of: {', '.join(GROUP_BY_OPTIONS)}")
+        snapshot_id, snapshot = self._get_snapshot(snapshot_id)
+        
+        if group_by == "module":
+            grouped = _group_by_module(snapshot.statistics("filename"))
+            ranked = sorted(grouped.items(), key=lambda item: item[1][0], reverse=True)[:limit]
+            entries = [_statistic_entry(name, size, count) for name, (size, count) in ranked]
+        else:
+            entries = []
+            for stat in snapshot.statistics(group_by)[:limit]:
+                frame = stat.traceback[-1]
+                traceback = _frame_lines(stat.traceback) if group_by == "traceback" else None
+                entries.append(_statistic_entry(f"{frame.filename}:{frame.lineno}", stat.size, stat.count, traceback))
+        
+        return {"snapshot_id": snapshot_id, "group_by": group_by, "top": entries}
+    
+    def diff(self, from_id: int, to_id: Optional[int] = None, group_by: str = "module", limit: int = 25) -> dict:
+        if group_by not in GROUP_BY_OPTIONS:
+            raise BadRequestException(f"group_by must be one of: {', '.join(GROUP_BY_OPTIONS)}")
+        from_id, old = self._get_snapshot(from_id)
+        to_id, new = self._get_snapshot(to_id)
+        
+        if group_by == "module":
+            before = _group_by_module(old.statistics("filename"))
+            after = _group_by_module(new.statistics("filename"))
+            changes = []
+            for name in set(before) | set(after):
+                old_size, old_count = before.get(name, (0, 0))
+                size, count = after.get(name, (0, 0))
+                changes.append((name, size, size - old_size, count, count - old_count))
+            changes.sort(key=lambda change: abs(change[2]), reverse=True)
+            entries = [_diff_entry(*change) for change in changes[:limit]]
+        else:
+            entries = []
+            for stat in new.compare_to(old, group_by)[:limit]:
+                frame = stat.traceback[-1]
+                traceback = _frame_lines(stat.traceback) if group_by == "traceback" else None
+                entries.append(_diff_entry(
+                    f"{frame.filename}:{frame.lineno}", stat.size, stat.size_diff, stat.count, stat.count_diff, traceback
+                ))
+        
+        return {"from_id": from_id, "to_id": to_id, "group_by": group_by, "diff": entries}
+
+
+_memory_profiler: Optional[MemoryProfiler] = None
+
+
+def get_memory_profiler() -> MemoryProfiler:
+    global _memory_profiler
+    if _memory_profiler is None:
+        _memory_profiler = MemoryProfiler()
+    return _memory_profiler
+
+
+class MemorySamplingMiddleware:
+    
+    def __init__(self, app):
+        self.app = app
+        rate = settings.MEMORY_ROUTE_SAMPLE_RATE
+        self.sample_every = max(1, round(1 / rate)) if rate > 0 else 0
+        self._seen = 0
+        self._active = False
+        self._keys: Dict[Tuple[str, str], str] = {}
+    
+    def _peak_key(self, method: str, route: str) -> str:
+        key = self._keys.get((method, route))
+        if key is None:
+            key = self._keys[(method, route)] = metric_key("http.request.alloc_peak_kb", method=method, route=route)
+        return key
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not self.sample_every or self._active or not tracemalloc.is_tracing():
+            await self.app(scope, receive, send)
+            return
+        
+        self._seen += 1
+        if self._seen % self.sample_every:
+            await self.app(scope, receive, send)
+            return
+        
+        # The traced peak is process wide, so only one request per worker is sampled at a time;
+        # allocations from requests running concurrently still count towards it
+        self._active = True
+        baseline = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self._active = False
+            if tracemalloc.is_tracing():
+                peak = tracemalloc.get_traced_memory()[1]
+                route = scope.get("route")
+                method = scope["method"] if scope["method"] in HTTP_METHODS else "OTHER"
+                key = self._peak_key(method, route.path if route is not None else UNMATCHED_ROUTE)
+                get_metrics().record_metric(key, max(0, peak - baseline) / 1024)
@@ -1,10 +1,15 @@
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any
+from typing import Any, Awaitable, Callable, Dict, FrozenSet, List, Optional
 from enum import Enum
+import asyncio
 import logging
+import time
+from app.core.patterns.singleton import get_metrics
 
 logger = logging.getLogger(__name__)
 
+OBSERVER_TIMEOUT_SECONDS = 5.0
+
 
 class EventType(Enum):
     USER_REGISTERED = "user_registered"
@@ -21,9 +26,10 @@ class EventType(Enum):
 
 class Event:
     
-    def __init__(self, event_type: EventType, data: Dict[str, Any]):
+    def __init__(self, event_type: EventType, data: Dict[str, Any], event_id: str = None):
         self.event_type = event_type
         self.data = data
+        self.event_id = event_id
     
     def __str__(self):
         return f"Event({self.event_type.value}, {self.data})"
@@ -31,6 +37,14 @@ class Event:
 
 class Observer(ABC):
     
+    # Observers with side effects that must not repeat (emails, notifications) are acknowledged
+    # in the outbox as soon as they succeed instead of with the rest of the batch
+    deliver_once = False
+    
+    @property
+    def name(self) -> str:
+        return self.__class__.__name__
+    
     @abstractmethod
     async def update(self, event: Event):
         pass
@@ -38,6 +52,8 @@ class Observer(ABC):
 
 class EmailNotificationObserver(Observer):
     
+    deliver_once = True
+    
     def __init__(self, email_service=None):
         self.email_service = email_service
     
@@ -79,6 +95,8 @@ class AuditLogObserver(Observer):
 
 class NotificationObserver(Observer):
     
+    deliver_once = True
+    
     async def update(self, event: Event):
         logger.info(f"NotificationObserver: Creating notification for {event.event_type.value}")
         
@@ -93,8 +111,9 @@ class NotificationObserver(Observer):
 
 class EventManager:
     
-    def __init__(self):
+    def __init__(self, observer_timeout: float = OBSERVER_TIMEOUT_SECONDS):
         self._observers: Dict[EventType, List[Observer]] = {}
+        self.observer_timeout = observer_timeout
     
     def subscribe(self, event_type: EventType, observer: Observer):
         if event_type not in self._observers:
@@ -110,15 +129,40 @@ class EventManager:
                 self._observers[event_type].remove(observer)
                 logger.info(f"Observer {observer.__class__.__name__} unsubscribed from {event_type.value}")
     
-    async def notify(self, event: Event):
+    async def _deliver(self, observer: Observer, event: Event, on_delivered: Optional[Callable[[Observer], Awaitable]]):
+        try:
+            await asyncio.wait_for(observer.update(event), self.observer_timeout)
+        except asyncio.TimeoutError:
+            get_metrics().increment_counter(f"events.{event.event_type.value}.timeouts")
+            logger.error(f"Observer {observer.name} timed out on {event.event_type.value}")
+            return
+        except Exception as e:
+            get_metrics().increment_counter(f"events.{event.event_type.value}.errors")
+            logger.error(f"Error notifying observer {observer.name}: {str(e)}")
+            return
+        if on_delivered is not None:
+            await on_delivered(observer)
+    
+    async def notify(
+        self,
+        event: Event,
+        skip: FrozenSet[str] = frozenset(),
+        on_delivered: Optional[Callable[[Observer], Awaitable]] = None
+    ):
         logger.info(f"EventManager: Notifying observers of {event.event_type.value}")
         
-        if event.event_type in self._observers:
-            for observer in self._observers[event.event_type]:
-                try:
-                    await observer.update(event)
-                except Exception as e:
-                    logger.error(f"Error notifying observer {observer.__class__.__name__}: {str(e)}")
+        observers = [observer for observer in self._observers.get(event.event_type, []) if observer.name not in skip]
+        if not observers:
+            return
+        
+        started = time.perf_counter()
+        async with asyncio.TaskGroup() as group:
+            for observer in observers:
+                group.create_task(self._deliver(observer, event, on_delivered))
+        get_metrics().record_metric(
+            f"events.{event.event_type.value}.latency_ms",
+            (time.perf_counter() - started) * 1000
+        )
     
     async def emit(self, event_type: EventType, data: Dict[str, Any]):
         event = Event(event_type, data)
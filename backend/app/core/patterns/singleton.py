@@ -1,6 +1,15 @@
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 import logging
+import os
+import re
+import time
 from datetime import datetime
+from app.core.histogram import RollingHistogram, StreamingHistogram, WINDOW_SECONDS
+from app.core.shared_metrics import (
+    SharedMetricsStore, COUNTER, REQUEST_COUNT, REQUEST_TIMESTAMP, REQUEST_KINDS, METRIC_KINDS
+)
+
+PERCENTILES = [("p50", 0.5), ("p95", 0.95), ("p99", 0.99), ("p999", 0.999)]
 
 
 class SingletonMeta(type):
@@ -110,29 +119,48 @@ class RequestCounter(metaclass=SingletonMeta):
         if not hasattr(self, '_initialized'):
             self._counts: Dict[str, int] = {}
             self._timestamps: Dict[str, datetime] = {}
+            self._shared: Optional[SharedMetricsStore] = None
             self._initialized = True
     
+    def attach_shared_store(self, store: Optional[SharedMetricsStore]):
+        self._shared = store
+    
     def increment(self, identifier: str):
+        if self._shared is not None:
+            self._shared.increment(REQUEST_COUNT, identifier)
+            self._shared.set_max(REQUEST_TIMESTAMP, identifier, time.time())
+            return
         if identifier not in self._counts:
             self._counts[identifier] = 0
         self._counts[identifier] += 1
         self._timestamps[identifier] = datetime.utcnow()
     
     def get_count(self, identifier: str) -> int:
+        if self._shared is not None:
+            return int(self._shared.snapshot().request_counts.get(identifier, 0))
         return self._counts.get(identifier, 0)
     
     def reset(self, identifier: str):
-        if identifier in self._counts:
+        if self._shared is not None:
+            self._shared.set(REQUEST_COUNT, identifier, 0)
+        elif identifier in self._counts:
             self._counts[identifier] = 0
     
     def reset_all(self):
+        if self._shared is not None:
+            self._shared.reset(REQUEST_KINDS)
         self._counts.clear()
         self._timestamps.clear()
     
     def get_all_counts(self) -> Dict[str, int]:
+        if self._shared is not None:
+            return {identifier: int(count) for identifier, count in self._shared.snapshot().request_counts.items()}
         return self._counts.copy()
     
     def get_last_timestamp(self, identifier: str) -> Optional[datetime]:
+        if self._shared is not None:
+            timestamp = self._shared.snapshot().request_timestamps.get(identifier)
+            return datetime.utcfromtimestamp(timestamp) if timestamp else None
         return self._timestamps.get(identifier)
 
 
@@ -140,62 +168,146 @@ class MetricsCollector(metaclass=SingletonMeta):
     
     def __init__(self):
         if not hasattr(self, '_initialized'):
-            self._metrics: Dict[str, List[float]] = {}
+            self._metrics: Dict[str, RollingHistogram] = {}
             self._counters: Dict[str, int] = {}
+            self._shared: Optional[SharedMetricsStore] = None
             self._initialized = True
             self.logger = logging.getLogger(__name__)
     
+    def attach_shared_store(self, store: Optional[SharedMetricsStore]):
+        self._shared = store
+    
     def record_metric(self, name: str, value: float):
-        if name not in self._metrics:
-            self._metrics[name] = []
-        self._metrics[name].append(value)
+        if self._shared is not None:
+            self._shared.record(name, value)
+        else:
+            histogram = self._metrics.get(name)
+            if histogram is None:
+                histogram = self._metrics[name] = RollingHistogram()
+            histogram.record(value)
         self.logger.debug(f"Metric recorded: {name}={value}")
     
     def increment_counter(self, name: str, amount: int = 1):
-        if name not in self._counters:
-            self._counters[name] = 0
-        self._counters[name] += amount
-        self.logger.debug(f"Counter incremented: {name}={self._counters[name]}")
+        if self._shared is not None:
+            self._shared.increment(COUNTER, name, amount)
+        else:
+            if name not in self._counters:
+                self._counters[name] = 0
+            self._counters[name] += amount
+        self.logger.debug(f"Counter incremented: {name} by {amount}")
+    
+    def _snapshot(self) -> Tuple[Dict[str, int], Dict[str, Tuple[StreamingHistogram, StreamingHistogram]]]:
+        if self._shared is not None:
+            snapshot = self._shared.snapshot()
+            counters = {name: int(value) for name, value in snapshot.counters.items()}
+            return counters, snapshot.histograms
+        histograms = {name: (rolling.total, rolling.window()) for name, rolling in self._metrics.items()}
+        return self._counters.copy(), histograms
+    
+    def _histograms(self, name: str) -> Optional[Tuple[StreamingHistogram, StreamingHistogram]]:
+        if self._shared is not None:
+            return self._snapshot()[1].get(name)
+        if name in self._metrics:
+            return self._metrics[name].total, self._metrics[name].window()
+        return None
     
     def get_metric_avg(self, name: str) -> Optional[float]:
-        if name in self._metrics and self._metrics[name]:
-            return sum(self._metrics[name]) / len(self._metrics[name])
-        return None
+        histograms = self._histograms(name)
+        return histograms[0].mean() if histograms else None
     
     def get_metric_sum(self, name: str) -> float:
-        if name in self._metrics:
-            return sum(self._metrics[name])
-        return 0.0
+        histograms = self._histograms(name)
+        return histograms[0].sum if histograms else 0.0
     
     def get_metric_count(self, name: str) -> int:
-        if name in self._metrics:
-            return len(self._metrics[name])
-        return 0
+        histograms = self._histograms(name)
+        return histograms[0].count if histograms else 0
+    
+    def get_percentile(self, name: str, quantile: float, windowed: bool = True) -> Optional[float]:
+        histograms = self._histograms(name)
+        if not histograms:
+            return None
+        return (histograms[1] if windowed else histograms[0]).percentile(quantile)
     
     def get_counter(self, name: str) -> int:
+        if self._shared is not None:
+            return self._snapshot()[0].get(name, 0)
         return self._counters.get(name, 0)
     
+    def _summarize(self, total: StreamingHistogram, window: StreamingHistogram) -> Dict[str, Any]:
+        summary = {
+            "count": total.count,
+            "avg": total.mean() or 0,
+            "sum": total.sum,
+            "min": total.min if total.count else 0,
+            "max": total.max if total.count else 0,
+            "window_seconds": WINDOW_SECONDS,
+            "window_count": window.count
+        }
+        for label, quantile in PERCENTILES:
+            summary[label] = window.percentile(quantile)
+        return summary
+    
     def get_all_metrics(self) -> Dict[str, Any]:
+        counters, histograms = self._snapshot()
         return {
-            "metrics": {
-                name: {
-                    "count": len(values),
-                    "avg": sum(values) / len(values) if values else 0,
-                    "sum": sum(values),
-                    "min": min(values) if values else 0,
-                    "max": max(values) if values else 0
-                }
-                for name, values in self._metrics.items()
-            },
-            "counters": self._counters.copy()
+            "metrics": {name: self._summarize(total, window) for name, (total, window) in histograms.items()},
+            "counters": counters
         }
     
+    def render_prometheus(self, prefix: str = "pakwedding") -> str:
+        counters, histograms = self._snapshot()
+        lines = []
+        family = None
+        for name, value in sorted(counters.items()):
+            metric, labels = _prometheus_name(prefix, name)
+            metric += "_total"
+            if metric != family:
+                family = metric
+                lines.append(f"# TYPE {metric} counter")
+            lines.append(f"{metric}{_prometheus_labels(labels)} {value}")
+        for name, (total, window) in sorted(histograms.items()):
+            metric, labels = _prometheus_name(prefix, name)
+            if metric != family:
+                family = metric
+                lines.append(f"# TYPE {metric} summary")
+            for _, quantile in PERCENTILES:
+                value = window.percentile(quantile)
+                quantile_labels = _prometheus_labels(labels, f'quantile="{quantile}"')
+                lines.append(f'{metric}{quantile_labels} {"NaN" if value is None else repr(float(value))}')
+            lines.append(f"{metric}_sum{_prometheus_labels(labels)} {repr(float(total.sum))}")
+            lines.append(f"{metric}_count{_prometheus_labels(labels)} {total.count}")
+        return "\n".join(lines) + "\n"
+    
     def reset(self):
+        if self._shared is not None:
+            self._shared.reset(METRIC_KINDS)
         self._metrics.clear()
         self._counters.clear()
         self.logger.info("Metrics reset")
 
 
+def metric_key(name: str, **labels) -> str:
+    if not labels:
+        return name
+    rendered = ",".join(f'{label}="{_escape_label(value)}"' for label, value in labels.items())
+    return f"{name}{{{rendered}}}"
+
+
+def _escape_label(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _prometheus_name(prefix: str, key: str):
+    name, _, labels = key.partition("{")
+    return f"{prefix}_" + re.sub(r"[^a-zA-Z0-9_]", "_", name), labels[:-1]
+
+
+def _prometheus_labels(*labels: str) -> str:
+    rendered = ",".join(label for label in labels if label)
+    return f"{{{rendered}}}" if rendered else ""
+
+
 def get_config() -> ApplicationConfig:
     return ApplicationConfig()
 
@@ -211,3 +323,11 @@ def get_request_counter() -> RequestCounter:
 def get_metrics() -> MetricsCollector:
     return MetricsCollector()
 
+
+def enable_shared_metrics(directory: str) -> SharedMetricsStore:
+    store = SharedMetricsStore(directory)
+    get_metrics().attach_shared_store(store)
+    get_request_counter().attach_shared_store(store)
+    logging.getLogger(__name__).info(f"Shared metrics enabled in {directory} for worker {os.getpid()}")
+    return store
+
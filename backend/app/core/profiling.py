@@ -0,0 +1,406 @@
+import asyncio
+import hmac
+import json
+import logging
+import os
+import re
+import sys
+import threading
+import time
+from collections import deque
+from datetime import datetime
+from typing import Deque, Dict, List, Optional, Tuple
+from app.core.config import settings
+from app.core.request_metrics import UNMATCHED_ROUTE
+
+logger = logging.getLogger(__name__)
+
+PROFILE_HEADER = b"x-profile"
+PROFILE_SUFFIX = ".speedscope.json"
+BACKGROUND_ROUTE = "<background>"
+AWAIT_FRAME = "[await]"
+TRUNCATED_STACK = ("<truncated>",)
+MAX_STACK_DEPTH = 128
+
+_current_tasks = getattr(asyncio.tasks, "_current_tasks", {})
+_frame_labels: Dict[object, str] = {}
+_path_prefixes = sorted({os.path.abspath(path) + os.sep for path in sys.path}, key=len, reverse=True)
+
+Stack = Tuple[str, ...]
+
+
+def _frame_label(code) -> str:
+    label = _frame_labels.get(code)
+    if label is None:
+        filename = code.co_filename
+        for prefix in _path_prefixes:
+            if filename.startswith(prefix):
+                filename = filename[len(prefix):]
+                break
+        name = getattr(code, "co_qualname", code.co_name)
+        label = _frame_labels[code] = f"{name} ({filename}:{code.co_firstlineno})"
+    return label
+
+
+def _thread_stack(frame, root_code=None) -> Stack:
+    labels = []
+    while frame is not None and len(labels) < MAX_STACK_DEPTH:
+        labels.append(_frame_label(frame.f_code))
+        if frame.f_code is root_code:
+            break
+        frame = frame.f_back
+    labels.reverse()
+    return tuple(labels)
+
+
+def _await_stack(coro) -> Stack:
+    labels = []
+    while coro is not None and len(labels) < MAX_STACK_DEPTH:
+        frame = getattr(coro, "cr_frame", None) or getattr(coro, "gi_frame", None) or getattr(coro, "ag_frame", None)
+        if frame is None:
+            labels.append(AWAIT_FRAME)
+            break
+        labels.append(_frame_label(frame.f_code))
+        coro = getattr(coro, "cr_await", None) or getattr(coro, "gi_yieldfrom", None) or getattr(coro, "ag_await", None)
+    return tuple(labels)
+
+
+def _task_root_code(task: asyncio.Task):
+    coro = task.get_coro()
+    return getattr(coro, "cr_code", None) or getattr(coro, "gi_code", None)
+
+
+class Profile:
+    
+    def __init__(self, max_stacks: int = 0):
+        self.max_stacks = max_stacks
+        self.weights: Dict[Stack, float] = {}
+        self.total = 0.0
+    
+    def add(self, stack: Stack, weight: float):
+        if stack not in self.weights and self.max_stacks and len(self.weights) >= self.max_stacks:
+            stack = TRUNCATED_STACK
+        self.weights[stack] = self.weights.get(stack, 0.0) + weight
+        self.total += weight
+    
+    def merge(self, other: "Profile"):
+        for stack, weight in other.weights.items():
+            self.add(stack, weight)
+    
+    def to_collapsed(self) -> str:
+        # Brendan Gregg's folded format, one "frame;frame;frame weight" line per stack, weights in microseconds
+        lines = [f"{';'.join(stack)} {round(weight * 1e6)}" for stack, weight in self.weights.items() if stack]
+        return "\n".join(lines) + "\n"
+    
+    def to_speedscope(self, name: str) -> dict:
+        frames: List[dict] = []
+        frame_index: Dict[str, int] = {}
+        samples = []
+        weights = []
+        for stack, weight in self.weights.items():
+            sample = []
+            for label in stack:
+                index = frame_index.get(label)
+                if index is None:
+                    index = frame_index[label] = len(frames)
+                    frames.append({"name": label})
+                sample.append(index)
+            samples.append(sample)
+            weights.append(weight)
+        return {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "shared": {"frames": frames},
+            "profiles": [{
+                "type": "sampled",
+                "name": name,
+                "unit": "seconds",
+                "startValue": 0,
+                "endValue": self.total,
+                "samples": samples,
+                "weights": weights,
+            }],
+            "name": name,
+            "exporter": "pakwedding-profiler",
+        }
+
+
+class RequestProfiler:
+    
+    def __init__(self, interval: float):
+        self.interval = interval
+        self.profile = Profile()
+        self._loop_thread = threading.get_ident()
+        self._loop = asyncio.get_running_loop()
+        self._task = asyncio.current_task()
+        self._root_code = _task_root_code(self._task)
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="request-profiler", daemon=True)
+        self._last_sample = 0.0
+    
+    def start(self):
+        self._last_sample = time.perf_counter()
+        self._thread.start()
+    
+    def stop(self) -> Profile:
+        self._stop.set()
+        self._thread.join()
+        return self.profile
+    
+    def cancel(self):
+        self._stop.set()
+    
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self._sample()
+    
+    def _sample(self):
+        now = time.perf_counter()
+        elapsed = now - self._last_sample
+        self._last_sample = now
+        if _current_tasks.get(self._loop) is self._task:
+            frame = sys._current_frames().get(self._loop_thread)
+            stack = _thread_stack(frame, self._root_code)
+        else:
+            # The task is suspended, so charge the time to the await it is blocked on
+            stack = _await_stack(self._task.get_coro())
+        self.profile.add(stack, elapsed)
+
+
+class RollingProfile:
+    
+    def __init__(self, window_seconds: int, slice_seconds: int, max_stacks: int):
+        self.slice_seconds = slice_seconds
+        self.slice_count = max(1, window_seconds // slice_seconds)
+        self.max_stacks = max_stacks
+        self._slices: Deque[Tuple[int, Dict[str, Profile]]] = deque()
+        self._lock = threading.Lock()
+    
+    def add(self, route: str, stack: Stack, weight: float, now: Optional[float] = None):
+        slice_id = int((now or time.time()) // self.slice_seconds)
+        with self._lock:
+            if not self._slices or self._slices[-1][0] != slice_id:
+                self._slices.append((slice_id, {}))
+                while len(self._slices) > self.slice_count:
+                    self._slices.popleft()
+            routes = self._slices[-1][1]
+            profile = routes.get(route)
+            if profile is None:
+                profile = routes[route] = Profile(self.max_stacks)
+            profile.add(stack, weight)
+    
+    def merged(self, route: Optional[str] = None, now: Optional[float] = None) -> Profile:
+        oldest = int((now or time.time()) // self.slice_seconds) - self.slice_count + 1
+        merged = Profile()
+        with self._lock:
+            for slice_id, routes in self._slices:
+                if slice_id < oldest:
+                    continue
+                for name, profile in routes.items():
+                    if route is None or name == route:
+                        merged.merge(profile)
+        return merged
+    
+    def routes(self, now: Optional[float] = None) -> Dict[str, float]:
+        oldest = int((now or time.time()) // self.slice_seconds) - self.slice_count + 1
+        totals: Dict[str, float] = {}
+        with self._lock:
+            for slice_id, routes in self._slices:
+                if slice_id < oldest:
+                    continue
+                for name, profile in routes.items():
+                    totals[name] = totals.get(name, 0.0) + profile.total
+        return totals
+
+
+class ContinuousProfiler:
+    
+    def __init__(self):
+        self.interval = settings.PROFILING_SAMPLE_INTERVAL_MS / 1000
+        self.rolling = RollingProfile(
+            settings.PROFILING_WINDOW_SECONDS,
+            settings.PROFILING_SLICE_SECONDS,
+            settings.PROFILING_MAX_STACKS
+        )
+        self._request_tasks: Dict[asyncio.Task, dict] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[int] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+    
+    @property
+    def running(self) -> bool:
+        return self._thread is not None
+    
+    def track(self, task: asyncio.Task, scope: dict):
+        if self._thread is not None:
+            self._request_tasks[task] = scope
+    
+    def untrack(self, task: asyncio.Task):
+        self._request_tasks.pop(task, None)
+    
+    def start(self):
+        if self._thread is not None or self.interval <= 0:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread = threading.get_ident()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="continuous-profiler", daemon=True)
+        self._thread.start()
+        logger.info(f"ContinuousProfiler: sampling every {self.interval * 1000:.0f}ms")
+    
+    def stop(self):
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+        self._request_tasks.clear()
+    
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self._sample()
+            except Exception as e:
+                logger.debug(f"ContinuousProfiler: sample failed: {e}")
+    
+    def _sample(self):
+        task = _current_tasks.get(self._loop)
+        if task is None:
+            return
+        frame = sys._current_frames().get(self._loop_thread)
+        if frame is None:
+            return
+        scope = self._request_tasks.get(task)
+        if scope is None:
+            route = BACKGROUND_ROUTE
+        else:
+            matched = scope.get("route")
+            route = f"{scope['method']} {matched.path if matched is not None else UNMATCHED_ROUTE}"
+        self.rolling.add(route, _thread_stack(frame, _task_root_code(task)), self.interval)
+
+
+_continuous_profiler: Optional[ContinuousProfiler] = None
+
+
+def get_continuous_profiler() -> ContinuousProfiler:
+    global _continuous_profiler
+    if _continuous_profiler is None:
+        _continuous_profiler = ContinuousProfiler()
+    return _continuous_profiler
+
+
+def profile_directory() -> str:
+    return os.path.abspath(settings.PROFILING_DIR)
+
+
+def save_profile(profile: Profile, method: str, route: str) -> str:
+    directory = profile_directory()
+    os.makedirs(directory, exist_ok=True)
+    slug = re.sub(r"[^A-Za-z0-9]+", "_", route).strip("_") or "root"
+    stamp = datetime.utcnow().strftime("%Y%m%dT%H%M%S%f")
+    filename = f"{stamp}-{os.getpid()}-{method.lower()}-{slug}{PROFILE_SUFFIX}"
+    with open(os.path.join(directory, filename), "w") as f:
+        json.dump(profile.to_speedscope(f"{method} {route}"), f)
+    _prune_profiles(directory)
+    return filename
+
+
+def _prune_profiles(directory: str):
+    entries = [entry for entry in os.scandir(directory) if entry.is_file() and entry.name.endswith(PROFILE_SUFFIX)]
+    entries.sort(key=lambda entry: entry.stat().st_mtime, reverse=True)
+    for entry in entries[settings.PROFILING_MAX_FILES:]:
+        try:
+            os.remove(entry.path)
+        except FileNotFoundError:
+            pass
+
+
+def _finish_profile(profiler: RequestProfiler, method: str, route: str) -> str:
+    return save_profile(profiler.stop(), method, route)
+
+
+def list_profiles() -> List[dict]:
+    directory = profile_directory()
+    if not os.path.isdir(directory):
+        return []
+    profiles = []
+    for entry in os.scandir(directory):
+        if entry.is_file() and entry.name.endswith(PROFILE_SUFFIX):
+            stat = entry.stat()
+            profiles.append({
+                "name": entry.name,
+                "size": stat.st_size,
+                "created_at": datetime.utcfromtimestamp(stat.st_mtime)
+            })
+    profiles.sort(key=lambda profile: profile["created_at"], reverse=True)
+    return profiles
+
+
+def profile_path(name: str) -> Optional[str]:
+    if os.path.basename(name) != name or not name.endswith(PROFILE_SUFFIX):
+        return None
+    path = os.path.join(profile_directory(), name)
+    return path if os.path.isfile(path) else None
+
+
+def _profile_requested(scope) -> bool:
+    secret = settings.PROFILING_SECRET
+    if not secret:
+        return False
+    # Header only: a query parameter would leak the secret into access logs, proxies and browser history
+    for name, value in scope.get("headers", []):
+        if name == PROFILE_HEADER:
+            return hmac.compare_digest(value, secret.encode())
+    return False
+
+
+class ProfilingMiddleware:
+    
+    def __init__(self, app):
+        self.app = app
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        continuous = get_continuous_profiler()
+        if not continuous.running and not settings.PROFILING_SECRET:
+            await self.app(scope, receive, send)
+            return
+        
+        task = asyncio.current_task()
+        continuous.track(task, scope)
+        try:
+            if _profile_requested(scope):
+                await self._profile_request(scope, receive, send)
+            else:
+                await self.app(scope, receive, send)
+        finally:
+            continuous.untrack(task)
+    
+    async def _profile_request(self, scope, receive, send):
+        profiler = RequestProfiler(settings.PROFILING_REQUEST_INTERVAL_MS / 1000)
+        filename = [None]
+        
+        async def send_with_profile(message):
+            if message["type"] == "http.response.start":
+                # The profile covers the handler up to the response headers, which is where the time goes.
+                # Joining the sampler and writing the file happen off the event loop
+                route = scope.get("route")
+                filename[0] = await asyncio.to_thread(
+                    _finish_profile, profiler, scope["method"], route.path if route is not None else scope["path"]
+                )
+                headers = list(message.get("headers", []))
+                headers.append((b"x-profile-file", filename[0].encode()))
+                message = {**message, "headers": headers}
+            await send(message)
+        
+        profiler.start()
+        try:
+            await self.app(scope, receive, send_with_profile)
+        finally:
+            if filename[0] is None:
+                profiler.cancel()
+            else:
+                logger.info("Request profile saved", extra={"path": scope["path"], "profile": filename[0]})
@@ -0,0 +1,241 @@
+import json
+import logging
+import math
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs
+from starlette.responses import JSONResponse
+from app.core.config import settings
+from app.core.database import Database
+from app.core.patterns.singleton import get_metrics, get_request_counter
+from app.core.security import decode_token
+from app.repositories.rate_limit_repository import RateLimitRepository
+
+logger = logging.getLogger(__name__)
+
+PER_MINUTE = 60
+PER_HOUR = 3600
+MAX_INSPECTED_BODY_BYTES = 16 * 1024
+
+
+class RateLimitPolicy:
+    
+    def __init__(self, name: str, key: str, limit: int, period: int, burst: Optional[int] = None):
+        self.name = name
+        self.key = key
+        self.rate = limit / period
+        self.capacity = burst or limit
+
+
+RATE_LIMIT_REGISTER_IP = RateLimitPolicy("register:ip", "ip", 10, PER_HOUR, burst=5)
+
+RATE_LIMIT_RULES: Dict[str, List[RateLimitPolicy]] = {
+    "/api/auth/login": [
+        RateLimitPolicy("login:ip", "ip", 20, PER_MINUTE, burst=10),
+        RateLimitPolicy("login:email", "email", 5, PER_MINUTE),
+    ],
+    "/api/auth/register": [RATE_LIMIT_REGISTER_IP],
+    "/api/vendors/register": [RATE_LIMIT_REGISTER_IP],
+    "/api/auth/forgot-password": [
+        RateLimitPolicy("forgot-password:ip", "ip", 5, PER_MINUTE),
+        RateLimitPolicy("forgot-password:email", "email", 3, PER_HOUR),
+    ],
+    "/api/auth/verify-reset-token": [RateLimitPolicy("verify-reset-token:ip", "ip", 20, PER_MINUTE, burst=10)],
+    "/api/auth/reset-password": [RateLimitPolicy("reset-password:ip", "ip", 10, PER_MINUTE, burst=5)],
+    "/api/auth/check-email": [RateLimitPolicy("check-email:ip", "ip", 30, PER_MINUTE, burst=10)],
+    "/api/auth/check-password-strength": [RateLimitPolicy("check-password-strength:ip", "ip", 60, PER_MINUTE, burst=20)],
+}
+
+DEFAULT_RATE_LIMIT_RULES: List[RateLimitPolicy] = [
+    RateLimitPolicy("api:ip", "ip", 600, PER_MINUTE, burst=120),
+    RateLimitPolicy("api:user", "user", 600, PER_MINUTE, burst=120),
+]
+
+
+class MemoryBucketStore:
+    
+    def __init__(self, max_keys: int):
+        self.max_keys = max_keys
+        self._buckets: OrderedDict = OrderedDict()
+    
+    async def take(self, key: str, policy: RateLimitPolicy) -> Tuple[bool, float]:
+        now = time.monotonic()
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            tokens = policy.capacity
+        else:
+            tokens = min(policy.capacity, bucket[0] + (now - bucket[1]) * policy.rate)
+            self._buckets.move_to_end(key)
+        allowed = tokens >= 1
+        if allowed:
+            tokens -= 1
+        self._buckets[key] = (tokens, now)
+        if len(self._buckets) > self.max_keys:
+            self._buckets.popitem(last=False)
+        return allowed, tokens
+    
+    def size(self) -> int:
+        return len(self._buckets)
+
+
+class MongoBucketStore:
+    
+    def __init__(self):
+        self._repo: Optional[RateLimitRepository] = None
+    
+    async def take(self, key: str, policy: RateLimitPolicy) -> Tuple[bool, float]:
+        if self._repo is None:
+            self._repo = RateLimitRepository(Database.get_database())
+        return await self._repo.take(key, policy.capacity, policy.rate, time.time())
+
+
+class RateLimiter:
+    
+    def __init__(self, store, rules: Dict[str, List[RateLimitPolicy]], default_rules: List[RateLimitPolicy]):
+        self.store = store
+        self.rules = rules
+        self.default_rules = default_rules
+    
+    def policies_for(self, path: str) -> List[RateLimitPolicy]:
+        policies = self.rules.get(path.rstrip("/") or "/")
+        if policies is not None:
+            return policies
+        return self.default_rules if path.startswith("/api/") else []
+    
+    async def check(self, policies: List[RateLimitPolicy], identities: Dict[str, Optional[str]]) -> float:
+        retry_after = 0.0
+        for policy in policies:
+            identity = identities.get(policy.key)
+            if not identity:
+                continue
+            allowed, tokens = await self.store.take(f"{policy.name}:{identity}", policy)
+            if not allowed:
+                get_request_counter().increment(f"rate_limit:{policy.name}")
+                get_metrics().increment_counter("rate_limit.rejected")
+                retry_after = max(retry_after, (1 - tokens) / policy.rate)
+        return retry_after
+
+
+def create_rate_limiter() -> RateLimiter:
+    if settings.RATE_LIMIT_BACKEND == "memory":
+        store = MemoryBucketStore(settings.RATE_LIMIT_MAX_KEYS)
+    elif settings.RATE_LIMIT_BACKEND == "mongo":
+        store = MongoBucketStore()
+    else:
+        raise RuntimeError(f"Unknown RATE_LIMIT_BACKEND '{settings.RATE_LIMIT_BACKEND}'")
+    return RateLimiter(store, RATE_LIMIT_RULES, DEFAULT_RATE_LIMIT_RULES)
+
+
+_rate_limiter = None
+
+
+def get_rate_limiter() -> RateLimiter:
+    global _rate_limiter
+    if _rate_limiter is None:
+        _rate_limiter = create_rate_limiter()
+    return _rate_limiter
+
+
+def _header(scope, name: bytes) -> Optional[str]:
+    for key, value in scope.get("headers", []):
+        if key == name:
+            return value.decode("latin-1")
+    return None
+
+
+def _client_ip(scope) -> Optional[str]:
+    if settings.RATE_LIMIT_TRUST_FORWARDED:
+        forwarded = _header(scope, b"x-forwarded-for")
+        if forwarded:
+            return forwarded.split(",")[0].strip()
+    client = scope.get("client")
+    return client[0] if client else None
+
+
+def _user_id(scope) -> Optional[str]:
+    authorization = _header(scope, b"authorization")
+    if not authorization or not authorization.lower().startswith("bearer "):
+        return None
+    payload = decode_token(authorization[7:].strip())
+    return payload.get("sub") if payload else None
+
+
+def _email(scope, body: bytes) -> Optional[str]:
+    content_type = _header(scope, b"content-type") or ""
+    try:
+        if content_type.startswith("application/json"):
+            data = json.loads(body)
+            email = data.get("email") if isinstance(data, dict) else None
+        elif content_type.startswith("application/x-www-form-urlencoded"):
+            form = parse_qs(body.decode("utf-8"))
+            email = (form.get("username") or form.get("email") or [None])[0]
+        else:
+            return None
+    except (ValueError, UnicodeDecodeError):
+        return None
+    return email.strip().lower() if isinstance(email, str) and email.strip() else None
+
+
+async def _read_body(receive) -> Tuple[list, Optional[bytes]]:
+    messages = []
+    body = b""
+    while True:
+        message = await receive()
+        messages.append(message)
+        if message["type"] != "http.request":
+            return messages, None
+        body += message.get("body", b"")
+        if len(body) > MAX_INSPECTED_BODY_BYTES:
+            return messages, None
+        if not message.get("more_body", False):
+            return messages, body
+
+
+def _replay(messages: list, receive):
+    async def replay_receive():
+        if messages:
+            return messages.pop(0)
+        return await receive()
+    return replay_receive
+
+
+class RateLimitMiddleware:
+    
+    def __init__(self, app, limiter: Optional[RateLimiter] = None):
+        self.app = app
+        self.limiter = limiter
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not settings.RATE_LIMIT_ENABLED or scope["method"] == "OPTIONS":
+            await self.app(scope, receive, send)
+            return
+        
+        limiter = self.limiter or get_rate_limiter()
+        policies = limiter.policies_for(scope["path"])
+        if not policies:
+            await self.app(scope, receive, send)
+            return
+        
+        identities = {"ip": _client_ip(scope), "user": _user_id(scope)}
+        if any(policy.key == "email" for policy in policies):
+            messages, body = await _read_body(receive)
+            identities["email"] = _email(scope, body) if body is not None else None
+            receive = _replay(messages, receive)
+        
+        try:
+            retry_after = await limiter.check(policies, identities)
+        except Exception as e:
+            logger.error(f"RateLimitMiddleware: limiter failed, allowing request: {str(e)}")
+            retry_after = 0
+        
+        if retry_after:
+            response = JSONResponse(
+                status_code=429,
+                content={"detail": "Too many requests, please try again later"},
+                headers={"Retry-After": str(max(1, math.ceil(retry_after)))}
+            )
+            await response(scope, receive, send)
+            return
+        
+        await self.app(scope, receive, send)
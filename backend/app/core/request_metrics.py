@@ -0,0 +1,93 @@
+import time
+from contextvars import ContextVar
+from typing import Dict, Optional, Tuple
+from pymongo import monitoring
+from app.core.patterns.singleton import get_metrics, metric_key
+
+UNMATCHED_ROUTE = "<unmatched>"
+HTTP_METHODS = {"GET", "HEAD", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"}
+
+_db_micros: ContextVar[Optional[list]] = ContextVar("db_micros", default=None)
+
+
+class CommandTimingListener(monitoring.CommandListener):
+    
+    def started(self, event):
+        pass
+    
+    def succeeded(self, event):
+        self._add(event.duration_micros)
+    
+    def failed(self, event):
+        self._add(event.duration_micros)
+    
+    def _add(self, duration_micros: int):
+        accumulator = _db_micros.get()
+        if accumulator is not None:
+            accumulator[0] += duration_micros
+            accumulator[1] += 1
+
+
+command_timing_listener = CommandTimingListener()
+
+
+class RequestMetricsMiddleware:
+    
+    def __init__(self, app):
+        self.app = app
+        self._keys: Dict[Tuple[str, str], Tuple[str, str, str]] = {}
+        self._status_keys: Dict[Tuple[str, str, int], str] = {}
+    
+    def _route_keys(self, method: str, route: str) -> Tuple[str, str, str]:
+        keys = self._keys.get((method, route))
+        if keys is None:
+            keys = self._keys[(method, route)] = (
+                metric_key("http.request.duration_ms", method=method, route=route),
+                metric_key("http.response.bytes", method=method, route=route),
+                metric_key("http.request.db_ms", method=method, route=route),
+            )
+        return keys
+    
+    def _status_key(self, method: str, route: str, status_code: int) -> str:
+        key = self._status_keys.get((method, route, status_code))
+        if key is None:
+            key = self._status_keys[(method, route, status_code)] = metric_key(
+                "http.responses", method=method, route=route, status=status_code
+            )
+        return key
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        started = time.perf_counter()
+        db = [0, 0]
+        token = _db_micros.set(db)
+        response = [500, 0]
+        
+        async def send_with_metrics(message):
+            if message["type"] == "http.response.start":
+                response[0] = message["status"]
+                app_ms = (time.perf_counter() - started) * 1000
+                headers = list(message.get("headers", []))
+                headers.append((b"server-timing", f"app;dur={app_ms:.1f}, db;dur={db[0] / 1000:.1f}".encode()))
+                message = {**message, "headers": headers}
+            elif message["type"] == "http.response.body":
+                response[1] += len(message.get("body", b""))
+            await send(message)
+        
+        try:
+            await self.app(scope, receive, send_with_metrics)
+        finally:
+            _db_micros.reset(token)
+            route = scope.get("route")
+            route_path = route.path if route is not None else UNMATCHED_ROUTE
+            method = scope["method"] if scope["method"] in HTTP_METHODS else "OTHER"
+            duration_key, bytes_key, db_key = self._route_keys(method, route_path)
+            metrics = get_metrics()
+            metrics.record_metric(duration_key, (time.perf_counter() - started) * 1000)
+            metrics.record_metric(bytes_key, response[1])
+            if db[1]:
+                metrics.record_metric(db_key, db[0] / 1000)
+            metrics.increment_counter(self._status_key(method, route_path, response[0]))
@@ -1,27 +1,92 @@
 from datetime import datetime, timedelta, timezone
 from typing import Optional
-from jose import JWTError, jwt
+from concurrent.futures import ThreadPoolExecutor
+from collections import OrderedDict
+import asyncio
 import hashlib
+import hmac
+import logging
+import math
 import os
 import base64
+import time
+import uuid
 from app.core.config import settings
+from app.core.patterns.singleton import get_metrics
+from app.core.exceptions import ServiceUnavailableException
+from app.core.jwt_backends import TokenError, get_jwt_backend
+
+logger = logging.getLogger(__name__)
+
+PBKDF2_ITERATIONS = 100000
+PASSWORD_HASH_WORKERS = max(2, min(4, os.cpu_count() or 1))
+PASSWORD_HASH_MAX_PENDING = 64
+TOKEN_LEEWAY_SECONDS = 60
+VERIFIED_TOKEN_CACHE_SIZE = 10000
+
+_password_executor: Optional[ThreadPoolExecutor] = None
+_password_slots = asyncio.Semaphore(PASSWORD_HASH_WORKERS)
+_password_pending = 0
 
 
 def hash_password(password: str) -> str:
     salt = base64.b64encode(os.urandom(32)).decode('utf-8')
-    key = hashlib.pbkdf2_hmac('sha256', password.encode('utf-8'), salt.encode('utf-8'), 100000)
+    key = hashlib.pbkdf2_hmac('sha256', password.encode('utf-8'), salt.encode('utf-8'), PBKDF2_ITERATIONS)
     return f"{salt}:{base64.b64encode(key).decode('utf-8')}"
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     try:
         salt, key = hashed_password.split(':')
-        new_key = hashlib.pbkdf2_hmac('sha256', plain_password.encode('utf-8'), salt.encode('utf-8'), 100000)
-        return base64.b64encode(new_key).decode('utf-8') == key
+        new_key = hashlib.pbkdf2_hmac('sha256', plain_password.encode('utf-8'), salt.encode('utf-8'), PBKDF2_ITERATIONS)
+        return hmac.compare_digest(base64.b64encode(new_key).decode('utf-8'), key)
     except:
         return False
 
 
+def get_password_executor() -> ThreadPoolExecutor:
+    global _password_executor
+    if _password_executor is None:
+        _password_executor = ThreadPoolExecutor(max_workers=PASSWORD_HASH_WORKERS, thread_name_prefix="password-hash")
+    return _password_executor
+
+
+async def _run_password_task(func, *args):
+    global _password_pending
+    metrics = get_metrics()
+    if _password_pending >= PASSWORD_HASH_MAX_PENDING:
+        metrics.increment_counter("auth.password.rejected")
+        raise ServiceUnavailableException("Too many sign-in attempts in progress, please retry shortly")
+    
+    queued_at = time.perf_counter()
+    _password_pending += 1
+    metrics.record_metric("auth.password.queue_depth", _password_pending)
+    try:
+        async with _password_slots:
+            started = time.perf_counter()
+            metrics.record_metric("auth.password.wait_ms", (started - queued_at) * 1000)
+            result = await asyncio.get_running_loop().run_in_executor(get_password_executor(), func, *args)
+            metrics.record_metric("auth.password.hash_ms", (time.perf_counter() - started) * 1000)
+            return result
+    finally:
+        _password_pending -= 1
+
+
+async def hash_password_async(password: str) -> str:
+    return await _run_password_task(hash_password, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    return await _run_password_task(verify_password, plain_password, hashed_password)
+
+
+def shutdown_password_executor():
+    global _password_executor
+    if _password_executor is not None:
+        _password_executor.shutdown(wait=False, cancel_futures=True)
+        _password_executor = None
+
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     to_encode = data.copy()
     
@@ -31,29 +96,60 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     else:
         expire = now + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     
-    expire_timestamp = int(expire.timestamp())
-    to_encode.update({"exp": expire_timestamp})
+    to_encode.update({
+        "exp": int(expire.timestamp()),
+        # Rounded up so a token issued right after a revocation is never older than its valid_after
+        "iat": math.ceil(now.timestamp() * 1000) / 1000,
+        "jti": uuid.uuid4().hex
+    })
     
-    encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
-    print(f"[AUTH] Token created at: {now}, expires at: {expire} (timestamp: {expire_timestamp}, expires in {settings.ACCESS_TOKEN_EXPIRE_MINUTES} minutes)")
+    encoded_jwt = get_jwt_backend().encode(to_encode)
+    logger.debug(f"Token issued for {data.get('sub')}, expires at {expire}")
     return encoded_jwt
 
 
+class VerifiedTokenCache:
+    
+    def __init__(self, max_size: int = VERIFIED_TOKEN_CACHE_SIZE):
+        self.max_size = max_size
+        self._entries: OrderedDict = OrderedDict()
+    
+    def get(self, digest: bytes) -> Optional[dict]:
+        entry = self._entries.get(digest)
+        if entry is None:
+            return None
+        payload, valid_until = entry
+        if time.time() > valid_until:
+            del self._entries[digest]
+            return None
+        self._entries.move_to_end(digest)
+        return payload
+    
+    def put(self, digest: bytes, payload: dict):
+        self._entries[digest] = (payload, payload.get("exp", 0) + TOKEN_LEEWAY_SECONDS)
+        self._entries.move_to_end(digest)
+        if len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+    
+    def clear(self):
+        self._entries.clear()
+
+
+verified_tokens = VerifiedTokenCache()
+
+
 def decode_token(token: str) -> Optional[dict]:
+    digest = hashlib.blake2b(token.encode("utf-8"), digest_size=16).digest()
+    payload = verified_tokens.get(digest)
+    if payload is not None:
+        return dict(payload)
+    
     try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM], options={"leeway": 60})
-        return payload
-    except JWTError as e:
-        print(f"[AUTH ERROR] Token validation failed: {type(e).__name__}: {str(e)}")
-        if "expired" in str(e).lower() or "ExpiredSignature" in str(type(e).__name__):
-            try:
-                unverified = jwt.decode(token, options={"verify_signature": False})
-                exp_timestamp = unverified.get("exp")
-                if exp_timestamp:
-                    from datetime import datetime
-                    exp_time = datetime.fromtimestamp(exp_timestamp)
-                    now = datetime.utcnow()
-                    print(f"[AUTH ERROR] Token expired. Current time: {now}, Token expires: {exp_time}, Difference: {(now.timestamp() - exp_timestamp) / 60:.2f} minutes")
-            except:
-                pass
+        payload = get_jwt_backend().decode(token, leeway=TOKEN_LEEWAY_SECONDS)
+    except TokenError as e:
+        logger.info(f"Token validation failed: {str(e)}")
         return None
+    
+    if "exp" in payload:
+        verified_tokens.put(digest, payload)
+    return dict(payload)
@@ -0,0 +1,280 @@
+import glob
+import logging
+import math
+import mmap
+import os
+import struct
+import time
+from typing import Dict, Iterator, Optional, Tuple
+from app.core.histogram import StreamingHistogram, WINDOW_SECONDS, WINDOW_SLICE_SECONDS
+
+logger = logging.getLogger(__name__)
+
+SHARED_FILE_PATTERN = "metrics-*.db"
+INITIAL_FILE_SIZE = 64 * 1024
+WINDOW_SLICES = WINDOW_SECONDS // WINDOW_SLICE_SECONDS
+WINDOW_SLOTS = WINDOW_SLICES + 1
+
+COUNTER = "c"
+REQUEST_COUNT = "r"
+REQUEST_TIMESTAMP = "rt"
+REQUEST_KINDS = (REQUEST_COUNT, REQUEST_TIMESTAMP)
+HISTOGRAM_COUNT = "hn"
+HISTOGRAM_SUM = "hs"
+HISTOGRAM_MIN = "hmin"
+HISTOGRAM_MAX = "hmax"
+HISTOGRAM_BUCKET = "hb"
+WINDOW_BUCKET = "wb"
+WINDOW_SLICE = "ws"
+METRIC_KINDS = (
+    COUNTER, HISTOGRAM_COUNT, HISTOGRAM_SUM, HISTOGRAM_MIN, HISTOGRAM_MAX,
+    HISTOGRAM_BUCKET, WINDOW_BUCKET
+)
+
+_HEADER = struct.Struct("<Q")
+_KEY_LENGTH = struct.Struct("<I")
+_VALUE = struct.Struct("<d")
+
+
+def _aligned(position: int) -> int:
+    return (position + 7) & ~7
+
+
+def _iter_entries(buffer, used: int) -> Iterator[Tuple[str, int, float]]:
+    position = _HEADER.size
+    while position + _KEY_LENGTH.size <= used:
+        (length,) = _KEY_LENGTH.unpack_from(buffer, position)
+        key_end = position + _KEY_LENGTH.size + length
+        value_position = _aligned(key_end)
+        if value_position + _VALUE.size > used:
+            return
+        key = bytes(buffer[position + _KEY_LENGTH.size:key_end]).decode("utf-8")
+        yield key, value_position, _VALUE.unpack_from(buffer, value_position)[0]
+        position = value_position + _VALUE.size
+
+
+class SharedMetricsFile:
+    
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, "a+b")
+        size = os.fstat(self._file.fileno()).st_size
+        if size < INITIAL_FILE_SIZE:
+            self._file.truncate(INITIAL_FILE_SIZE)
+            size = INITIAL_FILE_SIZE
+        self._mmap = mmap.mmap(self._file.fileno(), size)
+        self._used = _HEADER.unpack_from(self._mmap, 0)[0] or _HEADER.size
+        self._positions: Dict[str, int] = {}
+        for key, position, _ in _iter_entries(self._mmap, self._used):
+            self._positions[key] = position
+            if key.startswith((WINDOW_BUCKET + "\t", WINDOW_SLICE + "\t")):
+                _VALUE.pack_into(self._mmap, position, 0.0)
+        _HEADER.pack_into(self._mmap, 0, self._used)
+    
+    def position(self, key: str) -> int:
+        position = self._positions.get(key)
+        if position is None:
+            position = self._append(key)
+        return position
+    
+    def _append(self, key: str) -> int:
+        encoded = key.encode("utf-8")
+        value_position = _aligned(self._used + _KEY_LENGTH.size + len(encoded))
+        end = value_position + _VALUE.size
+        while end > len(self._mmap):
+            self._grow()
+        _KEY_LENGTH.pack_into(self._mmap, self._used, len(encoded))
+        self._mmap[self._used + _KEY_LENGTH.size:self._used + _KEY_LENGTH.size + len(encoded)] = encoded
+        _VALUE.pack_into(self._mmap, value_position, 0.0)
+        # Publish the entry only after it is fully written so readers never see a torn key
+        _HEADER.pack_into(self._mmap, 0, end)
+        self._used = end
+        self._positions[key] = value_position
+        return value_position
+    
+    def _grow(self):
+        size = len(self._mmap) * 2
+        self._mmap.close()
+        self._file.truncate(size)
+        self._mmap = mmap.mmap(self._file.fileno(), size)
+    
+    def get(self, position: int) -> float:
+        return _VALUE.unpack_from(self._mmap, position)[0]
+    
+    def set(self, position: int, value: float):
+        _VALUE.pack_into(self._mmap, position, value)
+    
+    def add(self, position: int, amount: float):
+        _VALUE.pack_into(self._mmap, position, _VALUE.unpack_from(self._mmap, position)[0] + amount)
+    
+    def reset(self, kinds: Tuple[str, ...]):
+        for key, position in self._positions.items():
+            if key.partition("\t")[0] in kinds:
+                _VALUE.pack_into(self._mmap, position, 0.0)
+    
+    def close(self):
+        self._mmap.close()
+        self._file.close()
+
+
+class SharedHistogramWriter:
+    
+    def __init__(self, store: SharedMetricsFile, name: str):
+        self.store = store
+        self.name = name
+        self._indexer = StreamingHistogram()
+        self._count = store.position(f"{HISTOGRAM_COUNT}\t{name}")
+        self._sum = store.position(f"{HISTOGRAM_SUM}\t{name}")
+        self._min = store.position(f"{HISTOGRAM_MIN}\t{name}")
+        self._max = store.position(f"{HISTOGRAM_MAX}\t{name}")
+        self._buckets: Dict[int, int] = {}
+        self._slots: Dict[int, Dict[int, int]] = {}
+        self._slice: Optional[int] = None
+        self._slice_buckets: Dict[int, int] = {}
+    
+    def _start_slice(self, slice_number: int):
+        slot = slice_number % WINDOW_SLOTS
+        buckets = self._slots.setdefault(slot, {})
+        for position in buckets.values():
+            self.store.set(position, 0.0)
+        self.store.set(self.store.position(f"{WINDOW_SLICE}\t{self.name}\t{slot}"), slice_number)
+        self._slice = slice_number
+        self._slice_buckets = buckets
+    
+    def record(self, value: float, now: float):
+        store = self.store
+        index = self._indexer.bucket_index(value)
+        position = self._buckets.get(index)
+        if position is None:
+            position = self._buckets[index] = store.position(f"{HISTOGRAM_BUCKET}\t{self.name}\t{index}")
+        store.add(position, 1)
+        
+        slice_number = int(now // WINDOW_SLICE_SECONDS)
+        if slice_number != self._slice:
+            self._start_slice(slice_number)
+        position = self._slice_buckets.get(index)
+        if position is None:
+            slot = slice_number % WINDOW_SLOTS
+            position = self._slice_buckets[index] = store.position(f"{WINDOW_BUCKET}\t{self.name}\t{slot}\t{index}")
+        store.add(position, 1)
+        
+        first = store.get(self._count) == 0
+        if first or value < store.get(self._min):
+            store.set(self._min, value)
+        if first or value > store.get(self._max):
+            store.set(self._max, value)
+        store.add(self._count, 1)
+        store.add(self._sum, value)
+
+
+class SharedMetricsSnapshot:
+    
+    def __init__(self):
+        self.counters: Dict[str, float] = {}
+        self.request_counts: Dict[str, float] = {}
+        self.request_timestamps: Dict[str, float] = {}
+        self.histograms: Dict[str, Tuple[StreamingHistogram, StreamingHistogram]] = {}
+    
+    def _histogram(self, name: str) -> Tuple[StreamingHistogram, StreamingHistogram]:
+        histograms = self.histograms.get(name)
+        if histograms is None:
+            histograms = self.histograms[name] = (StreamingHistogram(), StreamingHistogram())
+        return histograms
+    
+    def add_file(self, entries: Dict[str, float], current_slice: int):
+        live_slots = set()
+        for key, value in entries.items():
+            kind, _, rest = key.partition("\t")
+            if kind == WINDOW_SLICE and 0 <= current_slice - value <= WINDOW_SLICES:
+                live_slots.add(rest)
+        
+        for key, value in entries.items():
+            kind, _, rest = key.partition("\t")
+            if kind == COUNTER:
+                self.counters[rest] = self.counters.get(rest, 0) + value
+            elif kind == REQUEST_COUNT:
+                self.request_counts[rest] = self.request_counts.get(rest, 0) + value
+            elif kind == REQUEST_TIMESTAMP:
+                self.request_timestamps[rest] = max(value, self.request_timestamps.get(rest, 0))
+            elif kind == HISTOGRAM_BUCKET:
+                name, _, index = rest.rpartition("\t")
+                self._histogram(name)[0].add_bucket(int(index), int(value))
+            elif kind == WINDOW_BUCKET and value:
+                slot_key, _, index = rest.rpartition("\t")
+                if slot_key in live_slots:
+                    name = slot_key.rpartition("\t")[0]
+                    self._histogram(name)[1].add_bucket(int(index), int(value))
+            elif kind in (HISTOGRAM_COUNT, HISTOGRAM_SUM, HISTOGRAM_MIN, HISTOGRAM_MAX):
+                self._add_summary(kind, rest, value, entries)
+    
+    def _add_summary(self, kind: str, name: str, value: float, entries: Dict[str, float]):
+        if not entries.get(f"{HISTOGRAM_COUNT}\t{name}"):
+            return
+        total = self._histogram(name)[0]
+        if kind == HISTOGRAM_COUNT:
+            total.count += int(value)
+        elif kind == HISTOGRAM_SUM:
+            total.sum += value
+        elif kind == HISTOGRAM_MIN:
+            total.min = min(total.min, value)
+        else:
+            total.max = max(total.max, value)
+    
+    def finish(self):
+        for total, window in self.histograms.values():
+            window.count = sum(window._buckets.values())
+            window.sum = math.nan
+            window.min = total.min
+            window.max = total.max
+
+
+def read_shared_file(path: str) -> Dict[str, float]:
+    with open(path, "rb") as shared_file:
+        data = shared_file.read()
+    if len(data) < _HEADER.size:
+        return {}
+    used = min(_HEADER.unpack_from(data, 0)[0], len(data))
+    return {key: value for key, _, value in _iter_entries(data, used)}
+
+
+class SharedMetricsStore:
+    
+    def __init__(self, directory: str):
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.file = SharedMetricsFile(os.path.join(directory, f"metrics-{os.getpid()}.db"))
+        self._histograms: Dict[str, SharedHistogramWriter] = {}
+    
+    def increment(self, kind: str, name: str, amount: float = 1):
+        self.file.add(self.file.position(f"{kind}\t{name}"), amount)
+    
+    def set_max(self, kind: str, name: str, value: float):
+        position = self.file.position(f"{kind}\t{name}")
+        if value > self.file.get(position):
+            self.file.set(position, value)
+    
+    def set(self, kind: str, name: str, value: float):
+        self.file.set(self.file.position(f"{kind}\t{name}"), value)
+    
+    def record(self, name: str, value: float):
+        writer = self._histograms.get(name)
+        if writer is None:
+            writer = self._histograms[name] = SharedHistogramWriter(self.file, name)
+        writer.record(value, time.time())
+    
+    def snapshot(self) -> SharedMetricsSnapshot:
+        snapshot = SharedMetricsSnapshot()
+        current_slice = int(time.time() // WINDOW_SLICE_SECONDS)
+        for path in glob.glob(os.path.join(self.directory, SHARED_FILE_PATTERN)):
+            try:
+                snapshot.add_file(read_shared_file(path), current_slice)
+            except (OSError, ValueError, struct.error) as e:
+                logger.warning(f"SharedMetricsStore: skipping unreadable metrics file {path}: {str(e)}")
+        snapshot.finish()
+        return snapshot
+    
+    def reset(self, kinds: Tuple[str, ...]):
+        self.file.reset(kinds)
+    
+    def close(self):
+        self.file.close()
@@ -0,0 +1,21 @@
+from typing import List
+from datetime import date
+from pydantic import BaseModel, Field
+
+
+class AvailabilityDay(BaseModel):
+    date: date
+    booked: int = 0
+    blocked: bool = False
+    available: bool = True
+
+
+class AvailabilityMonthResponse(BaseModel):
+    vendor_id: str
+    month: str
+    days: List[AvailabilityDay]
+
+
+class AvailabilityBlockRequest(BaseModel):
+    month: str = Field(..., pattern=r"^\d{4}-\d{2}$")
+    blocked_days: List[int] = Field(default_factory=list, max_length=31)
@@ -0,0 +1,33 @@
+from typing import Optional, List, Dict
+from pydantic import BaseModel, Field
+
+
+class BudgetOptimizeRequest(BaseModel):
+    total_budget: float = Field(gt=0, description="Total budget must be greater than 0")
+    categories: List[str] = Field(..., min_length=1, max_length=12)
+    guest_count: Optional[int] = Field(None, gt=0)
+    preferences: Optional[Dict[str, float]] = Field(default=None, description="Relative importance per category")
+    min_rating: Optional[float] = Field(None, ge=0, le=5)
+    top_n: int = Field(default=3, ge=1, le=10)
+
+
+class BudgetSelection(BaseModel):
+    category: str
+    vendor_id: str
+    business_name: str
+    package_name: str
+    price: float
+    rating: float
+
+
+class BudgetPlan(BaseModel):
+    total_cost: float
+    remaining_budget: float
+    score: float
+    selections: List[BudgetSelection]
+
+
+class BudgetOptimizeResponse(BaseModel):
+    total_budget: float
+    guest_count: Optional[int] = None
+    plans: List[BudgetPlan]
@@ -0,0 +1,22 @@
+from typing import Optional
+from datetime import datetime
+from pydantic import BaseModel, Field
+
+
+class AnnouncementRequest(BaseModel):
+    subject: str = Field(..., min_length=1, max_length=200)
+    message: str = Field(..., min_length=1, max_length=20000)
+
+
+class EmailCampaignResponse(BaseModel):
+    id: str = Field(alias="_id")
+    kind: str
+    template: str
+    status: str
+    sent: int = 0
+    failed: int = 0
+    created_at: datetime
+    finished_at: Optional[datetime] = None
+    
+    class Config:
+        populate_by_name = True
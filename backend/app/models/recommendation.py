@@ -0,0 +1,12 @@
+from typing import Optional
+from pydantic import BaseModel
+
+
+class RecommendedVendor(BaseModel):
+    vendor_id: str
+    business_name: str
+    service_category: str
+    business_address: Optional[str] = None
+    image_url: Optional[str] = None
+    rating: float = 0.0
+    score: float
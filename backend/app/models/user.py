@@ -68,3 +68,8 @@ class UserResponse(UserBase):
     class Config:
         from_attributes = True
 
+
+class PasswordUpdateResponse(UserResponse):
+    access_token: str
+    token_type: str = "bearer"
+
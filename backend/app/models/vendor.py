@@ -26,6 +26,7 @@ class VendorBase(BaseModel):
     image_url: Optional[str] = None
     gallery_images: Optional[List[str]] = []
     packages: Optional[List[Dict]] = []
+    daily_capacity: int = Field(default=1, ge=1)
 
 
 class VendorCreate(VendorBase):
@@ -41,6 +42,7 @@ class VendorUpdate(BaseModel):
     image_url: Optional[str] = None
     gallery_images: Optional[List[str]] = None
     packages: Optional[List[Dict]] = None
+    daily_capacity: Optional[int] = Field(None, ge=1)
 
 
 class VendorInDB(VendorBase):
@@ -60,6 +62,14 @@ class VendorResponse(VendorBase):
     is_approved: bool
     is_active: bool
     created_at: datetime
+    city: Optional[str] = None
+    area: Optional[str] = None
+    location: Optional[Dict] = None
+    distance_km: Optional[float] = None
+    min_package_price: Optional[float] = None
+    max_package_price: Optional[float] = None
+    review_count: int = 0
+    ranking_score: Optional[float] = None
     
     class Config:
         from_attributes = True
@@ -0,0 +1,85 @@
+from typing import List, Optional
+from pymongo import ASCENDING
+from pymongo.errors import DuplicateKeyError
+from app.repositories.base_repository import BaseRepository
+
+
+class AvailabilityRepository(BaseRepository):
+    
+    def __init__(self, database):
+        super().__init__(database, "vendor_availability")
+    
+    async def ensure_indexes(self):
+        await self.collection.create_index([("month", ASCENDING), ("vendor_id", ASCENDING)])
+        await self.collection.create_index([("vendor_id", ASCENDING), ("month", ASCENDING)])
+    
+    async def get_month(self, vendor_id: str, month: str) -> Optional[dict]:
+        return await self.collection.find_one({"_id": f"{vendor_id}:{month}"})
+    
+    async def get_months_from(self, vendor_id: str, month: str) -> List[dict]:
+        cursor = self.collection.find({"vendor_id": vendor_id, "month": {"$gte": month}})
+        return await cursor.to_list(length=None)
+    
+    async def reserve_day(self, vendor_id: str, month: str, day: int, capacity: int) -> bool:
+        query = {
+            "_id": f"{vendor_id}:{month}",
+            f"booked.{day}": {"$not": {"$gte": capacity}},
+            "blocked_mask": {"$not": {"$bitsAnySet": [day - 1]}}
+        }
+        update = {
+            "$inc": {f"booked.{day}": 1},
+            "$setOnInsert": {"vendor_id": vendor_id, "month": month, "full_mask": 0, "blocked_mask": 0}
+        }
+        try:
+            result = await self.collection.update_one(query, update, upsert=True)
+        except DuplicateKeyError:
+            # The month document exists (or was inserted concurrently), so the conditional update alone decides.
+            result = await self.collection.update_one(query, {"$inc": update["$inc"]})
+        return result.modified_count == 1 or result.upserted_id is not None
+    
+    async def sync_full_bit(self, vendor_id: str, month: str, day: int, capacity: int):
+        bit = 1 << (day - 1)
+        await self.collection.update_one(
+            {"_id": f"{vendor_id}:{month}", f"booked.{day}": {"$gte": capacity}},
+            {"$bit": {"full_mask": {"or": bit}}}
+        )
+        await self.collection.update_one(
+            {"_id": f"{vendor_id}:{month}", f"booked.{day}": {"$lt": capacity}},
+            {"$bit": {"full_mask": {"and": ~bit}}}
+        )
+    
+    async def release_day(self, vendor_id: str, month: str, day: int):
+        await self.collection.update_one(
+            {"_id": f"{vendor_id}:{month}", f"booked.{day}": {"$gt": 0}},
+            {"$inc": {f"booked.{day}": -1}}
+        )
+    
+    async def set_masks(self, vendor_id: str, month: str, set_bits: int = 0, clear_bits: int = 0, mask_field: str = "full_mask"):
+        operations = []
+        if set_bits:
+            operations.append(("or", set_bits))
+        if clear_bits:
+            operations.append(("and", ~clear_bits))
+        
+        for operation, value in operations:
+            await self.collection.update_one(
+                {"_id": f"{vendor_id}:{month}"},
+                {
+                    "$bit": {mask_field: {operation: value}},
+                    "$setOnInsert": {"vendor_id": vendor_id, "month": month, "booked": {}}
+                },
+                upsert=True
+            )
+    
+    async def get_unavailable_vendor_ids(self, month: str, day: int) -> List[str]:
+        cursor = self.collection.find(
+            {
+                "month": month,
+                "$or": [
+                    {"full_mask": {"$bitsAnySet": [day - 1]}},
+                    {"blocked_mask": {"$bitsAnySet": [day - 1]}}
+                ]
+            },
+            {"_id": 0, "vendor_id": 1}
+        )
+        return [document["vendor_id"] async for document in cursor]
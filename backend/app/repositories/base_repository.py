@@ -35,15 +35,18 @@ class BaseRepository(IRepository[T]):
         self.db = database
         self.collection = database[collection_name]
     
-    async def create(self, entity: dict) -> dict:
-        result = await self.collection.insert_one(entity)
+    async def ensure_indexes(self):
+        pass
+    
+    async def create(self, entity: dict, session=None) -> dict:
+        result = await self.collection.insert_one(entity, session=session)
         entity["_id"] = str(result.inserted_id)
         return entity
     
-    async def get_by_id(self, entity_id: str) -> Optional[dict]:
+    async def get_by_id(self, entity_id: str, session=None) -> Optional[dict]:
         try:
             obj_id = ObjectId(entity_id)
-            entity = await self.collection.find_one({"_id": obj_id})
+            entity = await self.collection.find_one({"_id": obj_id}, session=session)
         except Exception:
             return None
         
@@ -58,13 +61,14 @@ class BaseRepository(IRepository[T]):
             entity["_id"] = str(entity["_id"])
         return entities
     
-    async def update(self, entity_id: str, entity: dict) -> Optional[dict]:
+    async def update(self, entity_id: str, entity: dict, session=None) -> Optional[dict]:
         result = await self.collection.update_one(
             {"_id": ObjectId(entity_id)},
-            {"$set": entity}
+            {"$set": entity},
+            session=session
         )
         if result.matched_count:
-            return await self.get_by_id(entity_id)
+            return await self.get_by_id(entity_id, session)
         return None
     
     async def delete(self, entity_id: str) -> bool:
@@ -1,3 +1,6 @@
+from typing import List, Optional, Tuple
+from datetime import datetime
+from pymongo import ASCENDING, ReturnDocument
 from app.repositories.base_repository import BaseRepository
 
 
@@ -6,6 +9,9 @@ class BookingRepository(BaseRepository):
     def __init__(self, database):
         super().__init__(database, "bookings")
     
+    async def ensure_indexes(self):
+        await self.collection.create_index([("status", ASCENDING), ("created_at", ASCENDING)])
+    
     async def get_by_user_id(self, user_id: str, skip: int = 0, limit: int = 100):
         from bson import ObjectId
         try:
@@ -33,3 +39,44 @@ class BookingRepository(BaseRepository):
     async def get_by_status(self, status: str, skip: int = 0, limit: int = 100):
         return await self.find_many({"status": status}, skip, limit)
 
+    
+    async def get_user_vendor_pairs(self, statuses: list):
+        cursor = self.collection.find(
+            {"status": {"$in": statuses}},
+            {"_id": 0, "user_id": 1, "vendor_id": 1}
+        )
+        return [(str(b["user_id"]), str(b["vendor_id"])) async for b in cursor if b.get("user_id") and b.get("vendor_id")]
+    
+    async def transition(
+        self,
+        booking_id: str,
+        from_statuses: List[str],
+        to_status: str,
+        vendor_id: Optional[str] = None,
+        user_id: Optional[str] = None,
+        session=None
+    ) -> Optional[Tuple[str, dict]]:
+        from bson import ObjectId
+        
+        try:
+            query = {"_id": ObjectId(booking_id), "status": {"$in": from_statuses}}
+        except:
+            return None
+        for field, owner_id in (("vendor_id", vendor_id), ("user_id", user_id)):
+            if owner_id:
+                query[field] = {"$in": [ObjectId(owner_id), owner_id] if ObjectId.is_valid(owner_id) else [owner_id]}
+        
+        changes = {"status": to_status, "updated_at": datetime.utcnow()}
+        booking = await self.collection.find_one_and_update(
+            query,
+            {"$set": changes},
+            return_document=ReturnDocument.BEFORE,
+            session=session
+        )
+        if not booking:
+            return None
+        
+        old_status = booking.get("status")
+        booking.update(changes)
+        booking["_id"] = str(booking["_id"])
+        return old_status, booking
@@ -0,0 +1,77 @@
+from typing import Optional
+from datetime import datetime
+from bson import ObjectId
+from pymongo import ASCENDING, DESCENDING
+from pymongo.errors import DuplicateKeyError
+from app.repositories.base_repository import BaseRepository
+
+CAMPAIGN_STATUS_QUEUED = "queued"
+CAMPAIGN_STATUS_SENDING = "sending"
+CAMPAIGN_STATUS_DONE = "done"
+
+
+class EmailCampaignRepository(BaseRepository):
+    
+    def __init__(self, database):
+        super().__init__(database, "email_campaigns")
+    
+    async def ensure_indexes(self):
+        await self.collection.create_index([("dedupe_key", ASCENDING)], unique=True, sparse=True)
+        await self.collection.create_index([("status", ASCENDING), ("created_at", DESCENDING)])
+    
+    async def create_campaign(
+        self,
+        kind: str,
+        template: str,
+        source: dict,
+        context: Optional[dict] = None,
+        dedupe_key: Optional[str] = None
+    ) -> Optional[dict]:
+        campaign = {
+            "kind": kind,
+            "template": template,
+            "source": source,
+            "context": context or {},
+            "status": CAMPAIGN_STATUS_QUEUED,
+            "last_recipient_id": None,
+            "sent": 0,
+            "failed": 0,
+            "created_at": datetime.utcnow()
+        }
+        if dedupe_key:
+            campaign["dedupe_key"] = dedupe_key
+        try:
+            result = await self.collection.insert_one(campaign)
+        except DuplicateKeyError:
+            return None
+        campaign["_id"] = str(result.inserted_id)
+        return campaign
+    
+    async def get_by_dedupe_key(self, dedupe_key: str) -> Optional[dict]:
+        campaign = await self.collection.find_one({"dedupe_key": dedupe_key})
+        if campaign:
+            campaign["_id"] = str(campaign["_id"])
+        return campaign
+    
+    async def advance(self, campaign_id: str, previous_recipient_id, last_recipient_id, sent: int, failed: int) -> bool:
+        result = await self.collection.update_one(
+            {"_id": ObjectId(campaign_id), "last_recipient_id": previous_recipient_id},
+            {
+                "$set": {"last_recipient_id": last_recipient_id, "status": CAMPAIGN_STATUS_SENDING, "updated_at": datetime.utcnow()},
+                "$inc": {"sent": sent, "failed": failed}
+            }
+        )
+        return result.modified_count == 1
+    
+    async def finish(self, campaign_id: str):
+        await self.collection.update_one(
+            {"_id": ObjectId(campaign_id)},
+            {"$set": {"status": CAMPAIGN_STATUS_DONE, "finished_at": datetime.utcnow()}}
+        )
+    
+    async def get_recent(self, skip: int = 0, limit: int = 50):
+        cursor = self.collection.find({}).sort("created_at", DESCENDING).skip(skip).limit(limit)
+        campaigns = await cursor.to_list(length=limit)
+        for campaign in campaigns:
+            campaign["_id"] = str(campaign["_id"])
+        return campaigns
@@ -57,3 +57,7 @@ class FavoriteRepository(BaseRepository):
         result = await self.collection.delete_one({"user_id": user_obj_id, "vendor_id": vendor_obj_id})
         return result.deleted_count > 0
 
+    
+    async def get_user_vendor_pairs(self):
+        cursor = self.collection.find({}, {"_id": 0, "user_id": 1, "vendor_id": 1})
+        return [(str(f["user_id"]), str(f["vendor_id"])) async for f in cursor if f.get("user_id") and f.get("vendor_id")]
@@ -0,0 +1,28 @@
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from app.repositories.vendor_repository import VendorRepository
+from app.repositories.availability_repository import AvailabilityRepository
+from app.repositories.job_repository import JobRepository
+from app.repositories.outbox_repository import OutboxRepository
+from app.repositories.booking_repository import BookingRepository
+from app.repositories.review_repository import ReviewRepository
+from app.repositories.email_campaign_repository import EmailCampaignRepository
+from app.repositories.vendor_digest_repository import VendorDigestRepository
+from app.repositories.token_revocation_repository import TokenRevocationRepository
+from app.repositories.rate_limit_repository import RateLimitRepository
+
+
+async def ensure_indexes(database: AsyncIOMotorDatabase):
+    repositories = [
+        VendorRepository(database),
+        AvailabilityRepository(database),
+        JobRepository(database),
+        OutboxRepository(database),
+        BookingRepository(database),
+        ReviewRepository(database),
+        EmailCampaignRepository(database),
+        VendorDigestRepository(database),
+        TokenRevocationRepository(database),
+        RateLimitRepository(database),
+    ]
+    for repository in repositories:
+        await repository.ensure_indexes()
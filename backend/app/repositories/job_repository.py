@@ -0,0 +1,97 @@
+from typing import Optional
+from datetime import datetime, timedelta
+from pymongo import ASCENDING, ReturnDocument
+from pymongo.errors import DuplicateKeyError
+from app.repositories.base_repository import BaseRepository
+
+JOB_STATUS_QUEUED = "queued"
+JOB_STATUS_RUNNING = "running"
+JOB_STATUS_DONE = "done"
+JOB_STATUS_DEAD = "dead"
+FINISHED_JOB_TTL_SECONDS = 24 * 3600
+
+
+class JobRepository(BaseRepository):
+    
+    def __init__(self, database):
+        super().__init__(database, "jobs")
+    
+    async def ensure_indexes(self):
+        await self.collection.create_index([("status", ASCENDING), ("run_at", ASCENDING)])
+        await self.collection.create_index(
+            [("dedupe_key", ASCENDING)],
+            unique=True,
+            partialFilterExpression={"status": JOB_STATUS_QUEUED, "dedupe_key": {"$type": "string"}}
+        )
+        await self.collection.create_index(
+            [("finished_at", ASCENDING)],
+            expireAfterSeconds=FINISHED_JOB_TTL_SECONDS,
+            partialFilterExpression={"status": JOB_STATUS_DONE}
+        )
+    
+    async def enqueue(self, job_type: str, payload: dict, dedupe_key: Optional[str] = None, delay_seconds: float = 0, max_attempts: int = 5) -> bool:
+        now = datetime.utcnow()
+        job = {
+            "type": job_type,
+            "payload": payload,
+            "status": JOB_STATUS_QUEUED,
+            "attempts": 0,
+            "max_attempts": max_attempts,
+            "run_at": now + timedelta(seconds=delay_seconds),
+            "created_at": now
+        }
+        if not dedupe_key:
+            await self.collection.insert_one(job)
+            return True
+        
+        job["dedupe_key"] = dedupe_key
+        try:
+            result = await self.collection.update_one(
+                {"dedupe_key": dedupe_key, "status": JOB_STATUS_QUEUED},
+                {"$setOnInsert": job},
+                upsert=True
+            )
+        except DuplicateKeyError:
+            return False
+        return result.upserted_id is not None
+    
+    async def claim(self, worker_id: str, lease_seconds: float) -> Optional[dict]:
+        now = datetime.utcnow()
+        return await self.collection.find_one_and_update(
+            {
+                "$or": [
+                    {"status": JOB_STATUS_QUEUED, "run_at": {"$lte": now}},
+                    {"status": JOB_STATUS_RUNNING, "run_at": {"$lte": now}}
+                ]
+            },
+            {
+                "$set": {"status": JOB_STATUS_RUNNING, "worker_id": worker_id, "run_at": now + timedelta(seconds=lease_seconds)},
+                "$inc": {"attempts": 1}
+            },
+            sort=[("run_at", ASCENDING)],
+            return_document=ReturnDocument.AFTER
+        )
+    
+    async def complete(self, job_id):
+        await self.collection.update_one(
+            {"_id": job_id},
+            {"$set": {"status": JOB_STATUS_DONE, "finished_at": datetime.utcnow()}, "$unset": {"dedupe_key": ""}}
+        )
+    
+    async def fail(self, job: dict, error: str, retry_delay_seconds: float):
+        if job["attempts"] >= job.get("max_attempts", 1):
+            update = {"$set": {"status": JOB_STATUS_DEAD, "error": error, "finished_at": datetime.utcnow()}, "$unset": {"dedupe_key": ""}}
+        else:
+            update = {"$set": {"status": JOB_STATUS_QUEUED, "error": error, "run_at": datetime.utcnow() + timedelta(seconds=retry_delay_seconds)}}
+        try:
+            await self.collection.update_one({"_id": job["_id"]}, update)
+        except DuplicateKeyError:
+            # A newer coalesced job for the same key was queued meanwhile; it supersedes this retry.
+            await self.collection.update_one(
+                {"_id": job["_id"]},
+                {"$set": {"status": JOB_STATUS_DONE, "error": error, "finished_at": datetime.utcnow()}, "$unset": {"dedupe_key": ""}}
+            )
+    
+    async def count_by_status(self) -> dict:
+        pipeline = [{"$group": {"_id": "$status", "count": {"$sum": 1}}}]
+        return {row["_id"]: row["count"] async for row in self.collection.aggregate(pipeline)}
@@ -0,0 +1,116 @@
+from typing import Dict, List, Tuple
+from datetime import datetime, timedelta
+from uuid import uuid4
+from pymongo import ASCENDING, UpdateOne
+from app.repositories.base_repository import BaseRepository
+
+OUTBOX_STATUS_PENDING = "pending"
+OUTBOX_STATUS_PROCESSING = "processing"
+OUTBOX_STATUS_DELIVERED = "delivered"
+OUTBOX_STATUS_FAILED = "failed"
+DELIVERED_EVENT_TTL_SECONDS = 7 * 24 * 3600
+
+
+class OutboxRepository(BaseRepository):
+    
+    def __init__(self, database):
+        super().__init__(database, "outbox")
+    
+    async def ensure_indexes(self):
+        await self.collection.create_index([("status", ASCENDING), ("created_at", ASCENDING)])
+        await self.collection.create_index([("claimed_by", ASCENDING)], sparse=True)
+        await self.collection.create_index(
+            [("delivered_at", ASCENDING)],
+            expireAfterSeconds=DELIVERED_EVENT_TTL_SECONDS,
+            partialFilterExpression={"status": OUTBOX_STATUS_DELIVERED}
+        )
+    
+    async def add(self, event_type: str, data: dict, session=None) -> str:
+        event_id = uuid4().hex
+        await self.collection.insert_one({
+            "_id": event_id,
+            "event_type": event_type,
+            "data": data,
+            "status": OUTBOX_STATUS_PENDING,
+            "attempts": 0,
+            "created_at": datetime.utcnow()
+        }, session=session)
+        return event_id
+    
+    async def claim_batch(self, limit: int, lease_seconds: float) -> List[dict]:
+        now = datetime.utcnow()
+        # Pending events waiting out a retry backoff are skipped until retry_at has passed
+        claimable = {
+            "$or": [
+                {"status": OUTBOX_STATUS_PENDING, "retry_at": {"$not": {"$gt": now}}},
+                {"status": OUTBOX_STATUS_PROCESSING, "lease_until": {"$lt": now}}
+            ]
+        }
+        cursor = self.collection.find(claimable, {"_id": 1}).sort("created_at", ASCENDING).limit(limit)
+        candidate_ids = [document["_id"] async for document in cursor]
+        if not candidate_ids:
+            return []
+        
+        token = uuid4().hex
+        await self.collection.update_many(
+            {"_id": {"$in": candidate_ids}, **claimable},
+            {
+                "$set": {"status": OUTBOX_STATUS_PROCESSING, "claimed_by": token, "lease_until": now + timedelta(seconds=lease_seconds)},
+                "$inc": {"attempts": 1}
+            }
+        )
+        cursor = self.collection.find({"claimed_by": token, "status": OUTBOX_STATUS_PROCESSING}).sort("created_at", ASCENDING)
+        return await cursor.to_list(length=limit)
+    
+    async def acknowledge(self, event_id: str, observer_name: str):
+        await self.collection.update_one({"_id": event_id}, {"$addToSet": {"delivered_to": observer_name}})
+    
+    async def mark_delivered(self, delivered_to: Dict[str, List[str]]):
+        if not delivered_to:
+            return
+        now = datetime.utcnow()
+        await self.collection.bulk_write([
+            UpdateOne(
+                {"_id": event_id},
+                {
+                    "$set": {"status": OUTBOX_STATUS_DELIVERED, "delivered_at": now},
+                    "$unset": {"claimed_by": "", "lease_until": "", "retry_at": ""},
+                    "$addToSet": {"delivered_to": {"$each": observer_names}}
+                }
+            )
+            for event_id, observer_names in delivered_to.items()
+        ], ordered=False)
+    
+    async def release(self, retries: Dict[str, Tuple[List[str], datetime]]):
+        if not retries:
+            return
+        await self.collection.bulk_write([
+            UpdateOne(
+                {"_id": event_id},
+                {
+                    "$set": {"status": OUTBOX_STATUS_PENDING, "retry_at": retry_at},
+                    "$unset": {"claimed_by": "", "lease_until": ""},
+                    "$addToSet": {"delivered_to": {"$each": observer_names}}
+                }
+            )
+            for event_id, (observer_names, retry_at) in retries.items()
+        ], ordered=False)
+    
+    async def dead_letter(self, failed: Dict[str, List[str]]):
+        if not failed:
+            return
+        now = datetime.utcnow()
+        await self.collection.bulk_write([
+            UpdateOne(
+                {"_id": event_id},
+                {
+                    "$set": {"status": OUTBOX_STATUS_FAILED, "failed_at": now},
+                    "$unset": {"claimed_by": "", "lease_until": "", "retry_at": ""},
+                    "$addToSet": {"delivered_to": {"$each": observer_names}}
+                }
+            )
+            for event_id, observer_names in failed.items()
+        ], ordered=False)
+    
+    async def count_pending(self) -> int:
+        return await self.collection.count_documents({"status": {"$in": [OUTBOX_STATUS_PENDING, OUTBOX_STATUS_PROCESSING]}})
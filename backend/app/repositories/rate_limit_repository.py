@@ -0,0 +1,36 @@
+from typing import Tuple
+from datetime import datetime, timedelta
+from pymongo import ASCENDING, ReturnDocument
+from app.repositories.base_repository import BaseRepository
+
+
+class RateLimitRepository(BaseRepository):
+    
+    def __init__(self, database):
+        super().__init__(database, "rate_limits")
+    
+    async def ensure_indexes(self):
+        await self.collection.create_index([("expires_at", ASCENDING)], expireAfterSeconds=0)
+    
+    async def take(self, key: str, capacity: float, rate: float, now: float) -> Tuple[bool, float]:
+        refilled = {"$min": [
+            capacity,
+            {"$add": [
+                {"$ifNull": ["$tokens", capacity]},
+                {"$multiply": [{"$max": [0, {"$subtract": [now, {"$ifNull": ["$updated", now]}]}]}, rate]}
+            ]}
+        ]}
+        bucket = await self.collection.find_one_and_update(
+            {"_id": key},
+            [
+                {"$set": {"tokens": refilled, "updated": now}},
+                {"$set": {"allowed": {"$gte": ["$tokens", 1]}}},
+                {"$set": {
+                    "tokens": {"$cond": ["$allowed", {"$subtract": ["$tokens", 1]}, "$tokens"]},
+                    "expires_at": datetime.utcnow() + timedelta(seconds=capacity / rate)
+                }}
+            ],
+            upsert=True,
+            return_document=ReturnDocument.AFTER
+        )
+        return bucket["allowed"], bucket["tokens"]
@@ -0,0 +1,32 @@
+from typing import List
+from datetime import datetime
+from pymongo import ReplaceOne
+from app.repositories.base_repository import BaseRepository
+
+
+class RecommendationRepository(BaseRepository):
+    
+    def __init__(self, database, collection_name: str = "vendor_recommendations"):
+        super().__init__(database, collection_name)
+    
+    async def get_for(self, owner_id: str) -> List[dict]:
+        document = await self.collection.find_one({"_id": owner_id}, {"recommendations": 1})
+        if not document:
+            return []
+        return document.get("recommendations", [])
+    
+    async def replace_all(self, recommendations: dict, built_at: datetime, batch_size: int = 1000):
+        operations = []
+        for owner_id, items in recommendations.items():
+            operations.append(ReplaceOne(
+                {"_id": owner_id},
+                {"_id": owner_id, "recommendations": items, "built_at": built_at},
+                upsert=True
+            ))
+            if len(operations) >= batch_size:
+                await self.collection.bulk_write(operations, ordered=False)
+                operations = []
+        if operations:
+            await self.collection.bulk_write(operations, ordered=False)
+        
+        await self.collection.delete_many({"built_at": {"$lt": built_at}})
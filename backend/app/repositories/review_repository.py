@@ -1,5 +1,9 @@
+from pymongo import ASCENDING
 from app.repositories.base_repository import BaseRepository
 from bson import ObjectId
+import logging
+
+logger = logging.getLogger(__name__)
 
 
 class ReviewRepository(BaseRepository):
@@ -7,6 +11,9 @@ class ReviewRepository(BaseRepository):
     def __init__(self, database):
         super().__init__(database, "reviews")
     
+    async def ensure_indexes(self):
+        await self.collection.create_index([("created_at", ASCENDING)])
+    
     async def get_by_vendor_id(self, vendor_id: str, skip: int = 0, limit: int = 100):
         reviews = []
         
@@ -16,14 +23,14 @@ class ReviewRepository(BaseRepository):
             if reviews:
                 return reviews
         except Exception as e:
-            print(f"[DEBUG] ObjectId query failed for vendor_id {vendor_id}: {e}")
+            logger.debug(f"ObjectId query failed for vendor_id {vendor_id}: {e}")
         
         try:
             reviews = await self.find_many({"vendor_id": vendor_id}, skip, limit)
             if reviews:
                 return reviews
         except Exception as e:
-            print(f"[DEBUG] String query failed for vendor_id {vendor_id}: {e}")
+            logger.debug(f"String query failed for vendor_id {vendor_id}: {e}")
         
         try:
             vendor_obj_id = ObjectId(vendor_id)
@@ -35,7 +42,7 @@ class ReviewRepository(BaseRepository):
             if reviews_list:
                 return reviews_list
         except Exception as e:
-            print(f"[DEBUG] Direct MongoDB ObjectId query failed: {e}")
+            logger.debug(f"Direct MongoDB ObjectId query failed: {e}")
         
         try:
             cursor = self.collection.find({"vendor_id": vendor_id}).skip(skip).limit(limit)
@@ -45,7 +52,7 @@ class ReviewRepository(BaseRepository):
                     review["_id"] = str(review["_id"])
             return reviews_list
         except Exception as e:
-            print(f"[DEBUG] Direct MongoDB string query failed: {e}")
+            logger.debug(f"Direct MongoDB string query failed: {e}")
         
         return []
     
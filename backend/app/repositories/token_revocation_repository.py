@@ -0,0 +1,35 @@
+from typing import List
+from datetime import datetime
+from pymongo import ASCENDING
+from app.repositories.base_repository import BaseRepository
+
+
+class TokenRevocationRepository(BaseRepository):
+    
+    def __init__(self, database):
+        super().__init__(database, "token_revocations")
+    
+    async def ensure_indexes(self):
+        await self.collection.create_index([("updated_at", ASCENDING)])
+        await self.collection.create_index([("expires_at", ASCENDING)], expireAfterSeconds=0)
+    
+    async def revoke_user(self, user_id: str, valid_after: float, expires_at: datetime):
+        await self.collection.update_one(
+            {"_id": f"user:{user_id}"},
+            {
+                "$max": {"valid_after": valid_after, "expires_at": expires_at},
+                "$set": {"kind": "user", "key": user_id, "updated_at": datetime.utcnow()}
+            },
+            upsert=True
+        )
+    
+    async def revoke_token(self, jti: str, expires_at: datetime):
+        await self.collection.update_one(
+            {"_id": f"jti:{jti}"},
+            {"$set": {"kind": "jti", "key": jti, "expires_at": expires_at, "updated_at": datetime.utcnow()}},
+            upsert=True
+        )
+    
+    async def get_changed_since(self, since: datetime) -> List[dict]:
+        cursor = self.collection.find({"updated_at": {"$gte": since}})
+        return await cursor.to_list(length=None)
@@ -1,6 +1,9 @@
 from typing import Optional
+from bson import ObjectId
 from app.repositories.base_repository import BaseRepository
 
+PRINCIPAL_PROJECTION = {"role": 1, "is_active": 1, "full_name": 1}
+
 
 class UserRepository(BaseRepository):
     
@@ -12,4 +15,13 @@ class UserRepository(BaseRepository):
     
     async def get_by_role(self, role: str, skip: int = 0, limit: int = 100):
         return await self.find_many({"role": role}, skip, limit)
+    
+    async def get_principal(self, user_id: str) -> Optional[dict]:
+        try:
+            user = await self.collection.find_one({"_id": ObjectId(user_id)}, PRINCIPAL_PROJECTION)
+        except Exception:
+            return None
+        if user:
+            user["_id"] = str(user["_id"])
+        return user
 
@@ -0,0 +1,91 @@
+from datetime import datetime
+from pymongo import ASCENDING
+from app.repositories.base_repository import BaseRepository
+
+DIGEST_TTL_SECONDS = 7 * 24 * 3600
+DIGEST_ITEM_LIMIT = 10
+
+
+def _as_object_id(field: str) -> dict:
+    return {"$convert": {"input": field, "to": "objectId", "onError": None, "onNull": None}}
+
+
+def _items_of_kind(kind: str) -> dict:
+    return {"$slice": [{"$filter": {"input": "$items", "cond": {"$eq": ["$$this.kind", kind]}}}, DIGEST_ITEM_LIMIT]}
+
+
+class VendorDigestRepository(BaseRepository):
+    
+    def __init__(self, database):
+        super().__init__(database, "vendor_digests")
+    
+    async def ensure_indexes(self):
+        await self.collection.create_index([("window", ASCENDING), ("_id", ASCENDING)])
+        await self.collection.create_index([("created_at", ASCENDING)], expireAfterSeconds=DIGEST_TTL_SECONDS)
+    
+    async def build_window(self, window: str, start: datetime, end: datetime):
+        created_window = {"created_at": {"$gte": start, "$lt": end}}
+        pipeline = [
+            {"$match": {"status": "pending", **created_window}},
+            {"$project": {
+                "vendor_id": _as_object_id("$vendor_id"),
+                "kind": {"$literal": "booking"},
+                "created_at": 1,
+                "event_date": 1,
+                "event_location": 1,
+                "package_name": 1,
+                "guest_count": 1,
+                "total_amount": 1
+            }},
+            {"$unionWith": {"coll": "reviews", "pipeline": [
+                {"$match": created_window},
+                {"$project": {
+                    "vendor_id": _as_object_id("$vendor_id"),
+                    "kind": {"$literal": "review"},
+                    "created_at": 1,
+                    "rating": 1,
+                    "comment": 1
+                }}
+            ]}},
+            {"$match": {"vendor_id": {"$ne": None}}},
+            {"$sort": {"created_at": 1}},
+            {"$group": {
+                "_id": "$vendor_id",
+                "items": {"$push": "$$ROOT"},
+                "booking_count": {"$sum": {"$cond": [{"$eq": ["$kind", "booking"]}, 1, 0]}},
+                "review_count": {"$sum": {"$cond": [{"$eq": ["$kind", "review"]}, 1, 0]}},
+                "rating_sum": {"$sum": {"$cond": [{"$eq": ["$kind", "review"]}, "$rating", 0]}}
+            }},
+            {"$lookup": {
+                "from": "vendors",
+                "localField": "_id",
+                "foreignField": "_id",
+                "pipeline": [{"$project": {"email": 1, "business_name": 1}}],
+                "as": "vendor"
+            }},
+            {"$unwind": "$vendor"},
+            {"$match": {"vendor.email": {"$type": "string"}}},
+            {"$project": {
+                "_id": {"$concat": [window, ":", {"$toString": "$_id"}]},
+                "window": window,
+                "vendor_id": "$_id",
+                "email": "$vendor.email",
+                "business_name": "$vendor.business_name",
+                "booking_count": 1,
+                "review_count": 1,
+                "rating_sum": 1,
+                "bookings": _items_of_kind("booking"),
+                "reviews": _items_of_kind("review"),
+                "created_at": {"$literal": datetime.utcnow()}
+            }},
+            {"$merge": {"into": "vendor_digests", "whenMatched": "replace", "whenNotMatched": "insert"}}
+        ]
+        await self.db["bookings"].aggregate(pipeline).to_list(length=None)
+    
+    async def stream_window(self, window: str, after_id=None, limit: int = 100):
+        query = {"window": window}
+        if after_id is not None:
+            query["_id"] = {"$gt": after_id}
+        cursor = self.collection.find(query).sort("_id", ASCENDING).limit(limit)
+        async for digest in cursor:
+            yield digest
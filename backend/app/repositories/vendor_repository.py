@@ -1,4 +1,5 @@
-from typing import List
+from typing import List, Optional, Tuple
+from pymongo import ASCENDING, DESCENDING, GEOSPHERE, ReturnDocument
 from app.repositories.base_repository import BaseRepository
 
 
@@ -7,6 +8,17 @@ class VendorRepository(BaseRepository):
     def __init__(self, database):
         super().__init__(database, "vendors")
     
+    async def ensure_indexes(self):
+        await self.collection.create_index([("location", GEOSPHERE)])
+        await self.collection.create_index([("service_category", ASCENDING), ("min_package_price", ASCENDING)])
+        await self.collection.create_index([("packages.price", ASCENDING)])
+        await self.collection.create_index([
+            ("service_category", ASCENDING),
+            ("is_approved", ASCENDING),
+            ("is_active", ASCENDING),
+            ("ranking_score", DESCENDING)
+        ])
+    
     async def get_by_user_id(self, user_id: str):
         from bson import ObjectId
         
@@ -48,11 +60,11 @@ class VendorRepository(BaseRepository):
     async def get_pending_approvals(self, skip: int = 0, limit: int = 100):
         return await self.find_many({"is_approved": False, "is_active": True}, skip, limit)
     
-    async def approve_vendor(self, vendor_id: str):
-        return await self.update(vendor_id, {"is_approved": True, "is_active": True})
+    async def approve_vendor(self, vendor_id: str, session=None):
+        return await self.update(vendor_id, {"is_approved": True, "is_active": True}, session)
     
-    async def reject_vendor(self, vendor_id: str):
-        return await self.update(vendor_id, {"is_approved": False, "is_active": False})
+    async def reject_vendor(self, vendor_id: str, session=None):
+        return await self.update(vendor_id, {"is_approved": False, "is_active": False}, session)
     
     async def get_all_vendors_with_status(self, status_filter: str = None, skip: int = 0, limit: int = 100):
         query = {}
@@ -65,3 +77,106 @@ class VendorRepository(BaseRepository):
         
         return await self.find_many(query, skip, limit)
 
+    
+    async def get_package_catalog(self, categories: List[str]):
+        cursor = self.collection.find(
+            {"service_category": {"$in": categories}, "is_approved": True, "is_active": True},
+            {"business_name": 1, "service_category": 1, "rating": 1, "packages.name": 1, "packages.price": 1, "packages.max_guests": 1}
+        )
+        vendors = await cursor.to_list(length=None)
+        for vendor in vendors:
+            vendor["_id"] = str(vendor["_id"])
+        return vendors
+    
+    async def search(self, query: dict, sort: Optional[List[Tuple[str, int]]] = None, skip: int = 0, limit: int = 100):
+        cursor = self.collection.find(query)
+        if sort:
+            cursor = cursor.sort(sort)
+        vendors = await cursor.skip(skip).limit(limit).to_list(length=limit)
+        for vendor in vendors:
+            vendor["_id"] = str(vendor["_id"])
+        return vendors
+    
+    async def find_near(
+        self,
+        coordinates: Tuple[float, float],
+        max_distance_m: float,
+        query: dict,
+        sort: Optional[List[Tuple[str, int]]] = None,
+        skip: int = 0,
+        limit: int = 100
+    ):
+        pipeline = [
+            {
+                "$geoNear": {
+                    "near": {"type": "Point", "coordinates": list(coordinates)},
+                    "distanceField": "distance_m",
+                    "maxDistance": max_distance_m,
+                    "query": query,
+                    "spherical": True
+                }
+            }
+        ]
+        if sort:
+            pipeline.append({"$sort": dict(sort)})
+        pipeline += [{"$skip": skip}, {"$limit": limit}]
+        vendors = await self.collection.aggregate(pipeline).to_list(length=limit)
+        for vendor in vendors:
+            vendor["_id"] = str(vendor["_id"])
+            vendor["distance_km"] = round(vendor.pop("distance_m") / 1000, 2)
+        return vendors
+    
+    async def get_summaries(self, query: dict):
+        cursor = self.collection.find(
+            query,
+            {"business_name": 1, "service_category": 1, "image_url": 1, "rating": 1, "business_address": 1}
+        )
+        vendors = await cursor.to_list(length=None)
+        for vendor in vendors:
+            vendor["_id"] = str(vendor["_id"])
+        return vendors
+    
+    async def increment_fields(self, vendor_id: str, increments: dict):
+        from bson import ObjectId
+        
+        try:
+            vendor_obj_id = ObjectId(vendor_id)
+        except:
+            return None
+        
+        vendor = await self.collection.find_one_and_update(
+            {"_id": vendor_obj_id},
+            {"$inc": increments},
+            projection={"service_category": 1, "review_count": 1, "rating_sum": 1, "booking_activity": 1},
+            return_document=ReturnDocument.AFTER
+        )
+        if vendor:
+            vendor["_id"] = str(vendor["_id"])
+        return vendor
+    
+    async def get_rating_totals(self) -> dict:
+        pipeline = [
+            {"$match": {"review_count": {"$gt": 0}}},
+            {"$group": {"_id": None, "rating_sum": {"$sum": "$rating_sum"}, "review_count": {"$sum": "$review_count"}}}
+        ]
+        totals = await self.collection.aggregate(pipeline).to_list(length=1)
+        if not totals:
+            return {"rating_sum": 0.0, "review_count": 0}
+        return {"rating_sum": totals[0]["rating_sum"], "review_count": totals[0]["review_count"]}
+    
+    async def get_leaderboard(self, category: str, limit: int = 10):
+        cursor = self.collection.find(
+            {"service_category": category, "is_approved": True, "is_active": True}
+        ).sort([("ranking_score", DESCENDING)]).limit(limit)
+        vendors = await cursor.to_list(length=limit)
+        for vendor in vendors:
+            vendor["_id"] = str(vendor["_id"])
+        return vendors
+    
+    async def stream_contacts(self, after_id=None, limit: int = 100):
+        query = {"is_approved": True, "is_active": True, "email": {"$type": "string"}}
+        if after_id is not None:
+            query["_id"] = {"$gt": after_id}
+        cursor = self.collection.find(query, {"email": 1, "business_name": 1}).sort("_id", ASCENDING).limit(limit)
+        async for vendor in cursor:
+            yield vendor
@@ -0,0 +1,88 @@
+import calendar
+from datetime import date, datetime
+from typing import List, Union
+from app.repositories.availability_repository import AvailabilityRepository
+from app.repositories.vendor_repository import VendorRepository
+from app.core.exceptions import SlotUnavailableException
+
+DEFAULT_DAILY_CAPACITY = 1
+
+
+def month_key(day: Union[date, datetime]) -> str:
+    return f"{day.year:04d}-{day.month:02d}"
+
+
+def parse_month(month: str) -> tuple:
+    try:
+        parsed = datetime.strptime(month, "%Y-%m")
+    except (TypeError, ValueError):
+        raise ValueError("Month must be in YYYY-MM format")
+    return parsed.year, parsed.month
+
+
+class AvailabilityService:
+    
+    def __init__(self, availability_repository: AvailabilityRepository, vendor_repository: VendorRepository):
+        self.availability_repo = availability_repository
+        self.vendor_repo = vendor_repository
+    
+    async def get_capacity(self, vendor_id: str) -> int:
+        vendor = await self.vendor_repo.get_by_id(vendor_id)
+        if not vendor:
+            raise ValueError("Vendor not found")
+        return int(vendor.get("daily_capacity") or DEFAULT_DAILY_CAPACITY)
+    
+    async def get_month(self, vendor_id: str, month: str) -> dict:
+        year, month_number = parse_month(month)
+        document = await self.availability_repo.get_month(vendor_id, month) or {}
+        booked = document.get("booked", {})
+        unavailable = document.get("full_mask", 0) | document.get("blocked_mask", 0)
+        
+        days = []
+        for day in range(1, calendar.monthrange(year, month_number)[1] + 1):
+            days.append({
+                "date": date(year, month_number, day),
+                "booked": booked.get(str(day), 0),
+                "blocked": bool(document.get("blocked_mask", 0) >> (day - 1) & 1),
+                "available": not unavailable >> (day - 1) & 1
+            })
+        return {"vendor_id": vendor_id, "month": month, "days": days}
+    
+    async def reserve(self, vendor_id: str, day: Union[date, datetime]):
+        capacity = await self.get_capacity(vendor_id)
+        month = month_key(day)
+        if not await self.availability_repo.reserve_day(vendor_id, month, day.day, capacity):
+            raise SlotUnavailableException()
+        await self.availability_repo.sync_full_bit(vendor_id, month, day.day, capacity)
+    
+    async def release(self, vendor_id: str, day: Union[date, datetime]):
+        capacity = await self.get_capacity(vendor_id)
+        month = month_key(day)
+        await self.availability_repo.release_day(vendor_id, month, day.day)
+        await self.availability_repo.sync_full_bit(vendor_id, month, day.day, capacity)
+    
+    async def set_blocked_days(self, vendor_id: str, month: str, blocked_days: List[int]) -> dict:
+        year, month_number = parse_month(month)
+        days_in_month = calendar.monthrange(year, month_number)[1]
+        if any(day < 1 or day > days_in_month for day in blocked_days):
+            raise ValueError(f"Blocked days must be between 1 and {days_in_month}")
+        
+        blocked_mask = 0
+        for day in blocked_days:
+            blocked_mask |= 1 << (day - 1)
+        all_days = (1 << days_in_month) - 1
+        
+        await self.availability_repo.set_masks(vendor_id, month, set_bits=blocked_mask, clear_bits=all_days & ~blocked_mask, mask_field="blocked_mask")
+        return await self.get_month(vendor_id, month)
+    
+    async def refresh_capacity(self, vendor_id: str, capacity: int):
+        for document in await self.availability_repo.get_months_from(vendor_id, month_key(datetime.utcnow())):
+            full_bits = 0
+            for day, count in document.get("booked", {}).items():
+                if count >= capacity:
+                    full_bits |= 1 << (int(day) - 1)
+            all_days = (1 << 31) - 1
+            await self.availability_repo.set_masks(vendor_id, document["month"], set_bits=full_bits, clear_bits=all_days & ~full_bits)
+    
+    async def get_unavailable_vendor_ids(self, day: Union[date, datetime]) -> List[str]:
+        return await self.availability_repo.get_unavailable_vendor_ids(month_key(day), day.day)
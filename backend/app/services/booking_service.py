@@ -2,12 +2,49 @@ from typing import Optional, List
 from datetime import datetime
 from app.repositories.booking_repository import BookingRepository
 from app.models.booking import BookingCreate, BookingUpdate, BookingStatus
+from app.services.availability_service import AvailabilityService
+from app.core.exceptions import BookingNotFoundException, ConflictException, ForbiddenException
+from app.core.patterns.observer import EventType
+from app.services.outbox_service import outbox_transaction
+
+CAPACITY_HOLDING_STATUSES = ["pending", "approved", "confirmed"]
+BOOKING_TRANSITIONS = {
+    BookingStatus.APPROVED: ["pending"],
+    BookingStatus.REJECTED: ["pending", "approved"],
+    BookingStatus.CONFIRMED: ["approved"],
+    BookingStatus.COMPLETED: ["approved", "confirmed"],
+    BookingStatus.CANCELLED: ["pending", "approved", "confirmed"],
+}
+BOOKING_EVENTS = {
+    BookingStatus.APPROVED: EventType.BOOKING_CONFIRMED,
+    BookingStatus.CONFIRMED: EventType.BOOKING_CONFIRMED,
+    BookingStatus.REJECTED: EventType.BOOKING_CANCELLED,
+    BookingStatus.CANCELLED: EventType.BOOKING_CANCELLED,
+}
+
+
+def booking_event_data(booking: dict) -> dict:
+    return {
+        "booking_id": str(booking.get("_id", "")),
+        "vendor_id": str(booking.get("vendor_id", "")),
+        "user_id": str(booking.get("user_id", "")),
+        "status": str(getattr(booking.get("status"), "value", booking.get("status"))),
+        "event_date": booking.get("event_date"),
+        "total_amount": booking.get("total_amount", 0)
+    }
 
 
 class BookingService:
     
-    def __init__(self, booking_repository: BookingRepository):
+    def __init__(self, booking_repository: BookingRepository, availability_service: Optional[AvailabilityService] = None):
         self.booking_repo = booking_repository
+        self.availability_service = availability_service
+    
+    async def _release_capacity(self, booking: Optional[dict]):
+        if not self.availability_service or not booking or not isinstance(booking.get("event_date"), datetime):
+            return
+        if booking.get("status") in CAPACITY_HOLDING_STATUSES:
+            await self.availability_service.release(str(booking.get("vendor_id", "")), booking["event_date"])
     
     async def create_booking(self, booking_data: BookingCreate, stats_service: Optional['VendorStatsService'] = None) -> dict:
         booking_dict = booking_data.model_dump()
@@ -29,11 +66,22 @@ class BookingService:
             except:
                 pass
         
-        booking = await self.booking_repo.create(booking_dict)
+        reserved = False
+        if self.availability_service and vendor_id_str:
+            await self.availability_service.reserve(vendor_id_str, booking_dict["event_date"])
+            reserved = True
+        
+        try:
+            async with outbox_transaction(self.booking_repo.db) as outbox:
+                booking = await self.booking_repo.create(booking_dict, session=outbox.session)
+                await outbox.add(EventType.BOOKING_CREATED, booking_event_data(booking))
+        except Exception:
+            if reserved:
+                await self.availability_service.release(vendor_id_str, booking_dict["event_date"])
+            raise
         
         if stats_service and vendor_id_str:
-            await stats_service.increment_pending_requests(vendor_id_str)
-            await stats_service.update_vendor_stats(vendor_id_str)
+            await stats_service.record_booking_created(vendor_id_str)
         
         return booking
     
@@ -46,54 +94,71 @@ class BookingService:
     async def get_vendor_bookings(self, vendor_id: str, skip: int = 0, limit: int = 100):
         return await self.booking_repo.get_by_vendor_id(vendor_id, skip, limit)
     
-    async def update_booking(self, booking_id: str, booking_data: BookingUpdate) -> Optional[dict]:
+    async def update_booking(self, booking_id: str, booking_data: BookingUpdate, stats_service: Optional['VendorStatsService'] = None) -> Optional[dict]:
         update_dict = booking_data.model_dump(exclude_unset=True)
+        new_status = update_dict.pop("status", None)
+        if new_status and len(update_dict) == 0:
+            return await self.transition(booking_id, new_status, stats_service=stats_service)
         update_dict["updated_at"] = datetime.utcnow()
-        return await self.booking_repo.update(booking_id, update_dict)
-    
-    async def cancel_booking(self, booking_id: str) -> Optional[dict]:
-        return await self.booking_repo.update(booking_id, {
-            "status": BookingStatus.CANCELLED,
-            "updated_at": datetime.utcnow()
-        })
-    
-    async def confirm_booking(self, booking_id: str) -> Optional[dict]:
-        return await self.booking_repo.update(booking_id, {
-            "status": BookingStatus.CONFIRMED,
-            "updated_at": datetime.utcnow()
-        })
-    
-    async def approve_booking(self, booking_id: str, stats_service: Optional['VendorStatsService'] = None) -> Optional[dict]:
-        booking = await self.booking_repo.get_by_id(booking_id)
-        old_status = booking.get("status") if booking else None
-        
-        result = await self.booking_repo.update(booking_id, {
-            "status": BookingStatus.APPROVED,
-            "updated_at": datetime.utcnow()
-        })
         
-        if stats_service and booking:
-            vendor_id = str(booking.get("vendor_id", ""))
-            if old_status == "pending":
-                await stats_service.decrement_pending_requests(vendor_id)
-            await stats_service.add_revenue(vendor_id, booking.get("total_amount", 0))
-            await stats_service.update_vendor_stats(vendor_id)
+        booking = None
+        if self.availability_service and update_dict.get("event_date"):
+            booking = await self.booking_repo.get_by_id(booking_id)
+            if booking and booking.get("status") in CAPACITY_HOLDING_STATUSES and booking.get("event_date") != update_dict["event_date"]:
+                await self.availability_service.reserve(str(booking.get("vendor_id", "")), update_dict["event_date"])
+            else:
+                booking = None
         
+        result = await self.booking_repo.update(booking_id, update_dict)
+        await self._release_capacity(booking)
+        if result and new_status:
+            return await self.transition(booking_id, new_status, stats_service=stats_service)
         return result
     
-    async def reject_booking(self, booking_id: str, stats_service: Optional['VendorStatsService'] = None) -> Optional[dict]:
-        booking = await self.booking_repo.get_by_id(booking_id)
-        old_status = booking.get("status") if booking else None
+    async def transition(
+        self,
+        booking_id: str,
+        to_status: BookingStatus,
+        vendor_id: Optional[str] = None,
+        user_id: Optional[str] = None,
+        stats_service: Optional['VendorStatsService'] = None
+    ) -> dict:
+        from_statuses = BOOKING_TRANSITIONS.get(to_status)
+        if not from_statuses:
+            raise ConflictException(f"Bookings cannot be moved to {to_status.value}")
         
-        result = await self.booking_repo.update(booking_id, {
-            "status": BookingStatus.REJECTED,
-            "updated_at": datetime.utcnow()
-        })
+        async with outbox_transaction(self.booking_repo.db) as outbox:
+            result = await self.booking_repo.transition(booking_id, from_statuses, to_status, vendor_id, user_id, outbox.session)
+            if result and to_status in BOOKING_EVENTS:
+                await outbox.add(BOOKING_EVENTS[to_status], booking_event_data(result[1]))
         
-        if stats_service and booking and old_status == "pending":
-            vendor_id = str(booking.get("vendor_id", ""))
-            await stats_service.decrement_pending_requests(vendor_id)
-            await stats_service.update_vendor_stats(vendor_id)
+        if not result:
+            booking = await self.booking_repo.get_by_id(booking_id)
+            if not booking:
+                raise BookingNotFoundException()
+            if (vendor_id and str(booking.get("vendor_id")) != vendor_id) or (user_id and str(booking.get("user_id")) != user_id):
+                raise ForbiddenException("You can only change your own bookings")
+            raise ConflictException(f"Booking cannot move from {booking.get('status')} to {to_status.value}")
         
-        return result
-
+        old_status, booking = result
+        if old_status in CAPACITY_HOLDING_STATUSES and to_status not in CAPACITY_HOLDING_STATUSES:
+            await self._release_capacity({**booking, "status": old_status})
+        
+        if stats_service:
+            await stats_service.apply_booking_transition(
+                str(booking.get("vendor_id", "")), old_status, to_status, booking.get("total_amount", 0)
+            )
+        
+        return booking
+    
+    async def cancel_booking(self, booking_id: str, user_id: Optional[str] = None, stats_service: Optional['VendorStatsService'] = None) -> dict:
+        return await self.transition(booking_id, BookingStatus.CANCELLED, user_id=user_id, stats_service=stats_service)
+    
+    async def confirm_booking(self, booking_id: str, vendor_id: Optional[str] = None, stats_service: Optional['VendorStatsService'] = None) -> dict:
+        return await self.transition(booking_id, BookingStatus.CONFIRMED, vendor_id=vendor_id, stats_service=stats_service)
+    
+    async def approve_booking(self, booking_id: str, vendor_id: Optional[str] = None, stats_service: Optional['VendorStatsService'] = None) -> dict:
+        return await self.transition(booking_id, BookingStatus.APPROVED, vendor_id=vendor_id, stats_service=stats_service)
+    
+    async def reject_booking(self, booking_id: str, vendor_id: Optional[str] = None, stats_service: Optional['VendorStatsService'] = None) -> dict:
+        return await self.transition(booking_id, BookingStatus.REJECTED, vendor_id=vendor_id, stats_service=stats_service)
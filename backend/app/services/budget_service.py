@@ -0,0 +1,217 @@
+import asyncio
+import heapq
+from typing import Dict, List, Optional
+import numpy as np
+from app.repositories.vendor_repository import VendorRepository
+from app.core.patterns.singleton import get_cache
+from app.core.constants import MAX_RATING
+
+PRICE_TABLE_CACHE_PREFIX = "budget:price_table:"
+PRICE_TABLE_TTL_SECONDS = 300
+BUDGET_RESOLUTION = 2000
+MAX_TOP_N = 10
+DEFAULT_RATING = 3.0
+
+
+def _prune_dominated(prices: np.ndarray, values: np.ndarray, keep: int) -> np.ndarray:
+    order = np.lexsort((-values, prices))
+    best_values: List[float] = []
+    kept = []
+    for index in order:
+        value = values[index]
+        if len(best_values) < keep or value > best_values[0]:
+            kept.append(index)
+        if len(best_values) < keep:
+            heapq.heappush(best_values, value)
+        elif value > best_values[0]:
+            heapq.heapreplace(best_values, value)
+    return np.array(kept, dtype=np.int64)
+
+
+def optimize_plans(weights: List[np.ndarray], values: List[np.ndarray], capacity: int, top_n: int) -> List[tuple]:
+    dp = np.full((capacity + 1, top_n), -np.inf, dtype=np.float32)
+    dp[0, 0] = 0.0
+    min_weights = [int(w.min()) for w in weights]
+    max_weights = [int(w.max()) for w in weights]
+    choices = []
+
+    for layer, (layer_weights, layer_values) in enumerate(zip(weights, values)):
+        low = sum(min_weights[:layer + 1])
+        high = min(capacity - sum(min_weights[layer + 1:]), sum(max_weights[:layer + 1]))
+        if low > high:
+            return []
+
+        rows = np.arange(low, high + 1)
+        previous = rows[:, None] - layer_weights[None, :]
+        layer_values = layer_values.astype(np.float32)
+        best = dp[np.maximum(previous, 0), 0] + layer_values[None, :]
+        best[previous < 0] = -np.inf
+
+        # An item can only contribute to a row's top N if its own best plan is in the top N.
+        if best.shape[1] > top_n:
+            items = np.argpartition(-best, top_n - 1, axis=1)[:, :top_n]
+        else:
+            items = np.tile(np.arange(best.shape[1]), (len(rows), 1))
+        item_previous = np.take_along_axis(previous, items, axis=1)
+        candidates = dp[np.maximum(item_previous, 0)] + layer_values[items][:, :, None]
+        candidates[item_previous < 0] = -np.inf
+        candidates = candidates.reshape(len(rows), -1)
+
+        top = np.argsort(-candidates, axis=1, kind="stable")[:, :top_n]
+        top_values = np.take_along_axis(candidates, top, axis=1)
+        top_items = np.take_along_axis(items, top // top_n, axis=1)
+
+        dp = np.full((capacity + 1, top_n), -np.inf, dtype=np.float32)
+        dp[low:high + 1, :top.shape[1]] = top_values
+        item = np.zeros((capacity + 1, top_n), dtype=np.int64)
+        rank = np.zeros((capacity + 1, top_n), dtype=np.int64)
+        item[low:high + 1, :top.shape[1]] = top_items
+        rank[low:high + 1, :top.shape[1]] = top % top_n
+        choices.append((item, rank))
+
+    flat = dp.ravel()
+    finite = np.flatnonzero(np.isfinite(flat))
+    if finite.size == 0:
+        return []
+    best = finite[np.argsort(-flat[finite])[:top_n]]
+
+    plans = []
+    for position in best:
+        used, k = divmod(int(position), top_n)
+        score = float(flat[position])
+        picks = []
+        for layer in range(len(weights) - 1, -1, -1):
+            item, rank = choices[layer]
+            chosen = int(item[used, k])
+            picks.append(chosen)
+            k = int(rank[used, k])
+            used -= int(weights[layer][chosen])
+        plans.append((score, picks[::-1]))
+    return plans
+
+
+def invalidate_price_tables(category: Optional[str] = None):
+    cache = get_cache()
+    if category:
+        cache.delete(PRICE_TABLE_CACHE_PREFIX + category)
+        return
+    for key in cache.keys():
+        if key.startswith(PRICE_TABLE_CACHE_PREFIX):
+            cache.delete(key)
+
+
+class BudgetService:
+
+    def __init__(self, vendor_repository: VendorRepository):
+        self.vendor_repo = vendor_repository
+        self.cache = get_cache()
+
+    def _build_price_table(self, vendors: List[dict]) -> dict:
+        rows = []
+        for vendor in vendors:
+            rating = float(vendor.get("rating") or 0.0) or DEFAULT_RATING
+            for package in vendor.get("packages") or []:
+                price = package.get("price") if isinstance(package, dict) else None
+                if not isinstance(price, (int, float)) or price <= 0:
+                    continue
+                rows.append((
+                    float(price),
+                    rating,
+                    float(package.get("max_guests") or 0),
+                    vendor["_id"],
+                    vendor.get("business_name", ""),
+                    package.get("name", "")
+                ))
+
+        return {
+            "prices": np.array([r[0] for r in rows], dtype=np.float64),
+            "ratings": np.array([r[1] for r in rows], dtype=np.float64),
+            "max_guests": np.array([r[2] for r in rows], dtype=np.float64),
+            "vendor_ids": [r[3] for r in rows],
+            "business_names": [r[4] for r in rows],
+            "package_names": [r[5] for r in rows],
+        }
+
+    async def get_price_tables(self, categories: List[str]) -> Dict[str, dict]:
+        tables = {}
+        missing = []
+        for category in categories:
+            table = self.cache.get(PRICE_TABLE_CACHE_PREFIX + category)
+            if table is None:
+                missing.append(category)
+            else:
+                tables[category] = table
+
+        if missing:
+            vendors = await self.vendor_repo.get_package_catalog(missing)
+            for category in missing:
+                table = self._build_price_table([v for v in vendors if v.get("service_category") == category])
+                self.cache.set(PRICE_TABLE_CACHE_PREFIX + category, table, ttl=PRICE_TABLE_TTL_SECONDS)
+                tables[category] = table
+
+        return tables
+
+    async def optimize(
+        self,
+        total_budget: float,
+        categories: List[str],
+        guest_count: Optional[int] = None,
+        preferences: Optional[Dict[str, float]] = None,
+        min_rating: Optional[float] = None,
+        top_n: int = 3
+    ) -> dict:
+        categories = list(dict.fromkeys(categories))
+        preferences = preferences or {}
+        top_n = min(top_n, MAX_TOP_N)
+        tables = await self.get_price_tables(categories)
+        unit = total_budget / BUDGET_RESOLUTION
+
+        weights, values, candidates = [], [], []
+        for category in categories:
+            table = tables[category]
+            prices = table["prices"]
+            mask = prices <= total_budget
+            if min_rating is not None:
+                mask &= table["ratings"] >= min_rating
+            if guest_count:
+                mask &= (table["max_guests"] == 0) | (table["max_guests"] >= guest_count)
+
+            indices = np.flatnonzero(mask)
+            if indices.size == 0:
+                raise ValueError(f"No packages available for category '{category}' within the budget")
+
+            median_price = float(np.median(prices[indices]))
+            weight = max(float(preferences.get(category, 1.0)), 0.0)
+            category_values = weight * (table["ratings"][indices] / MAX_RATING) * np.sqrt(prices[indices] / median_price)
+
+            positions = _prune_dominated(prices[indices], category_values, top_n)
+            kept = indices[positions]
+
+            weights.append(np.ceil(prices[kept] / unit - 1e-9).astype(np.int64))
+            values.append(category_values[positions])
+            candidates.append(kept)
+
+        plans = []
+        ranked_plans = await asyncio.to_thread(optimize_plans, weights, values, BUDGET_RESOLUTION, top_n)
+        for score, picks in ranked_plans:
+            selections = []
+            for category, kept, pick in zip(categories, candidates, picks):
+                table = tables[category]
+                index = int(kept[pick])
+                selections.append({
+                    "category": category,
+                    "vendor_id": table["vendor_ids"][index],
+                    "business_name": table["business_names"][index],
+                    "package_name": table["package_names"][index],
+                    "price": float(table["prices"][index]),
+                    "rating": float(table["ratings"][index])
+                })
+            total_cost = sum(s["price"] for s in selections)
+            plans.append({
+                "total_cost": total_cost,
+                "remaining_budget": total_budget - total_cost,
+                "score": round(score, 4),
+                "selections": selections
+            })
+
+        return {"total_budget": total_budget, "guest_count": guest_count, "plans": plans}
@@ -0,0 +1,231 @@
+import asyncio
+import logging
+import time
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+from app.repositories.email_campaign_repository import EmailCampaignRepository, CAMPAIGN_STATUS_DONE
+from app.repositories.vendor_digest_repository import VendorDigestRepository
+from app.repositories.vendor_repository import VendorRepository
+from app.services.email_service import EmailService, email_service
+from app.services.email_templates import render_email_batch
+from app.services.job_queue import JOB_TIMEOUT_SECONDS, get_job_queue
+from app.services.smtp_pool import SMTP_MAX_ATTEMPTS, SMTP_RETRY_BASE_SECONDS
+
+logger = logging.getLogger(__name__)
+
+BULK_EMAIL_JOB = "bulk_email"
+VENDOR_DIGEST_JOB = "vendor_digest"
+BULK_CHUNK_SIZE = 200
+BULK_BATCH_SIZE = 20
+BULK_CONCURRENCY = 16
+# Stop well inside the job timeout so a chunk is never cut off after sending without saving progress
+BULK_TIME_BUDGET_SECONDS = JOB_TIMEOUT_SECONDS / 2
+BULK_RETRY_ALLOWANCE_SECONDS = SMTP_RETRY_BASE_SECONDS * (2 ** (SMTP_MAX_ATTEMPTS - 1) - 1)
+DIGEST_HOUR_UTC = 3
+DEFAULT_PROVIDER_RATE = 30
+PROVIDER_RATE_LIMITS = {
+    "gmail.com": 20,
+    "googlemail.com": 20,
+    "yahoo.com": 10,
+    "hotmail.com": 10,
+    "outlook.com": 10,
+    "live.com": 10,
+}
+
+
+class ProviderRateLimiter:
+    
+    def __init__(self, limits: Dict[str, float], default_rate: float):
+        self.limits = limits
+        self.default_rate = default_rate
+        self._next_slot: Dict[str, float] = {}
+    
+    def _provider(self, email: str) -> str:
+        return email.rsplit("@", 1)[-1].lower()
+    
+    def estimate_seconds(self, emails: List[str]) -> float:
+        counts: Dict[str, int] = {}
+        for email in emails:
+            provider = self._provider(email)
+            counts[provider] = counts.get(provider, 0) + 1
+        now = time.monotonic()
+        estimate = 0.0
+        for provider, count in counts.items():
+            backlog = max(0.0, self._next_slot.get(provider, now) - now)
+            estimate = max(estimate, backlog + count / self.limits.get(provider, self.default_rate))
+        return estimate
+    
+    async def acquire(self, email: str):
+        provider = self._provider(email)
+        interval = 1 / self.limits.get(provider, self.default_rate)
+        now = time.monotonic()
+        slot = max(now, self._next_slot.get(provider, now))
+        self._next_slot[provider] = slot + interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+
+provider_rate_limiter = ProviderRateLimiter(PROVIDER_RATE_LIMITS, DEFAULT_PROVIDER_RATE)
+
+
+def digest_window(run_at: datetime) -> str:
+    return (run_at - timedelta(days=1)).strftime("%Y-%m-%d")
+
+
+def next_digest_run(now: Optional[datetime] = None) -> datetime:
+    now = now or datetime.utcnow()
+    run_at = now.replace(hour=DIGEST_HOUR_UTC, minute=0, second=0, microsecond=0)
+    return run_at if run_at > now else run_at + timedelta(days=1)
+
+
+def recipient_context(recipient: dict) -> dict:
+    context = {key: value for key, value in recipient.items() if key not in ("_id", "window", "created_at")}
+    if recipient.get("review_count"):
+        context["average_rating"] = round(recipient["rating_sum"] / recipient["review_count"], 1)
+    return context
+
+
+class BulkEmailService:
+    
+    def __init__(
+        self,
+        campaign_repository: EmailCampaignRepository,
+        vendor_repository: VendorRepository,
+        digest_repository: VendorDigestRepository,
+        email_sender: EmailService = email_service
+    ):
+        self.campaign_repo = campaign_repository
+        self.vendor_repo = vendor_repository
+        self.digest_repo = digest_repository
+        self.email_sender = email_sender
+    
+    async def create_announcement(self, subject: str, message: str) -> dict:
+        campaign = await self.campaign_repo.create_campaign(
+            "announcement",
+            "announcement",
+            {"collection": "vendors"},
+            {"subject": subject, "message": message}
+        )
+        await self.schedule_chunk(campaign["_id"])
+        return campaign
+    
+    async def create_vendor_digest(self, window: str) -> Optional[dict]:
+        dedupe_key = f"{VENDOR_DIGEST_JOB}:{window}"
+        campaign = await self.campaign_repo.get_by_dedupe_key(dedupe_key)
+        if campaign is None:
+            start = datetime.strptime(window, "%Y-%m-%d")
+            await self.digest_repo.build_window(window, start, start + timedelta(days=1))
+            campaign = await self.campaign_repo.create_campaign(
+                "digest",
+                "vendor_digest",
+                {"collection": "vendor_digests", "window": window},
+                {"window": window},
+                dedupe_key=dedupe_key
+            ) or await self.campaign_repo.get_by_dedupe_key(dedupe_key)
+        if campaign["status"] != CAMPAIGN_STATUS_DONE:
+            await self.schedule_chunk(campaign["_id"])
+        return campaign
+    
+    async def schedule_chunk(self, campaign_id: str):
+        await get_job_queue().enqueue(
+            BULK_EMAIL_JOB,
+            {"campaign_id": campaign_id},
+            dedupe_key=f"{BULK_EMAIL_JOB}:{campaign_id}"
+        )
+    
+    def _stream_recipients(self, campaign: dict):
+        after_id = campaign.get("last_recipient_id")
+        if campaign["source"]["collection"] == "vendor_digests":
+            return self.digest_repo.stream_window(campaign["source"]["window"], after_id, BULK_CHUNK_SIZE)
+        return self.vendor_repo.stream_contacts(after_id, BULK_CHUNK_SIZE)
+    
+    async def _send(self, semaphore: asyncio.Semaphore, to_email: str, email) -> bool:
+        await provider_rate_limiter.acquire(to_email)
+        async with semaphore:
+            return await self.email_sender.send_email(to_email, email.subject, email.html_content, email.text_content)
+    
+    def _next_batch_size(self, recipients: List[dict], remaining_seconds: float) -> int:
+        # Largest prefix whose provider-rate send time, including what other campaigns already queued
+        # on the shared limiter and the SMTP retry backoff, fits in the remaining budget
+        size = 0
+        emails = []
+        for recipient in recipients[:BULK_BATCH_SIZE]:
+            emails.append(recipient["email"])
+            if provider_rate_limiter.estimate_seconds(emails) + BULK_RETRY_ALLOWANCE_SECONDS > remaining_seconds:
+                break
+            size += 1
+        return size
+    
+    async def send_next_chunk(self, campaign_id: str) -> bool:
+        started = time.monotonic()
+        campaign = await self.campaign_repo.get_by_id(campaign_id)
+        if not campaign or campaign["status"] == CAMPAIGN_STATUS_DONE:
+            return False
+        
+        recipients = [recipient async for recipient in self._stream_recipients(campaign)]
+        if not recipients:
+            await self.campaign_repo.finish(campaign["_id"])
+            logger.info(f"BulkEmail: campaign {campaign_id} finished ({campaign['sent']} sent, {campaign['failed']} failed)")
+            return False
+        
+        semaphore = asyncio.Semaphore(BULK_CONCURRENCY)
+        previous_id = campaign.get("last_recipient_id")
+        position = 0
+        while position < len(recipients):
+            remaining = BULK_TIME_BUDGET_SECONDS - (time.monotonic() - started)
+            size = self._next_batch_size(recipients[position:], remaining)
+            if size == 0:
+                if position:
+                    break
+                # Always make progress, one recipient at a time, even when the limiter is backed up
+                size = 1
+            
+            batch = recipients[position:position + size]
+            contexts = [{**campaign["context"], **recipient_context(recipient)} for recipient in batch]
+            emails = await render_email_batch(campaign["template"], contexts)
+            results = await asyncio.gather(*(
+                self._send(semaphore, recipient["email"], email)
+                for recipient, email in zip(batch, emails)
+            ))
+            
+            # Save the cursor after every batch so a timeout or crash only repeats the batch in flight
+            sent = results.count(True)
+            advanced = await self.campaign_repo.advance(
+                campaign["_id"], previous_id, batch[-1]["_id"], sent, len(results) - sent
+            )
+            if not advanced:
+                logger.warning(f"BulkEmail: campaign {campaign_id} was advanced by another worker")
+                return False
+            previous_id = batch[-1]["_id"]
+            position += size
+        return True
+
+
+def _create_service(database) -> BulkEmailService:
+    return BulkEmailService(
+        EmailCampaignRepository(database),
+        VendorRepository(database),
+        VendorDigestRepository(database)
+    )
+
+
+async def run_bulk_email_job(database, payload: dict):
+    service = _create_service(database)
+    if await service.send_next_chunk(payload["campaign_id"]):
+        await service.schedule_chunk(payload["campaign_id"])
+
+
+async def run_vendor_digest_job(database, payload: dict):
+    await _create_service(database).create_vendor_digest(payload["window"])
+    await schedule_vendor_digest()
+
+
+async def schedule_vendor_digest():
+    run_at = next_digest_run()
+    window = digest_window(run_at)
+    await get_job_queue().enqueue(
+        VENDOR_DIGEST_JOB,
+        {"window": window},
+        dedupe_key=f"{VENDOR_DIGEST_JOB}:{window}",
+        delay_seconds=(run_at - datetime.utcnow()).total_seconds()
+    )
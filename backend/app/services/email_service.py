@@ -1,8 +1,9 @@
-import aiosmtplib
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
-from jinja2 import Template
 from app.core.config import settings
+from app.core.patterns.singleton import get_metrics
+from app.services.smtp_pool import SMTPConnectionPool
+from app.services.email_templates import render_email
 from typing import List, Optional
 import logging
 
@@ -18,6 +19,34 @@ class EmailService:
         self.smtp_password = settings.SMTP_PASSWORD
         self.from_email = settings.SMTP_FROM_EMAIL or settings.SMTP_USER
         self.from_name = settings.SMTP_FROM_NAME
+        self.pool = SMTPConnectionPool(
+            hostname=self.smtp_host,
+            port=self.smtp_port,
+            username=self.smtp_user,
+            password=self.smtp_password,
+            start_tls=settings.SMTP_START_TLS,
+            size=settings.SMTP_POOL_SIZE
+        )
+
+    def build_message(
+        self,
+        to_email: str,
+        subject: str,
+        html_content: str,
+        text_content: Optional[str] = None
+    ) -> MIMEMultipart:
+        message = MIMEMultipart("alternative")
+        message["Subject"] = subject
+        message["From"] = f"{self.from_name} <{self.from_email}>"
+        message["To"] = to_email
+
+        if text_content:
+            text_part = MIMEText(text_content, "plain")
+            message.attach(text_part)
+
+        html_part = MIMEText(html_content, "html")
+        message.attach(html_part)
+        return message
 
     async def send_email(
         self,
@@ -28,35 +57,36 @@ class EmailService:
     ) -> bool:
         
         try:
+            message = self.build_message(to_email, subject, html_content, text_content)
+            await self.pool.send(message)
 
-            message = MIMEMultipart("alternative")
-            message["Subject"] = subject
-            message["From"] = f"{self.from_name} <{self.from_email}>"
-            message["To"] = to_email
-
-            if text_content:
-                text_part = MIMEText(text_content, "plain")
-                message.attach(text_part)
-
-            html_part = MIMEText(html_content, "html")
-            message.attach(html_part)
-
-            await aiosmtplib.send(
-                message,
-                hostname=self.smtp_host,
-                port=self.smtp_port,
-                username=self.smtp_user,
-                password=self.smtp_password,
-                start_tls=True,
-            )
-
+            get_metrics().increment_counter("email.sent")
             logger.info(f"Email sent successfully to {to_email}")
             return True
 
         except Exception as e:
+            get_metrics().increment_counter("email.failed")
             logger.error(f"Failed to send email to {to_email}: {str(e)}")
             return False
 
+    async def send_many(self, emails: List[dict]) -> List[bool]:
+        messages = [self.build_message(**email) for email in emails]
+        errors = await self.pool.send_many(messages)
+
+        results = []
+        for email, error in zip(emails, errors):
+            if error:
+                logger.error(f"Failed to send email to {email['to_email']}: {str(error)}")
+            results.append(error is None)
+
+        metrics = get_metrics()
+        metrics.increment_counter("email.sent", results.count(True))
+        metrics.increment_counter("email.failed", results.count(False))
+        return results
+
+    async def close(self):
+        await self.pool.close()
+
     async def send_password_reset_email(
         self,
         to_email: str,
@@ -65,20 +95,13 @@ class EmailService:
     ) -> bool:
         
         reset_link = f"{settings.FRONTEND_URL}/reset-password?token={reset_token}"
-
-
-
-        template = Template(html_template)
-        html_content = template.render(
-            reset_link=reset_link,
-            user_name=user_name
-        )
+        email = render_email("password_reset", reset_link=reset_link, user_name=user_name)
 
         return await self.send_email(
             to_email=to_email,
-            subject="Reset Your Password - PakWedding Portal",
-            html_content=html_content,
-            text_content=text_content
+            subject=email.subject,
+            html_content=email.html_content,
+            text_content=email.text_content
         )
 
     async def send_welcome_email(
@@ -87,20 +110,13 @@ class EmailService:
         user_name: str,
         user_role: str = "user"
     ) -> bool:
-        
-
-
-        template = Template(html_template)
-        html_content = template.render(
-            user_name=user_name,
-            user_role=user_role,
-            frontend_url=settings.FRONTEND_URL
-        )
+        email = render_email("welcome", user_name=user_name, user_role=user_role)
 
         return await self.send_email(
             to_email=to_email,
-            subject="Welcome to PakWedding Portal! 🎉",
-            html_content=html_content
+            subject=email.subject,
+            html_content=email.html_content,
+            text_content=email.text_content
         )
 
 email_service = EmailService()
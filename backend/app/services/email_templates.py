@@ -0,0 +1,57 @@
+import asyncio
+import os
+from functools import lru_cache
+from typing import List, NamedTuple
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, select_autoescape
+from markupsafe import Markup
+from app.core.config import settings
+
+TEMPLATE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "templates")
+TEMPLATE_CACHE_SIZE = 100
+EMAIL_BLOCKS = ("subject", "html", "text")
+
+
+class RenderedEmail(NamedTuple):
+    subject: str
+    html_content: str
+    text_content: str
+
+
+def create_environment() -> Environment:
+    environment = Environment(
+        loader=FileSystemLoader(TEMPLATE_DIR),
+        autoescape=select_autoescape(["html"]),
+        # Without a directory Jinja uses a per-user 0700 cache dir and checks its owner before trusting it
+        bytecode_cache=FileSystemBytecodeCache(),
+        cache_size=TEMPLATE_CACHE_SIZE,
+        auto_reload=False,
+        trim_blocks=True,
+        lstrip_blocks=True,
+    )
+    environment.globals.update(
+        brand=settings.SMTP_FROM_NAME,
+        frontend_url=settings.FRONTEND_URL,
+        static=render_static,
+    )
+    return environment
+
+
+@lru_cache(maxsize=None)
+def render_static(name: str) -> Markup:
+    return Markup(environment.get_template(name).render())
+
+
+def render_email(name: str, **context) -> RenderedEmail:
+    template = environment.get_template(f"email/{name}.html")
+    template_context = template.new_context(context)
+    return RenderedEmail(*(
+        "".join(template.blocks[block](template_context)).strip()
+        for block in EMAIL_BLOCKS
+    ))
+
+
+async def render_email_batch(name: str, contexts: List[dict]) -> List[RenderedEmail]:
+    return await asyncio.to_thread(lambda: [render_email(name, **context) for context in contexts])
+
+
+environment = create_environment()
@@ -0,0 +1,100 @@
+import re
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+from app.core.gazetteer import PAKISTAN_CITIES, PAKISTAN_AREAS
+
+MAX_NGRAM = 4
+COORDINATES_PATTERN = re.compile(r"^\s*(-?\d+(?:\.\d+)?)\s*,\s*(-?\d+(?:\.\d+)?)\s*$")
+
+
+def _normalize(text: str) -> str:
+    text = re.sub(r"[^a-z0-9]+", " ", text.lower())
+    text = re.sub(r"\b([a-z])\s+(\d+)\b", r"\1\2", text)
+    return " ".join(text.split())
+
+
+def _build_index(entries: List[dict]) -> Dict[str, List[dict]]:
+    index: Dict[str, List[dict]] = {}
+    for entry in entries:
+        for name in [entry["name"], *entry.get("aliases", [])]:
+            key = _normalize(name)
+            if entry not in index.setdefault(key, []):
+                index[key].append(entry)
+    return index
+
+
+class GeocodingService:
+
+    def __init__(self):
+        self._cities = _build_index(PAKISTAN_CITIES)
+        self._areas = _build_index(PAKISTAN_AREAS)
+
+    def _match(self, tokens: List[str], index: Dict[str, List[dict]]) -> List[dict]:
+        matches = []
+        for size in range(min(MAX_NGRAM, len(tokens)), 0, -1):
+            for start in range(len(tokens) - size + 1):
+                for entry in index.get(" ".join(tokens[start:start + size]), []):
+                    if entry not in matches:
+                        matches.append(entry)
+        return matches
+
+    @lru_cache(maxsize=4096)
+    def _lookup(self, address: str) -> Optional[Tuple[float, float, str, Optional[str]]]:
+        tokens = _normalize(address).split()
+        cities = self._match(tokens, self._cities)
+        areas = self._match(tokens, self._areas)
+
+        city = cities[0] if cities else None
+        if city:
+            areas = [a for a in areas if a["city"] == city["name"]]
+        elif len({a["city"] for a in areas}) > 1:
+            areas = []
+
+        area = areas[0] if areas else None
+        place = area or city
+        if not place:
+            return None
+
+        return (
+            place["lng"],
+            place["lat"],
+            area["city"] if area else city["name"],
+            area["name"] if area else None,
+        )
+
+    def geocode(self, address: str) -> Optional[dict]:
+        if not address:
+            return None
+
+        match = self._lookup(address)
+        if not match:
+            return None
+
+        lng, lat, city, area = match
+        return {
+            "location": {"type": "Point", "coordinates": [lng, lat]},
+            "city": city,
+            "area": area,
+        }
+
+    def resolve_point(self, near: str) -> Optional[Tuple[float, float]]:
+        match = COORDINATES_PATTERN.match(near or "")
+        if match:
+            lat, lng = float(match.group(1)), float(match.group(2))
+            if -90 <= lat <= 90 and -180 <= lng <= 180:
+                return lng, lat
+            return None
+
+        match = self._lookup(near) if near else None
+        if not match:
+            return None
+        return match[0], match[1]
+
+    def geocode_fields(self, address: Optional[str]) -> dict:
+        geocoded = self.geocode(address)
+        if not geocoded:
+            return {"location": None, "city": None, "area": None}
+        return geocoded
+
+
+geocoding_service = GeocodingService()
@@ -0,0 +1,114 @@
+import asyncio
+import logging
+import os
+import socket
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+from app.core.patterns.singleton import get_metrics
+from app.repositories.job_repository import JobRepository
+
+logger = logging.getLogger(__name__)
+
+JobHandler = Callable[[Any, dict], Awaitable[None]]
+
+DEFAULT_CONCURRENCY = 4
+POLL_INTERVAL_SECONDS = 1.0
+LEASE_SECONDS = 60
+JOB_TIMEOUT_SECONDS = 30
+RETRY_BASE_SECONDS = 2
+RETRY_MAX_SECONDS = 300
+
+
+class JobQueue:
+    
+    def __init__(self, concurrency: int = DEFAULT_CONCURRENCY):
+        self.concurrency = concurrency
+        self._handlers: Dict[str, JobHandler] = {}
+        self._database = None
+        self._repo: Optional[JobRepository] = None
+        self._workers: List[asyncio.Task] = []
+        self._wakeup = asyncio.Event()
+        self._stopping = False
+    
+    def register(self, job_type: str, handler: JobHandler):
+        self._handlers[job_type] = handler
+    
+    async def enqueue(self, job_type: str, payload: dict, dedupe_key: Optional[str] = None, delay_seconds: float = 0) -> bool:
+        if self._repo is None:
+            raise RuntimeError("Job queue has not been started")
+        queued = await self._repo.enqueue(job_type, payload, dedupe_key, delay_seconds)
+        if queued and not delay_seconds:
+            self._wakeup.set()
+        return queued
+    
+    async def start(self, database):
+        self._database = database
+        self._repo = JobRepository(database)
+        self._stopping = False
+        worker_prefix = f"{socket.gethostname()}:{os.getpid()}"
+        self._workers = [
+            asyncio.create_task(self._work(f"{worker_prefix}:{index}"))
+            for index in range(self.concurrency)
+        ]
+        logger.info(f"JobQueue: started {self.concurrency} workers")
+    
+    async def stop(self):
+        self._stopping = True
+        self._wakeup.set()
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        logger.info("JobQueue: stopped")
+    
+    async def _work(self, worker_id: str):
+        while not self._stopping:
+            try:
+                job = await self._repo.claim(worker_id, LEASE_SECONDS)
+            except Exception as e:
+                logger.error(f"JobQueue: failed to claim job: {str(e)}")
+                job = None
+            
+            if job is None:
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), POLL_INTERVAL_SECONDS)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            
+            await self._run(job)
+    
+    async def _run(self, job: dict):
+        handler = self._handlers.get(job["type"])
+        try:
+            if handler is None:
+                raise LookupError(f"No handler registered for job type '{job['type']}'")
+            await asyncio.wait_for(handler(self._database, job["payload"]), JOB_TIMEOUT_SECONDS)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            retry_delay = min(RETRY_BASE_SECONDS ** job["attempts"], RETRY_MAX_SECONDS)
+            logger.error(f"JobQueue: {job['type']} job {job['_id']} failed (attempt {job['attempts']}): {str(e)}")
+            await self._record(self._repo.fail(job, str(e), retry_delay), job, "failure")
+            return
+        await self._record(self._repo.complete(job["_id"]), job, "completion")
+    
+    async def _record(self, update: Awaitable, job: dict, outcome: str):
+        # A database error here must not kill the worker; the lease expires and the job is claimed again
+        try:
+            await update
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            get_metrics().increment_counter("jobs.bookkeeping_errors")
+            logger.error(f"JobQueue: failed to record {outcome} of {job['type']} job {job['_id']}: {str(e)}")
+
+
+_job_queue = None
+
+
+def get_job_queue() -> JobQueue:
+    global _job_queue
+    if _job_queue is None:
+        _job_queue = JobQueue()
+    return _job_queue
@@ -0,0 +1,192 @@
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+from app.core.config import settings
+from app.repositories.outbox_repository import OutboxRepository
+from app.core.patterns.observer import Event, EventManager, EventType, Observer
+from app.core.patterns.singleton import get_metrics
+
+logger = logging.getLogger(__name__)
+
+OUTBOX_BATCH_SIZE = 500
+OUTBOX_LEASE_SECONDS = 60
+OUTBOX_POLL_INTERVAL_SECONDS = 0.5
+DELIVERY_CONCURRENCY = 64
+OUTBOX_MAX_ATTEMPTS = 6
+OUTBOX_RETRY_BASE_SECONDS = 5
+
+_transactions_supported: Optional[bool] = None
+
+
+async def supports_transactions(database) -> bool:
+    global _transactions_supported
+    if _transactions_supported is None:
+        try:
+            hello = await database.client.admin.command("hello")
+            _transactions_supported = bool(hello.get("setName")) or hello.get("msg") == "isdbgrid"
+        except Exception as e:
+            logger.warning(f"Outbox: could not detect transaction support: {str(e)}")
+            _transactions_supported = False
+    return _transactions_supported
+
+
+class OutboxWriter:
+    
+    def __init__(self, outbox_repository: OutboxRepository, session=None):
+        self.outbox_repo = outbox_repository
+        self.session = session
+        self.event_ids: List[str] = []
+    
+    async def add(self, event_type: EventType, data: dict):
+        self.event_ids.append(await self.outbox_repo.add(event_type.value, data, self.session))
+
+
+@asynccontextmanager
+async def outbox_transaction(database):
+    outbox_repo = OutboxRepository(database)
+    if await supports_transactions(database):
+        async with await database.client.start_session() as session:
+            async with session.start_transaction():
+                writer = OutboxWriter(outbox_repo, session)
+                yield writer
+    else:
+        # Without transactions a crash between the domain write and the outbox write loses the event;
+        # OutboxConsumer.start warns about this (or refuses to start) once per process
+        get_metrics().increment_counter("outbox.non_transactional_writes")
+        writer = OutboxWriter(outbox_repo)
+        yield writer
+    
+    if writer.event_ids:
+        get_outbox_consumer().wake()
+
+
+class OutboxConsumer:
+    
+    def __init__(self, batch_size: int = OUTBOX_BATCH_SIZE, concurrency: int = DELIVERY_CONCURRENCY):
+        self.batch_size = batch_size
+        self.concurrency = concurrency
+        self._repo: Optional[OutboxRepository] = None
+        self._event_manager: Optional[EventManager] = None
+        self._task: Optional[asyncio.Task] = None
+        self._wakeup = asyncio.Event()
+    
+    def wake(self):
+        self._wakeup.set()
+    
+    async def start(self, database, event_manager: EventManager):
+        if not await supports_transactions(database):
+            if settings.OUTBOX_REQUIRE_TRANSACTIONS:
+                raise RuntimeError("Outbox requires a MongoDB replica set or sharded cluster for transactions")
+            logger.warning(
+                "Outbox: MongoDB does not support transactions (standalone server); domain writes and their "
+                "events are not atomic and an event can be lost if the process dies between them"
+            )
+        self._repo = OutboxRepository(database)
+        self._event_manager = event_manager
+        self._task = asyncio.create_task(self._run())
+        logger.info("OutboxConsumer: started")
+    
+    async def stop(self):
+        if self._task is None:
+            return
+        self._task.cancel()
+        await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
+        logger.info("OutboxConsumer: stopped")
+    
+    async def _run(self):
+        while True:
+            try:
+                batch = await self._repo.claim_batch(self.batch_size, OUTBOX_LEASE_SECONDS)
+            except Exception as e:
+                logger.error(f"OutboxConsumer: failed to claim batch: {str(e)}")
+                batch = []
+            
+            if not batch:
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), OUTBOX_POLL_INTERVAL_SECONDS)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            
+            await self.deliver_batch(batch)
+    
+    async def deliver_batch(self, batch: List[dict]):
+        started = time.perf_counter()
+        semaphore = asyncio.Semaphore(self.concurrency)
+        delivered_to: Dict[str, List[str]] = {document["_id"]: [] for document in batch}
+        unknown = set()
+        
+        async def deliver(document: dict):
+            try:
+                event = Event(EventType(document["event_type"]), document["data"], event_id=document["_id"])
+            except ValueError:
+                logger.error(f"OutboxConsumer: unknown event type {document['event_type']} ({document['_id']})")
+                unknown.add(document["_id"])
+                return
+            
+            async def acknowledge(observer: Observer):
+                delivered_to[document["_id"]].append(observer.name)
+                if observer.deliver_once:
+                    try:
+                        await self._repo.acknowledge(document["_id"], observer.name)
+                    except Exception as e:
+                        logger.error(f"OutboxConsumer: failed to acknowledge {document['_id']} for {observer.name}: {str(e)}")
+            
+            # Observers that already handled this event on an earlier, interrupted delivery are skipped
+            async with semaphore:
+                await self._event_manager.notify(event, frozenset(document.get("delivered_to", ())), acknowledge)
+        
+        await asyncio.gather(*(deliver(document) for document in batch))
+        
+        # An event is only done once every subscribed observer has handled it; observers that timed out
+        # or raised are retried with backoff on a later claim, up to OUTBOX_MAX_ATTEMPTS
+        now = datetime.utcnow()
+        completed: Dict[str, List[str]] = {}
+        retries: Dict[str, Tuple[List[str], datetime]] = {}
+        failed: Dict[str, List[str]] = {}
+        for document in batch:
+            event_id = document["_id"]
+            names = delivered_to[event_id]
+            if event_id in unknown:
+                failed[event_id] = names
+                continue
+            
+            handled = set(document.get("delivered_to", ())) | set(names)
+            observers = self._event_manager.get_observers(EventType(document["event_type"]))
+            missing = [observer.name for observer in observers if observer.name not in handled]
+            if not missing:
+                completed[event_id] = names
+            elif document.get("attempts", 1) >= OUTBOX_MAX_ATTEMPTS:
+                logger.error(
+                    f"OutboxConsumer: giving up on {event_id} after {document['attempts']} attempts, "
+                    f"not delivered to {', '.join(missing)}"
+                )
+                failed[event_id] = names
+            else:
+                delay = OUTBOX_RETRY_BASE_SECONDS * 2 ** (document.get("attempts", 1) - 1)
+                retries[event_id] = (names, now + timedelta(seconds=delay))
+        
+        await self._repo.mark_delivered(completed)
+        await self._repo.release(retries)
+        await self._repo.dead_letter(failed)
+        
+        metrics = get_metrics()
+        metrics.increment_counter("outbox.delivered", len(completed))
+        metrics.increment_counter("outbox.retried", len(retries))
+        metrics.increment_counter("outbox.dead_lettered", len(failed))
+        metrics.record_metric("outbox.batch_ms", (time.perf_counter() - started) * 1000)
+
+
+_outbox_consumer = None
+
+
+def get_outbox_consumer() -> OutboxConsumer:
+    global _outbox_consumer
+    if _outbox_consumer is None:
+        _outbox_consumer = OutboxConsumer()
+    return _outbox_consumer
@@ -0,0 +1,136 @@
+from typing import Dict, List, Tuple
+from datetime import datetime
+import numpy as np
+from scipy import sparse
+from app.repositories.favorite_repository import FavoriteRepository
+from app.repositories.booking_repository import BookingRepository
+from app.repositories.vendor_repository import VendorRepository
+from app.repositories.recommendation_repository import RecommendationRepository
+
+FAVORITE_WEIGHT = 1.0
+BOOKING_WEIGHT = 2.0
+BOOKING_SIGNAL_STATUSES = ["pending", "approved", "confirmed", "completed"]
+DEFAULT_TOP_K = 12
+
+
+def top_k_rows(matrix: sparse.csr_matrix, k: int) -> List[List[Tuple[int, float]]]:
+    rows = []
+    for row in range(matrix.shape[0]):
+        start, end = matrix.indptr[row], matrix.indptr[row + 1]
+        columns = matrix.indices[start:end]
+        scores = matrix.data[start:end]
+        if len(scores) > k:
+            keep = np.argpartition(-scores, k - 1)[:k]
+            columns, scores = columns[keep], scores[keep]
+        order = np.argsort(-scores, kind="stable")
+        rows.append([(int(columns[i]), float(scores[i])) for i in order if scores[i] > 0])
+    return rows
+
+
+def cosine_similarity(interactions: sparse.csr_matrix) -> sparse.csr_matrix:
+    norms = np.sqrt(np.asarray(interactions.multiply(interactions).sum(axis=0)).ravel())
+    norms[norms == 0] = 1.0
+    normalized = interactions @ sparse.diags(1.0 / norms)
+    similarity = (normalized.T @ normalized).tocsr()
+    similarity.setdiag(0)
+    similarity.eliminate_zeros()
+    return similarity
+
+
+class RecommendationService:
+    
+    def __init__(
+        self,
+        vendor_recommendation_repo: RecommendationRepository,
+        user_recommendation_repo: RecommendationRepository,
+        vendor_repo: VendorRepository = None,
+        favorite_repo: FavoriteRepository = None,
+        booking_repo: BookingRepository = None
+    ):
+        self.vendor_recommendation_repo = vendor_recommendation_repo
+        self.user_recommendation_repo = user_recommendation_repo
+        self.vendor_repo = vendor_repo
+        self.favorite_repo = favorite_repo
+        self.booking_repo = booking_repo
+    
+    async def get_similar_vendors(self, vendor_id: str, limit: int = DEFAULT_TOP_K) -> List[dict]:
+        recommendations = await self.vendor_recommendation_repo.get_for(vendor_id)
+        return recommendations[:limit]
+    
+    async def get_user_recommendations(self, user_id: str, limit: int = DEFAULT_TOP_K) -> List[dict]:
+        recommendations = await self.user_recommendation_repo.get_for(user_id)
+        return recommendations[:limit]
+    
+    async def _load_interactions(self, vendor_index: Dict[str, int]):
+        favorites = await self.favorite_repo.get_user_vendor_pairs()
+        bookings = await self.booking_repo.get_user_vendor_pairs(BOOKING_SIGNAL_STATUSES)
+        
+        user_index: Dict[str, int] = {}
+        rows, columns, weights = [], [], []
+        for pairs, weight in ((favorites, FAVORITE_WEIGHT), (bookings, BOOKING_WEIGHT)):
+            for user_id, vendor_id in pairs:
+                column = vendor_index.get(vendor_id)
+                if column is None:
+                    continue
+                rows.append(user_index.setdefault(user_id, len(user_index)))
+                columns.append(column)
+                weights.append(weight)
+        
+        interactions = sparse.coo_matrix(
+            (np.array(weights, dtype=np.float64), (np.array(rows, dtype=np.int64), np.array(columns, dtype=np.int64))),
+            shape=(len(user_index), len(vendor_index))
+        ).tocsr()
+        interactions.sum_duplicates()
+        return interactions, user_index
+    
+    async def rebuild(self, top_k: int = DEFAULT_TOP_K) -> dict:
+        built_at = datetime.utcnow()
+        vendors = await self.vendor_repo.get_summaries({"is_approved": True, "is_active": True})
+        vendor_index = {v["_id"]: i for i, v in enumerate(vendors)}
+        interactions, user_index = await self._load_interactions(vendor_index)
+        
+        def summary(column: int, score: float) -> dict:
+            vendor = vendors[column]
+            return {
+                "vendor_id": vendor["_id"],
+                "business_name": vendor.get("business_name", ""),
+                "service_category": vendor.get("service_category", ""),
+                "business_address": vendor.get("business_address"),
+                "image_url": vendor.get("image_url"),
+                "rating": vendor.get("rating") or 0.0,
+                "score": round(score, 4)
+            }
+        
+        if interactions.nnz == 0:
+            await self.vendor_recommendation_repo.replace_all({}, built_at)
+            await self.user_recommendation_repo.replace_all({}, built_at)
+            return {"vendors": 0, "users": 0, "interactions": 0, "built_at": built_at}
+        
+        similarity = cosine_similarity(interactions)
+        vendor_recommendations = {
+            vendors[row]["_id"]: [summary(column, score) for column, score in neighbours]
+            for row, neighbours in enumerate(top_k_rows(similarity, top_k))
+            if neighbours
+        }
+        
+        user_scores = (interactions @ similarity).tocsr()
+        seen = interactions.copy()
+        seen.data[:] = 1.0
+        user_scores = (user_scores - user_scores.multiply(seen)).tocsr()
+        user_scores.eliminate_zeros()
+        user_ids = list(user_index)
+        user_recommendations = {
+            user_ids[row]: [summary(column, score) for column, score in ranked]
+            for row, ranked in enumerate(top_k_rows(user_scores, top_k))
+            if ranked
+        }
+        
+        await self.vendor_recommendation_repo.replace_all(vendor_recommendations, built_at)
+        await self.user_recommendation_repo.replace_all(user_recommendations, built_at)
+        
+        return {
+            "vendors": len(vendor_recommendations),
+            "users": len(user_recommendations),
+            "interactions": int(interactions.nnz),
+            "built_at": built_at
+        }
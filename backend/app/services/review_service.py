@@ -5,6 +5,11 @@ from app.repositories.user_repository import UserRepository
 from app.repositories.booking_repository import BookingRepository
 from app.models.review import ReviewCreate, ReviewUpdate, ReviewBase
 from app.services.vendor_stats_service import VendorStatsService
+from app.core.patterns.observer import EventType
+from app.services.outbox_service import outbox_transaction
+import logging
+
+logger = logging.getLogger(__name__)
 
 
 class ReviewService:
@@ -51,14 +56,14 @@ class ReviewService:
             booking_vendor_id_str = str(booking_vendor_id)
             review_vendor_id_str = str(review_vendor_id)
             
-            print(f"[DEBUG CREATE REVIEW] Booking vendor_id: {booking_vendor_id} (type: {type(booking_vendor_id)})")
-            print(f"[DEBUG CREATE REVIEW] Review vendor_id: {review_vendor_id} (type: {type(review_vendor_id)})")
+            logger.debug(f"Booking vendor_id: {booking_vendor_id} (type: {type(booking_vendor_id)})")
+            logger.debug(f"Review vendor_id: {review_vendor_id} (type: {type(review_vendor_id)})")
             
             if booking_vendor_id_str != review_vendor_id_str:
                 raise ValueError("Vendor ID does not match the booking")
             
             review_dict["vendor_id"] = booking_vendor_id
-            print(f"[DEBUG CREATE REVIEW] Using booking's vendor_id: {review_dict['vendor_id']} (type: {type(review_dict['vendor_id'])})")
+            logger.debug(f"Using booking's vendor_id: {review_dict['vendor_id']} (type: {type(review_dict['vendor_id'])})")
         elif self.booking_repo:
             user_id = str(review_dict.get("user_id", ""))
             vendor_id = str(review_dict.get("vendor_id", ""))
@@ -80,9 +85,9 @@ class ReviewService:
             try:
                 vendor_id_before = review_dict["vendor_id"]
                 review_dict["vendor_id"] = ObjectId(review_dict["vendor_id"])
-                print(f"[DEBUG CREATE REVIEW] Converted vendor_id to ObjectId: {vendor_id_before} -> {review_dict['vendor_id']}")
+                logger.debug(f"Converted vendor_id to ObjectId: {vendor_id_before} -> {review_dict['vendor_id']}")
             except Exception as e:
-                print(f"[DEBUG CREATE REVIEW] Failed to convert vendor_id to ObjectId: {e}, keeping as: {review_dict['vendor_id']}")
+                logger.debug(f"Failed to convert vendor_id to ObjectId: {e}, keeping as: {review_dict['vendor_id']}")
                 pass
         if "user_id" in review_dict and review_dict["user_id"]:
             try:
@@ -95,11 +100,19 @@ class ReviewService:
             except:
                 pass
         
-        review = await self.review_repo.create(review_dict)
+        async with outbox_transaction(self.review_repo.db) as outbox:
+            review = await self.review_repo.create(review_dict, session=outbox.session)
+            await outbox.add(EventType.REVIEW_CREATED, {
+                "review_id": str(review.get("_id", "")),
+                "vendor_id": str(review_dict.get("vendor_id", "")),
+                "user_id": str(review_dict.get("user_id", "")),
+                "rating": review_dict.get("rating")
+            })
         
         if stats_service and review_dict.get("vendor_id"):
             vendor_id = str(review_dict["vendor_id"])
-            await stats_service.update_vendor_stats(vendor_id)
+            await stats_service.schedule_update(vendor_id)
+            await stats_service.record_review(vendor_id, review_dict["rating"], 1)
         
         return review
     
@@ -126,11 +139,14 @@ class ReviewService:
         update_dict = review_data.model_dump(exclude_unset=True)
         update_dict["updated_at"] = datetime.utcnow()
         
+        previous = await self.review_repo.get_by_id(review_id) if stats_service and "rating" in update_dict else None
         review = await self.review_repo.update(review_id, update_dict)
         
         if stats_service and review and "rating" in update_dict:
             vendor_id = str(review.get("vendor_id", ""))
-            await stats_service.update_vendor_stats(vendor_id)
+            await stats_service.schedule_update(vendor_id)
+            if previous:
+                await stats_service.record_review(vendor_id, update_dict["rating"] - previous.get("rating", 0), 0)
         
         return review
     
@@ -144,7 +160,8 @@ class ReviewService:
         deleted = await self.review_repo.delete(review_id)
         
         if deleted and stats_service and vendor_id:
-            await stats_service.update_vendor_stats(vendor_id)
+            await stats_service.schedule_update(vendor_id)
+            await stats_service.record_review(vendor_id, -review.get("rating", 0), -1)
         
         return deleted
     
@@ -0,0 +1,152 @@
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
+from email.message import Message
+from typing import List, Optional
+import aiosmtplib
+from app.core.patterns.singleton import get_metrics
+
+logger = logging.getLogger(__name__)
+
+SMTP_POOL_SIZE = 4
+SMTP_TIMEOUT_SECONDS = 30
+SMTP_HEALTH_CHECK_IDLE_SECONDS = 30
+SMTP_MAX_CONNECTION_AGE_SECONDS = 600
+SMTP_MAX_ATTEMPTS = 3
+SMTP_RETRY_BASE_SECONDS = 1
+
+CONNECTION_ERRORS = (
+    aiosmtplib.SMTPServerDisconnected,
+    aiosmtplib.SMTPConnectError,
+    aiosmtplib.SMTPTimeoutError,
+    ConnectionError,
+    asyncio.TimeoutError,
+    OSError,
+)
+
+
+def is_transient(error: Exception) -> bool:
+    if isinstance(error, aiosmtplib.SMTPRecipientsRefused):
+        return all(400 <= recipient.code < 500 for recipient in error.recipients)
+    if isinstance(error, aiosmtplib.SMTPResponseException):
+        return 400 <= error.code < 500
+    return isinstance(error, CONNECTION_ERRORS)
+
+
+class PooledConnection:
+    
+    def __init__(self, smtp: aiosmtplib.SMTP):
+        self.smtp = smtp
+        self.created_at = time.monotonic()
+        self.last_used = self.created_at
+
+
+class SMTPConnectionPool:
+    
+    def __init__(
+        self,
+        hostname: str,
+        port: int,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        start_tls: bool = True,
+        size: int = SMTP_POOL_SIZE
+    ):
+        self.hostname = hostname
+        self.port = port
+        self.username = username or None
+        self.password = password or None
+        self.start_tls = start_tls
+        self.size = size
+        self._slots: Optional[asyncio.LifoQueue] = None
+    
+    def _get_slots(self) -> asyncio.LifoQueue:
+        if self._slots is None:
+            self._slots = asyncio.LifoQueue()
+            for _ in range(self.size):
+                self._slots.put_nowait(None)
+        return self._slots
+    
+    async def _connect(self) -> PooledConnection:
+        smtp = aiosmtplib.SMTP(
+            hostname=self.hostname,
+            port=self.port,
+            username=self.username,
+            password=self.password,
+            start_tls=self.start_tls,
+            timeout=SMTP_TIMEOUT_SECONDS,
+        )
+        await smtp.connect()
+        get_metrics().increment_counter("email.smtp.connects")
+        return PooledConnection(smtp)
+    
+    async def _is_healthy(self, connection: PooledConnection) -> bool:
+        if not connection.smtp.is_connected:
+            return False
+        now = time.monotonic()
+        if now - connection.created_at > SMTP_MAX_CONNECTION_AGE_SECONDS:
+            return False
+        if now - connection.last_used > SMTP_HEALTH_CHECK_IDLE_SECONDS:
+            try:
+                await connection.smtp.noop()
+            except Exception:
+                return False
+        return True
+    
+    async def _discard(self, connection: Optional[PooledConnection]):
+        if connection is None:
+            return
+        try:
+            if connection.smtp.is_connected:
+                await connection.smtp.quit()
+        except Exception:
+            connection.smtp.close()
+    
+    @asynccontextmanager
+    async def connection(self):
+        slots = self._get_slots()
+        pooled = await slots.get()
+        try:
+            if pooled is not None and not await self._is_healthy(pooled):
+                await self._discard(pooled)
+                pooled = None
+            if pooled is None:
+                pooled = await self._connect()
+            
+            yield pooled.smtp
+            pooled.last_used = time.monotonic()
+        except BaseException as e:
+            if pooled is not None and not isinstance(e, (aiosmtplib.SMTPResponseException, aiosmtplib.SMTPRecipientsRefused)):
+                await self._discard(pooled)
+                pooled = None
+            raise
+        finally:
+            slots.put_nowait(pooled)
+    
+    async def send(self, message: Message):
+        for attempt in range(1, SMTP_MAX_ATTEMPTS + 1):
+            try:
+                async with self.connection() as smtp:
+                    await smtp.send_message(message)
+                return
+            except Exception as e:
+                if attempt == SMTP_MAX_ATTEMPTS or not is_transient(e):
+                    raise
+                get_metrics().increment_counter("email.smtp.retries")
+                logger.warning(f"SMTP send to {message['To']} failed (attempt {attempt}): {str(e)}")
+                await asyncio.sleep(SMTP_RETRY_BASE_SECONDS * 2 ** (attempt - 1))
+    
+    async def send_many(self, messages: List[Message]) -> List[Optional[Exception]]:
+        results = await asyncio.gather(*(self.send(message) for message in messages), return_exceptions=True)
+        return [result if isinstance(result, Exception) else None for result in results]
+    
+    async def close(self):
+        if self._slots is None:
+            return
+        connections = []
+        while not self._slots.empty():
+            connections.append(self._slots.get_nowait())
+        for connection in connections:
+            await self._discard(connection)
+        self._slots = None
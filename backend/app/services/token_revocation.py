@@ -0,0 +1,104 @@
+import asyncio
+import logging
+import time
+from datetime import datetime, timedelta
+from typing import Dict, Optional
+from app.core.config import settings
+from app.repositories.token_revocation_repository import TokenRevocationRepository
+
+logger = logging.getLogger(__name__)
+
+REVOCATION_SYNC_SECONDS = 1.0
+REVOCATION_SYNC_OVERLAP_SECONDS = 5
+REVOCATION_LEEWAY_SECONDS = 60
+REVOCATION_PRUNE_SECONDS = 60
+
+
+class TokenRevocationList:
+    
+    def __init__(self):
+        self._repo: Optional[TokenRevocationRepository] = None
+        self._task: Optional[asyncio.Task] = None
+        self._user_valid_after: Dict[str, float] = {}
+        self._revoked_tokens: Dict[str, float] = {}
+        self._synced_until = datetime.min
+    
+    def is_revoked(self, payload: dict) -> bool:
+        valid_after = self._user_valid_after.get(payload.get("sub"))
+        if valid_after is not None and payload.get("iat", 0) < valid_after:
+            return True
+        return payload.get("jti") in self._revoked_tokens
+    
+    async def revoke_user(self, user_id: str):
+        valid_after = time.time()
+        expires_at = datetime.utcnow() + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES, seconds=REVOCATION_LEEWAY_SECONDS)
+        self._user_valid_after[user_id] = max(valid_after, self._user_valid_after.get(user_id, 0))
+        await self._get_repo().revoke_user(user_id, valid_after, expires_at)
+    
+    async def revoke_token(self, jti: str, exp: int):
+        self._revoked_tokens[jti] = exp + REVOCATION_LEEWAY_SECONDS
+        await self._get_repo().revoke_token(jti, datetime.utcfromtimestamp(exp + REVOCATION_LEEWAY_SECONDS))
+    
+    def _get_repo(self) -> TokenRevocationRepository:
+        if self._repo is None:
+            raise RuntimeError("Token revocation list has not been started")
+        return self._repo
+    
+    def _apply(self, revocation: dict):
+        expires_at = (revocation["expires_at"] - datetime(1970, 1, 1)).total_seconds()
+        if revocation["kind"] == "user":
+            current = self._user_valid_after.get(revocation["key"], 0)
+            self._user_valid_after[revocation["key"]] = max(current, revocation["valid_after"])
+        else:
+            self._revoked_tokens[revocation["key"]] = expires_at
+    
+    def _prune(self):
+        now = time.time()
+        stale_after = settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60 + REVOCATION_LEEWAY_SECONDS
+        self._user_valid_after = {
+            user_id: valid_after for user_id, valid_after in self._user_valid_after.items()
+            if now - valid_after < stale_after
+        }
+        self._revoked_tokens = {jti: expires_at for jti, expires_at in self._revoked_tokens.items() if expires_at > now}
+    
+    async def sync(self):
+        started = datetime.utcnow()
+        revocations = await self._get_repo().get_changed_since(self._synced_until)
+        for revocation in revocations:
+            self._apply(revocation)
+        self._synced_until = started - timedelta(seconds=REVOCATION_SYNC_OVERLAP_SECONDS)
+    
+    async def start(self, database):
+        self._repo = TokenRevocationRepository(database)
+        await self.sync()
+        self._task = asyncio.create_task(self._run())
+        logger.info(f"TokenRevocationList: loaded {len(self._user_valid_after)} users and {len(self._revoked_tokens)} tokens")
+    
+    async def stop(self):
+        if self._task is None:
+            return
+        self._task.cancel()
+        await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
+    
+    async def _run(self):
+        pruned_at = time.monotonic()
+        while True:
+            await asyncio.sleep(REVOCATION_SYNC_SECONDS)
+            try:
+                await self.sync()
+                if time.monotonic() - pruned_at > REVOCATION_PRUNE_SECONDS:
+                    self._prune()
+                    pruned_at = time.monotonic()
+            except Exception as e:
+                logger.error(f"TokenRevocationList: sync failed: {str(e)}")
+
+
+_revocation_list = None
+
+
+def get_revocation_list() -> TokenRevocationList:
+    global _revocation_list
+    if _revocation_list is None:
+        _revocation_list = TokenRevocationList()
+    return _revocation_list
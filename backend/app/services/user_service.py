@@ -2,9 +2,21 @@ from typing import Optional, List
 from datetime import datetime
 from app.repositories.user_repository import UserRepository
 from app.models.user import UserCreate, UserUpdate, UserResponse
-from app.core.security import hash_password, verify_password
+from app.core.security import hash_password_async, verify_password_async
 from app.core.password_validator import validate_password_strength
-from app.core.exceptions import ValidationException
+from app.core.exceptions import ValidationException, AdminApprovalPendingException
+from app.core.patterns.observer import EventType
+from app.core.patterns.singleton import get_cache
+from app.services.budget_service import invalidate_price_tables
+from app.services.outbox_service import outbox_transaction
+from app.services.token_revocation import get_revocation_list
+
+PRINCIPAL_CACHE_PREFIX = "auth:principal:"
+PRINCIPAL_TTL_SECONDS = 60
+
+
+def invalidate_principal(user_id: str):
+    get_cache().delete(PRINCIPAL_CACHE_PREFIX + str(user_id))
 
 
 class UserService:
@@ -23,7 +35,7 @@ class UserService:
             error_message = "Password is too weak. " + "; ".join(issues)
             raise ValidationException(detail=error_message)
         
-        hashed_password = hash_password(user_data.password)
+        hashed_password = await hash_password_async(user_data.password)
         
         user_dict = user_data.model_dump(exclude={"password"})
         user_dict["hashed_password"] = hashed_password
@@ -37,7 +49,11 @@ class UserService:
         else:
             user_dict["is_admin_approved"] = None
         
-        user = await self.user_repo.create(user_dict)
+        async with outbox_transaction(self.user_repo.db) as outbox:
+            user = await self.user_repo.create(user_dict, session=outbox.session)
+            await outbox.add(EventType.USER_REGISTERED, {
+                "user_id": str(user["_id"]), "email": user["email"], "role": user.get("role")
+            })
         
         if "_id" in user:
             user["id"] = str(user["_id"])
@@ -54,26 +70,56 @@ class UserService:
     async def get_user_by_email(self, email: str) -> Optional[dict]:
         return await self.user_repo.get_by_email(email)
     
+    async def get_principal(self, user_id: str) -> Optional[dict]:
+        cache = get_cache()
+        principal = cache.get(PRINCIPAL_CACHE_PREFIX + user_id)
+        if principal is None:
+            principal = await self.user_repo.get_principal(user_id)
+            if principal is None:
+                return None
+            cache.set(PRINCIPAL_CACHE_PREFIX + user_id, principal, ttl=PRINCIPAL_TTL_SECONDS)
+        return dict(principal)
+    
     async def update_user(self, user_id: str, user_data: UserUpdate) -> Optional[dict]:
         update_dict = user_data.model_dump(exclude_unset=True)
         update_dict["updated_at"] = datetime.utcnow()
-        return await self.user_repo.update(user_id, update_dict)
+        user = await self.user_repo.update(user_id, update_dict)
+        invalidate_principal(user_id)
+        return user
+    
+    async def set_active(self, user_id: str, is_active: bool) -> Optional[dict]:
+        user = await self.user_repo.update(user_id, {"is_active": is_active})
+        invalidate_principal(user_id)
+        if user and user.get("role") == "vendor":
+            invalidate_price_tables()
+        if not is_active:
+            await get_revocation_list().revoke_user(user_id)
+        return user
+    
+    async def approve_admin(self, user_id: str) -> Optional[dict]:
+        user = await self.user_repo.update(user_id, {"is_admin_approved": True, "is_active": True})
+        invalidate_principal(user_id)
+        return user
     
     async def delete_user(self, user_id: str) -> bool:
-        return await self.user_repo.delete(user_id)
+        deleted = await self.user_repo.delete(user_id)
+        invalidate_principal(user_id)
+        if deleted:
+            await get_revocation_list().revoke_user(user_id)
+        return deleted
     
     async def authenticate_user(self, email: str, password: str) -> Optional[dict]:
         user = await self.user_repo.get_by_email(email)
         if not user:
             return None
         
-        if not verify_password(password, user["hashed_password"]):
-            return None
-        
-        if not user.get("is_active", True):
+        if not await verify_password_async(password, user["hashed_password"]):
             return None
         
         if user.get("role") == "admin" and user.get("is_admin_approved") is False:
+            raise AdminApprovalPendingException()
+        
+        if not user.get("is_active", True):
             return None
         
         return user
@@ -83,14 +129,17 @@ class UserService:
         if not user:
             return None
         
-        if not verify_password(old_password, user.get("hashed_password")):
+        if not await verify_password_async(old_password, user.get("hashed_password")):
             raise ValueError("Incorrect old password")
         
-        hashed_password = hash_password(new_password)
+        hashed_password = await hash_password_async(new_password)
         update_dict = {
             "hashed_password": hashed_password,
             "updated_at": datetime.utcnow()
         }
         
-        return await self.user_repo.update(user_id, update_dict)
+        updated_user = await self.user_repo.update(user_id, update_dict)
+        invalidate_principal(user_id)
+        await get_revocation_list().revoke_user(user_id)
+        return updated_user
 
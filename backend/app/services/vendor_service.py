@@ -1,19 +1,78 @@
 
 from typing import Optional, List
-from datetime import datetime
+from datetime import date, datetime
 from app.repositories.vendor_repository import VendorRepository
 from app.repositories.user_repository import UserRepository
 from app.models.vendor import VendorCreate, VendorUpdate
-from app.core.security import hash_password
+from app.core.security import hash_password_async
 from app.core.password_validator import validate_password_strength
 from app.core.exceptions import ValidationException
+from app.services.geocoding_service import geocoding_service
+from app.services.budget_service import invalidate_price_tables
+from app.services.vendor_stats_service import invalidate_leaderboard, LEADERBOARD_CACHE_PREFIX, LEADERBOARD_TTL_SECONDS, LEADERBOARD_SIZE
+from app.services.availability_service import AvailabilityService
+from app.core.patterns.singleton import get_cache
+from app.core.patterns.observer import EventType
+from app.services.outbox_service import outbox_transaction
+import logging
+
+logger = logging.getLogger(__name__)
+
+VENDOR_SORTS = {
+    "price_asc": [("min_package_price", 1)],
+    "price_desc": [("min_package_price", -1)],
+    "top_rated": [("ranking_score", -1)],
+}
+
+
+def package_price_fields(packages: Optional[List[dict]]) -> dict:
+    prices = [
+        float(p["price"]) for p in packages or []
+        if isinstance(p, dict) and isinstance(p.get("price"), (int, float))
+    ]
+    return {
+        "min_package_price": min(prices) if prices else None,
+        "max_package_price": max(prices) if prices else None
+    }
+
+
+def vendor_search_query(
+    category: Optional[str] = None,
+    min_price: Optional[float] = None,
+    max_price: Optional[float] = None,
+    exclude_ids: Optional[List[str]] = None
+) -> dict:
+    from bson import ObjectId
+    
+    query = {"is_approved": True, "is_active": True}
+    if category:
+        query["service_category"] = category
+    if exclude_ids:
+        query["_id"] = {"$nin": [ObjectId(vendor_id) for vendor_id in exclude_ids if ObjectId.is_valid(vendor_id)]}
+    
+    if min_price is not None or max_price is not None:
+        price_range = {}
+        if min_price is not None:
+            price_range["$gte"] = min_price
+        if max_price is not None:
+            price_range["$lte"] = max_price
+            query["min_package_price"] = {"$lte": max_price}
+        query["packages"] = {"$elemMatch": {"price": price_range}}
+    
+    return query
 
 
 class VendorService:
     
-    def __init__(self, vendor_repository: VendorRepository, user_repository: UserRepository):
+    def __init__(
+        self,
+        vendor_repository: VendorRepository,
+        user_repository: UserRepository,
+        availability_service: Optional[AvailabilityService] = None
+    ):
         self.vendor_repo = vendor_repository
         self.user_repo = user_repository
+        self.availability_service = availability_service
     
     async def register_vendor(self, vendor_data: VendorCreate) -> dict:
         
@@ -34,12 +93,16 @@ class VendorService:
             "full_name": vendor_data.contact_person,
             "phone_number": vendor_data.phone_number,
             "role": "vendor",
-            "hashed_password": hash_password(vendor_data.password),
+            "hashed_password": await hash_password_async(vendor_data.password),
             "is_active": True,
             "created_at": datetime.utcnow(),
             "updated_at": datetime.utcnow()
         }
-        user = await self.user_repo.create(user_dict)
+        async with outbox_transaction(self.user_repo.db) as outbox:
+            user = await self.user_repo.create(user_dict, session=outbox.session)
+            await outbox.add(EventType.USER_REGISTERED, {
+                "user_id": str(user["_id"]), "email": user["email"], "role": "vendor"
+            })
         
         
         vendor_dict = vendor_data.model_dump(exclude={"password"})
@@ -105,7 +168,11 @@ class VendorService:
                 }
             ]
         
+        vendor_dict.update(geocoding_service.geocode_fields(vendor_dict.get("business_address")))
+        vendor_dict.update(package_price_fields(vendor_dict.get("packages")))
+        
         vendor = await self.vendor_repo.create(vendor_dict)
+        invalidate_price_tables(vendor.get("service_category"))
         
         
         if "_id" in vendor:
@@ -137,13 +204,75 @@ class VendorService:
     async def update_vendor(self, vendor_id: str, vendor_data: VendorUpdate) -> Optional[dict]:
        
         update_dict = vendor_data.model_dump(exclude_unset=True)
+        if "business_address" in update_dict:
+            update_dict.update(geocoding_service.geocode_fields(update_dict["business_address"]))
+        if "packages" in update_dict:
+            update_dict.update(package_price_fields(update_dict["packages"]))
         update_dict["updated_at"] = datetime.utcnow()
-        return await self.vendor_repo.update(vendor_id, update_dict)
+        vendor = await self.vendor_repo.update(vendor_id, update_dict)
+        if vendor and "packages" in update_dict:
+            invalidate_price_tables(vendor.get("service_category"))
+        if vendor and "daily_capacity" in update_dict and self.availability_service:
+            await self.availability_service.refresh_capacity(vendor_id, update_dict["daily_capacity"])
+        return vendor
+    
+    async def _unavailable_vendor_ids(self, available_on: Optional[date]) -> Optional[List[str]]:
+        if not available_on or not self.availability_service:
+            return None
+        return await self.availability_service.get_unavailable_vendor_ids(available_on)
+    
+    async def search_vendors(
+        self,
+        category: Optional[str] = None,
+        min_price: Optional[float] = None,
+        max_price: Optional[float] = None,
+        sort: Optional[str] = None,
+        skip: int = 0,
+        limit: int = 100,
+        available_on: Optional[date] = None
+    ):
+        query = vendor_search_query(category, min_price, max_price, await self._unavailable_vendor_ids(available_on))
+        return await self.vendor_repo.search(query, VENDOR_SORTS.get(sort), skip, limit)
+    
+    async def get_top_vendors(self, category: str, skip: int = 0, limit: int = 10):
+        cache = get_cache()
+        key = LEADERBOARD_CACHE_PREFIX + category
+        leaderboard = cache.get(key)
+        if leaderboard is None:
+            leaderboard = await self.vendor_repo.get_leaderboard(category, LEADERBOARD_SIZE)
+            cache.set(key, leaderboard, ttl=LEADERBOARD_TTL_SECONDS)
+        return [vendor.copy() for vendor in leaderboard[skip:skip + limit]]
+    
+    async def search_vendors_near(
+        self,
+        near: str,
+        radius_km: float,
+        category: Optional[str] = None,
+        min_price: Optional[float] = None,
+        max_price: Optional[float] = None,
+        sort: Optional[str] = None,
+        skip: int = 0,
+        limit: int = 100,
+        available_on: Optional[date] = None
+    ):
+        coordinates = geocoding_service.resolve_point(near)
+        if coordinates is None:
+            raise ValueError(f"Could not resolve location '{near}'")
+        
+        query = vendor_search_query(category, min_price, max_price, await self._unavailable_vendor_ids(available_on))
+        return await self.vendor_repo.find_near(coordinates, radius_km * 1000, query, VENDOR_SORTS.get(sort), skip, limit)
     
     async def approve_vendor(self, vendor_id: str) -> Optional[dict]:
         
-        vendor = await self.vendor_repo.approve_vendor(vendor_id)
+        async with outbox_transaction(self.vendor_repo.db) as outbox:
+            vendor = await self.vendor_repo.approve_vendor(vendor_id, outbox.session)
+            if vendor:
+                await outbox.add(EventType.VENDOR_APPROVED, {
+                    "vendor_id": vendor_id, "email": vendor.get("email"), "business_name": vendor.get("business_name")
+                })
         if vendor:
+            invalidate_leaderboard(vendor.get("service_category"))
+            invalidate_price_tables(vendor.get("service_category"))
             if "_id" in vendor:
                 vendor["id"] = str(vendor["_id"])
                 del vendor["_id"]
@@ -158,8 +287,15 @@ class VendorService:
     
     async def reject_vendor(self, vendor_id: str) -> Optional[dict]:
       
-        vendor = await self.vendor_repo.reject_vendor(vendor_id)
+        async with outbox_transaction(self.vendor_repo.db) as outbox:
+            vendor = await self.vendor_repo.reject_vendor(vendor_id, outbox.session)
+            if vendor:
+                await outbox.add(EventType.VENDOR_REJECTED, {
+                    "vendor_id": vendor_id, "email": vendor.get("email"), "business_name": vendor.get("business_name")
+                })
         if vendor:
+            invalidate_leaderboard(vendor.get("service_category"))
+            invalidate_price_tables(vendor.get("service_category"))
             
             if "_id" in vendor:
                 vendor["id"] = str(vendor["_id"])
@@ -213,12 +349,12 @@ class VendorService:
     
     async def create_vendor_as_admin(self, vendor_data: VendorCreate) -> dict:
        
-        print(f"[VENDOR_SERVICE] Starting vendor creation for: {vendor_data.email}")
+        logger.debug(f"Starting vendor creation for: {vendor_data.email}")
         
         
         existing_user = await self.user_repo.get_by_email(vendor_data.email)
         if existing_user:
-            print(f"[VENDOR_SERVICE] ERROR: User with email {vendor_data.email} already exists")
+            logger.warning(f"User with email {vendor_data.email} already exists")
             raise ValueError("User with this email already exists")
         
         
@@ -227,22 +363,22 @@ class VendorService:
             error_message = "Password is too weak. " + "; ".join(issues)
             raise ValidationException(detail=error_message)
         
-        print(f"[VENDOR_SERVICE] Creating user account...")
+        logger.debug(f"Creating user account...")
         
         user_dict = {
             "email": vendor_data.email,
             "full_name": vendor_data.contact_person,
             "phone_number": vendor_data.phone_number,
             "role": "vendor",
-            "hashed_password": hash_password(vendor_data.password),
+            "hashed_password": await hash_password_async(vendor_data.password),
             "is_active": True,
             "created_at": datetime.utcnow(),
             "updated_at": datetime.utcnow()
         }
         user = await self.user_repo.create(user_dict)
-        print(f"[VENDOR_SERVICE] User created with ID: {user.get('_id')}")
+        logger.debug(f"User created with ID: {user.get('_id')}")
         
-        print(f"[VENDOR_SERVICE] Creating vendor profile...")
+        logger.debug(f"Creating vendor profile...")
        
         vendor_dict = vendor_data.model_dump(exclude={"password"})
         vendor_dict["user_id"] = user["_id"]
@@ -308,7 +444,11 @@ class VendorService:
                 }
             ]
         
+        vendor_dict.update(geocoding_service.geocode_fields(vendor_dict.get("business_address")))
+        vendor_dict.update(package_price_fields(vendor_dict.get("packages")))
+        
         vendor = await self.vendor_repo.create(vendor_dict)
-        print(f"[VENDOR_SERVICE] Vendor created successfully with ID: {vendor.get('_id')}")
+        invalidate_price_tables(vendor.get("service_category"))
+        logger.debug(f"Vendor created successfully with ID: {vendor.get('_id')}")
         return vendor
 
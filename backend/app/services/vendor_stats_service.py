@@ -1,8 +1,61 @@
 from app.repositories.vendor_repository import VendorRepository
 from app.repositories.booking_repository import BookingRepository
 from app.repositories.review_repository import ReviewRepository
+from app.core.patterns.singleton import get_cache
+from app.services.job_queue import get_job_queue
 from bson import ObjectId
+from datetime import datetime
 from typing import Optional
+import math
+
+RANKING_PRIOR_WEIGHT = 5
+RANKING_DEFAULT_PRIOR = 3.5
+RANKING_ACTIVITY_WEIGHT = 0.25
+RANKING_HALF_LIFE_DAYS = 90
+RANKING_EPOCH = datetime(2024, 1, 1)
+RANKING_PRIOR_CACHE_KEY = "ranking:prior"
+RANKING_PRIOR_TTL_SECONDS = 3600
+LEADERBOARD_CACHE_PREFIX = "vendors:leaderboard:"
+LEADERBOARD_TTL_SECONDS = 300
+LEADERBOARD_SIZE = 50
+REVENUE_STATUSES = ["approved", "confirmed", "completed"]
+VENDOR_STATS_JOB = "vendor_stats"
+VENDOR_STATS_COALESCE_SECONDS = 5
+
+DECAY_RATE = math.log(2) / (RANKING_HALF_LIFE_DAYS * 86400)
+
+
+def activity_weight(at: datetime, weight: float = 1.0) -> float:
+    return weight * math.exp(DECAY_RATE * (at - RANKING_EPOCH).total_seconds())
+
+
+def ranking_score(vendor: dict, prior: float, now: Optional[datetime] = None) -> float:
+    review_count = vendor.get("review_count") or 0
+    rating_sum = vendor.get("rating_sum") or 0.0
+    bayesian_rating = (RANKING_PRIOR_WEIGHT * prior + rating_sum) / (RANKING_PRIOR_WEIGHT + review_count)
+    
+    now = now or datetime.utcnow()
+    activity = (vendor.get("booking_activity") or 0.0) / activity_weight(now)
+    return round(bayesian_rating + RANKING_ACTIVITY_WEIGHT * math.log1p(activity), 4)
+
+
+def invalidate_leaderboard(category: Optional[str] = None):
+    cache = get_cache()
+    if category:
+        cache.delete(LEADERBOARD_CACHE_PREFIX + category)
+        return
+    for key in cache.keys():
+        if key.startswith(LEADERBOARD_CACHE_PREFIX):
+            cache.delete(key)
+
+
+async def run_vendor_stats_job(database, payload: dict):
+    stats_service = VendorStatsService(
+        VendorRepository(database),
+        BookingRepository(database),
+        ReviewRepository(database)
+    )
+    await stats_service.update_vendor_stats(payload["vendor_id"])
 
 
 class VendorStatsService:
@@ -56,27 +109,49 @@ class VendorStatsService:
             "rating": round(avg_rating, 1)
         })
     
-    async def increment_pending_requests(self, vendor_id: str):
-        vendor = await self.vendor_repo.get_by_id(vendor_id)
-        if vendor:
-            current_pending = vendor.get("pending_requests", 0)
-            await self.vendor_repo.update(vendor_id, {
-                "pending_requests": current_pending + 1
-            })
+    async def schedule_update(self, vendor_id: str):
+        await get_job_queue().enqueue(
+            VENDOR_STATS_JOB,
+            {"vendor_id": vendor_id},
+            dedupe_key=f"{VENDOR_STATS_JOB}:{vendor_id}",
+            delay_seconds=VENDOR_STATS_COALESCE_SECONDS
+        )
     
-    async def decrement_pending_requests(self, vendor_id: str):
-        vendor = await self.vendor_repo.get_by_id(vendor_id)
-        if vendor:
-            current_pending = max(0, vendor.get("pending_requests", 0) - 1)
-            await self.vendor_repo.update(vendor_id, {
-                "pending_requests": current_pending
-            })
+    async def record_booking_created(self, vendor_id: str):
+        await self.vendor_repo.increment_fields(vendor_id, {"total_bookings": 1, "pending_requests": 1})
     
-    async def add_revenue(self, vendor_id: str, amount: float):
-        vendor = await self.vendor_repo.get_by_id(vendor_id)
-        if vendor:
-            current_revenue = vendor.get("total_revenue", 0.0)
-            await self.vendor_repo.update(vendor_id, {
-                "total_revenue": current_revenue + amount
-            })
-
+    async def get_ranking_prior(self) -> float:
+        cache = get_cache()
+        prior = cache.get(RANKING_PRIOR_CACHE_KEY)
+        if prior is None:
+            totals = await self.vendor_repo.get_rating_totals()
+            prior = totals["rating_sum"] / totals["review_count"] if totals["review_count"] else RANKING_DEFAULT_PRIOR
+            cache.set(RANKING_PRIOR_CACHE_KEY, prior, ttl=RANKING_PRIOR_TTL_SECONDS)
+        return prior
+    
+    async def _apply_ranking_delta(self, vendor_id: str, increments: dict):
+        vendor = await self.vendor_repo.increment_fields(vendor_id, increments)
+        if not vendor:
+            return
+        
+        score = ranking_score(vendor, await self.get_ranking_prior())
+        await self.vendor_repo.update(vendor_id, {"ranking_score": score})
+        invalidate_leaderboard(vendor.get("service_category"))
+    
+    async def record_review(self, vendor_id: str, rating_delta: float, count_delta: int = 1):
+        await self._apply_ranking_delta(vendor_id, {"review_count": count_delta, "rating_sum": rating_delta})
+    
+    async def apply_booking_transition(self, vendor_id: str, old_status: str, new_status: str, amount: float):
+        increments = {}
+        pending_delta = int(new_status == "pending") - int(old_status == "pending")
+        if pending_delta:
+            increments["pending_requests"] = pending_delta
+        revenue_delta = (int(new_status in REVENUE_STATUSES) - int(old_status in REVENUE_STATUSES)) * (amount or 0)
+        if revenue_delta:
+            increments["total_revenue"] = revenue_delta
+        
+        if old_status == "pending" and new_status == "approved":
+            increments["booking_activity"] = activity_weight(datetime.utcnow())
+            await self._apply_ranking_delta(vendor_id, increments)
+        elif increments:
+            await self.vendor_repo.increment_fields(vendor_id, increments)
@@ -0,0 +1,93 @@
+"""
+Concurrency benchmark for slot reservation
+Fires many simultaneous bookings for the same vendor and date against a scratch database
+and checks that exactly `capacity` of them succeed while the rest get a 409 conflict
+"""
+import asyncio
+import sys
+import time
+from datetime import datetime
+from bson import ObjectId
+from motor.motor_asyncio import AsyncIOMotorClient
+from app.core.config import settings
+from app.core.exceptions import SlotUnavailableException
+from app.models.booking import BookingCreate
+from app.repositories.availability_repository import AvailabilityRepository
+from app.repositories.booking_repository import BookingRepository
+from app.repositories.vendor_repository import VendorRepository
+from app.services.availability_service import AvailabilityService
+from app.services.booking_service import BookingService
+
+REQUESTS = 1000
+CAPACITY = 3
+EVENT_DATE = datetime(2030, 12, 14)
+
+
+async def run_storm(requests: int = REQUESTS, capacity: int = CAPACITY):
+    """Book one vendor/date `requests` times concurrently and verify the reservation count"""
+    print(f"Booking storm: {requests} concurrent requests, capacity {capacity}...")
+
+    # Connect to a scratch database so real bookings are never touched
+    client = AsyncIOMotorClient(settings.DATABASE_URL, maxPoolSize=200)
+    database_name = f"{settings.DATABASE_NAME}_booking_storm"
+    db = client[database_name]
+
+    vendor_repo = VendorRepository(db)
+    availability_repo = AvailabilityRepository(db)
+    await availability_repo.ensure_indexes()
+    booking_service = BookingService(BookingRepository(db), AvailabilityService(availability_repo, vendor_repo))
+
+    vendor = await vendor_repo.create({
+        "business_name": "Storm Test Venue",
+        "service_category": "Venue",
+        "daily_capacity": capacity,
+        "is_approved": True,
+        "is_active": True
+    })
+    vendor_id = str(vendor["_id"])
+
+    async def book(index: int):
+        started = time.perf_counter()
+        try:
+            await booking_service.create_booking(BookingCreate(
+                user_id=f"storm-user-{index}",
+                vendor_id=vendor_id,
+                event_date=EVENT_DATE,
+                event_location="Lahore",
+                total_amount=100000
+            ))
+            return "booked", time.perf_counter() - started
+        except SlotUnavailableException:
+            return "conflict", time.perf_counter() - started
+
+    started = time.perf_counter()
+    results = await asyncio.gather(*(book(i) for i in range(requests)))
+    elapsed = time.perf_counter() - started
+
+    booked = sum(1 for outcome, _ in results if outcome == "booked")
+    conflicts = sum(1 for outcome, _ in results if outcome == "conflict")
+    latencies = sorted(latency for _, latency in results)
+    stored = await db["bookings"].count_documents({"vendor_id": ObjectId(vendor_id)})
+    document = await availability_repo.get_month(vendor_id, EVENT_DATE.strftime("%Y-%m"))
+    counter = document["booked"].get(str(EVENT_DATE.day), 0)
+
+    print(f"\n[SUMMARY]")
+    print(f"   Booked: {booked} (stored {stored}, counter {counter})")
+    print(f"   Conflicts (409): {conflicts}")
+    print(f"   Wall time: {elapsed * 1000:.0f} ms")
+    print(f"   Latency p50: {latencies[len(latencies) // 2] * 1000:.1f} ms, p99: {latencies[int(len(latencies) * 0.99)] * 1000:.1f} ms")
+
+    await client.drop_database(database_name)
+    client.close()
+
+    if booked != capacity or stored != capacity or counter != capacity:
+        print(f"[FAIL] Expected exactly {capacity} bookings")
+        sys.exit(1)
+    print(f"[OK] Exactly {capacity} bookings succeeded")
+
+
+if __name__ == "__main__":
+    asyncio.run(run_storm(
+        int(sys.argv[1]) if len(sys.argv) > 1 else REQUESTS,
+        int(sys.argv[2]) if len(sys.argv) > 2 else CAPACITY
+    ))
@@ -0,0 +1,260 @@
+"""
+SMTP connection pool checks and throughput benchmark
+First checks the pool's failure handling against a scripted local aiosmtpd server: reconnecting
+after the server drops the connection, evicting connections that fail the NOOP health check or
+are too old, retrying transient 4xx replies with backoff up to SMTP_MAX_ATTEMPTS and never
+retrying permanent 5xx replies.
+Then sends a batch of emails once with a new connection per message and once through the pooled
+EmailService.send_many, and checks that every message arrived.
+Requires the aiosmtpd package (pip install aiosmtpd)
+"""
+import asyncio
+import sys
+import time
+import aiosmtplib
+from aiosmtpd.controller import Controller
+from app.core.patterns.singleton import get_metrics
+from app.services.email_service import EmailService
+from app.services import smtp_pool
+from app.services.smtp_pool import SMTPConnectionPool
+
+MESSAGES = 500
+HANDSHAKE_DELAY_SECONDS = 0.02
+SMTP_PORT = 8025
+CHECK_PORT = 8026
+CHECK_RETRY_BASE_SECONDS = 0.05
+
+
+class CountingHandler:
+    """Accepts every message, simulating network latency on each new session"""
+    
+    def __init__(self):
+        self.received = 0
+        self.sessions = 0
+        self.deferred = set()
+    
+    async def handle_EHLO(self, server, session, envelope, hostname, responses):
+        self.sessions += 1
+        await asyncio.sleep(HANDSHAKE_DELAY_SECONDS)
+        session.host_name = hostname
+        return responses
+    
+    async def handle_RCPT(self, server, session, envelope, address, rcpt_options):
+        # Defer the first delivery attempt to every "retry" address to exercise the backoff path
+        if address.startswith("retry") and address not in self.deferred:
+            self.deferred.add(address)
+            return "451 Try again later"
+        envelope.rcpt_tos.append(address)
+        return "250 OK"
+    
+    async def handle_DATA(self, server, session, envelope):
+        self.received += 1
+        return "250 Message accepted"
+
+
+class ScriptedHandler:
+    """Replies according to the recipient address: defer-once, defer-always or reject; NOOP can be made to fail"""
+    
+    def __init__(self):
+        self.sessions = 0
+        self.received = 0
+        self.attempts = {}
+        self.fail_noop = False
+    
+    async def handle_EHLO(self, server, session, envelope, hostname, responses):
+        self.sessions += 1
+        session.host_name = hostname
+        return responses
+    
+    async def handle_NOOP(self, server, session, envelope, arg):
+        return "421 Service not available" if self.fail_noop else "250 OK"
+    
+    async def handle_RCPT(self, server, session, envelope, address, rcpt_options):
+        attempt = self.attempts[address] = self.attempts.get(address, 0) + 1
+        if address.startswith("defer-once") and attempt == 1:
+            return "451 Try again later"
+        if address.startswith("defer-always"):
+            return "451 Try again later"
+        if address.startswith("reject"):
+            return "550 No such user"
+        envelope.rcpt_tos.append(address)
+        return "250 OK"
+    
+    async def handle_DATA(self, server, session, envelope):
+        self.received += 1
+        return "250 Message accepted"
+
+
+async def run_checks() -> bool:
+    """Exercise reconnects, health-check eviction and the retry limits of the pool"""
+    handler = ScriptedHandler()
+    controller = Controller(handler, hostname="127.0.0.1", port=CHECK_PORT)
+    controller.start()
+    smtp_pool.SMTP_RETRY_BASE_SECONDS = CHECK_RETRY_BASE_SECONDS
+    email_service = EmailService()
+    email_service.pool = SMTPConnectionPool("127.0.0.1", CHECK_PORT, start_tls=False, size=1)
+    metrics = get_metrics()
+    failures = []
+    
+    def check(name: str, passed: bool, detail: str = ""):
+        print(f"   {'OK    ' if passed else 'FAILED'} {name}{f' ({detail})' if detail else ''}")
+        if not passed:
+            failures.append(name)
+    
+    def message(to_email: str):
+        return email_service.build_message(to_email, "Pool check", "<p>check</p>", "check")
+    
+    print("Checking connection pool failure handling...")
+    try:
+        await email_service.pool.send(message("first@example.com"))
+        await email_service.pool.send(message("second@example.com"))
+        check("connection is reused", handler.sessions == 1, f"{handler.sessions} sessions")
+        
+        # Server goes away and comes back: the pooled connection is dead and must be replaced
+        controller.stop()
+        controller = Controller(handler, hostname="127.0.0.1", port=CHECK_PORT)
+        controller.start()
+        await asyncio.sleep(0.1)
+        sessions = handler.sessions
+        try:
+            await email_service.pool.send(message("after-drop@example.com"))
+            delivered = True
+        except Exception as e:
+            delivered = False
+            print(f"          {type(e).__name__}: {e}")
+        check("reconnects after the server drops the connection", delivered and handler.sessions == sessions + 1)
+        
+        # Idle connection whose NOOP fails is evicted before use, without spending a retry
+        retries = metrics.get_counter("email.smtp.retries")
+        sessions = handler.sessions
+        smtp_pool.SMTP_HEALTH_CHECK_IDLE_SECONDS = 0
+        handler.fail_noop = True
+        await email_service.pool.send(message("after-noop@example.com"))
+        handler.fail_noop = False
+        smtp_pool.SMTP_HEALTH_CHECK_IDLE_SECONDS = 30
+        check(
+            "evicts a connection that fails the NOOP health check",
+            handler.sessions == sessions + 1 and metrics.get_counter("email.smtp.retries") == retries,
+            f"{handler.sessions - sessions} new session(s)"
+        )
+        
+        sessions = handler.sessions
+        smtp_pool.SMTP_MAX_CONNECTION_AGE_SECONDS = 0
+        await email_service.pool.send(message("after-age@example.com"))
+        smtp_pool.SMTP_MAX_CONNECTION_AGE_SECONDS = 600
+        check("replaces a connection older than the maximum age", handler.sessions == sessions + 1)
+        
+        # Transient 4xx: retried once, then delivered
+        retries = metrics.get_counter("email.smtp.retries")
+        await email_service.pool.send(message("defer-once@example.com"))
+        check(
+            "retries a transient 451 and delivers",
+            handler.attempts["defer-once@example.com"] == 2 and metrics.get_counter("email.smtp.retries") == retries + 1
+        )
+        
+        # Persistent 4xx: gives up after SMTP_MAX_ATTEMPTS with exponential backoff between attempts
+        expected_backoff = sum(CHECK_RETRY_BASE_SECONDS * 2 ** attempt for attempt in range(smtp_pool.SMTP_MAX_ATTEMPTS - 1))
+        started = time.perf_counter()
+        try:
+            await email_service.pool.send(message("defer-always@example.com"))
+            gave_up = False
+        except aiosmtplib.SMTPRecipientsRefused:
+            gave_up = True
+        elapsed = time.perf_counter() - started
+        attempts = handler.attempts["defer-always@example.com"]
+        check(
+            f"stops after {smtp_pool.SMTP_MAX_ATTEMPTS} attempts on a persistent 451",
+            gave_up and attempts == smtp_pool.SMTP_MAX_ATTEMPTS and elapsed >= expected_backoff,
+            f"{attempts} attempts in {elapsed:.2f}s, backoff {expected_backoff:.2f}s"
+        )
+        
+        # Permanent 5xx: not retried
+        try:
+            await email_service.pool.send(message("reject@example.com"))
+            rejected = False
+        except aiosmtplib.SMTPRecipientsRefused:
+            rejected = True
+        check("does not retry a permanent 550", rejected and handler.attempts["reject@example.com"] == 1)
+        
+        # send_many reports each message on its own
+        results = await email_service.send_many([
+            {"to_email": address, "subject": "Pool check", "html_content": "<p>check</p>"}
+            for address in ("ok-many@example.com", "defer-once-many@example.com", "reject-many@example.com")
+        ])
+        check("send_many reports per-message results", results == [True, True, False], str(results))
+    finally:
+        await email_service.close()
+        controller.stop()
+        smtp_pool.SMTP_RETRY_BASE_SECONDS = 1
+    
+    return not failures
+
+
+def build_emails(count: int):
+    return [
+        {
+            "to_email": f"{'retry' if index % 100 == 0 else 'guest'}{index}@example.com",
+            "subject": f"Benchmark message {index}",
+            "html_content": f"<p>Message {index}</p>",
+            "text_content": f"Message {index}"
+        }
+        for index in range(count)
+    ]
+
+
+async def run_benchmark(messages: int = MESSAGES):
+    """Compare per-message connections against the pooled send_many path"""
+    handler = CountingHandler()
+    controller = Controller(handler, hostname="127.0.0.1", port=SMTP_PORT)
+    controller.start()
+    
+    try:
+        # Keep retry backoff short so deferred messages don't dominate the timing
+        smtp_pool.SMTP_RETRY_BASE_SECONDS = 0.05
+        email_service = EmailService()
+        email_service.pool = SMTPConnectionPool("127.0.0.1", SMTP_PORT, start_tls=False)
+        emails = [email for email in build_emails(messages) if not email["to_email"].startswith("retry")]
+        
+        # Baseline: one connection, EHLO and QUIT per message
+        print(f"Sending {len(emails)} emails with a new connection per message...")
+        started = time.perf_counter()
+        for email in emails:
+            await aiosmtplib.send(email_service.build_message(**email), hostname="127.0.0.1", port=SMTP_PORT)
+        unpooled_seconds = time.perf_counter() - started
+        unpooled_sessions = handler.sessions
+        print(f"   {unpooled_seconds:.2f}s, {len(emails) / unpooled_seconds:.0f} msg/s, {unpooled_sessions} sessions")
+        
+        # Pooled: a few long-lived connections shared by concurrent sends
+        emails = build_emails(messages)
+        handler.received = 0
+        handler.sessions = 0
+        print(f"Sending {len(emails)} emails through the connection pool...")
+        started = time.perf_counter()
+        results = await email_service.send_many(emails)
+        pooled_seconds = time.perf_counter() - started
+        print(f"   {pooled_seconds:.2f}s, {len(emails) / pooled_seconds:.0f} msg/s, {handler.sessions} sessions")
+        print(f"   {len(handler.deferred)} deliveries were deferred once and retried")
+        
+        await email_service.close()
+    finally:
+        controller.stop()
+    
+    unpooled_rate = (messages - len(handler.deferred)) / unpooled_seconds
+    print(f"\nSpeedup: {(len(emails) / pooled_seconds) / unpooled_rate:.1f}x")
+    if not all(results) or handler.received != len(emails):
+        print(f"FAILED: {results.count(False)} sends failed, server received {handler.received} of {len(emails)}")
+        return False
+    print("OK: every message was delivered")
+    return True
+
+
+async def main() -> bool:
+    checks_ok = await run_checks()
+    print()
+    benchmark_ok = await run_benchmark()
+    return checks_ok and benchmark_ok
+
+
+if __name__ == "__main__":
+    ok = asyncio.run(main())
+    sys.exit(0 if ok else 1)
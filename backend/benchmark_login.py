@@ -0,0 +1,138 @@
+"""
+Login burst benchmark
+Fires a burst of logins from concurrent clients at the API while polling /health, once with PBKDF2 running
+on the event loop and once with the bounded password executor, and reports login throughput
+and the latency of the unrelated /health requests. Users are kept in memory, so no database is needed.
+"""
+import asyncio
+import statistics
+import time
+from urllib.parse import urlencode
+from app.api.dependencies import get_user_service
+from app.core import security
+from app.core.config import settings
+from app.services import user_service as user_service_module
+from app.services.user_service import UserService
+from main import app
+
+LOGINS = 200
+CLIENTS = 48
+HEALTH_INTERVAL_SECONDS = 0.005
+PASSWORD = "Benchmark#Pass123"
+
+
+class InMemoryUserRepository:
+    """Just enough of UserRepository for authenticate_user"""
+
+    def __init__(self, users: dict):
+        self.users = users
+
+    async def get_by_email(self, email: str):
+        return self.users.get(email)
+
+
+async def asgi_request(method: str, path: str, body: bytes = b"", content_type: str = "application/json"):
+    """Send one request straight into the ASGI app and return (status, latency_ms)"""
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "headers": [(b"host", b"benchmark"), (b"content-type", content_type.encode()), (b"content-length", str(len(body)).encode())],
+        "client": ("127.0.0.1", 12345),
+        "server": ("benchmark", 80),
+    }
+    messages = [{"type": "http.request", "body": body, "more_body": False}]
+    status = {}
+
+    async def receive():
+        return messages.pop(0) if messages else {"type": "http.disconnect"}
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            status["code"] = message["status"]
+
+    started = time.perf_counter()
+    await app(scope, receive, send)
+    return status.get("code"), (time.perf_counter() - started) * 1000
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+async def run_burst(label: str, logins: int):
+    health_latencies = []
+    stop = asyncio.Event()
+
+    async def poll_health():
+        # Latency is measured from when the request was due, so time spent waiting for a blocked loop counts
+        due = time.perf_counter()
+        while not stop.is_set():
+            await asgi_request("GET", "/health")
+            health_latencies.append((time.perf_counter() - due) * 1000)
+            due = time.perf_counter() + HEALTH_INTERVAL_SECONDS
+            await asyncio.sleep(HEALTH_INTERVAL_SECONDS)
+
+    codes = []
+
+    async def client(indexes):
+        for index in indexes:
+            body = urlencode({"username": f"user{index % 20}@example.com", "password": PASSWORD}).encode()
+            code, _ = await asgi_request("POST", "/api/auth/login", body, "application/x-www-form-urlencoded")
+            codes.append(code)
+
+    poller = asyncio.create_task(poll_health())
+    await asyncio.sleep(0.05)
+    started = time.perf_counter()
+    await asyncio.gather(*(client(range(offset, logins, CLIENTS)) for offset in range(CLIENTS)))
+    elapsed = time.perf_counter() - started
+    stop.set()
+    await poller
+
+    print(f"{label}:")
+    print(f"   logins: {codes.count(200)}/{logins} ok, {codes.count(503)} shed, in {elapsed:.2f}s ({logins / elapsed:.0f}/s)")
+    print(f"   /health during burst: {len(health_latencies)} requests, "
+          f"p50 {statistics.median(health_latencies):.1f}ms, p99 {percentile(health_latencies, 99):.1f}ms, "
+          f"max {max(health_latencies):.1f}ms")
+    return codes.count(200) == logins
+
+
+async def run_benchmark(logins: int = LOGINS):
+    hashed_password = security.hash_password(PASSWORD)
+    users = {
+        f"user{index}@example.com": {
+            "_id": f"user{index}", "email": f"user{index}@example.com", "full_name": f"User {index}",
+            "role": "user", "is_active": True, "hashed_password": hashed_password
+        }
+        for index in range(20)
+    }
+    app.dependency_overrides[get_user_service] = lambda: UserService(InMemoryUserRepository(users))
+    # Every login comes from one client address; the login rate limit would reject all but the first few
+    rate_limit_enabled = settings.RATE_LIMIT_ENABLED
+    settings.RATE_LIMIT_ENABLED = False
+
+    # Old behaviour: PBKDF2 runs inline on the event loop
+    async def verify_inline(plain_password, hashed):
+        return security.verify_password(plain_password, hashed)
+
+    user_service_module.verify_password_async = verify_inline
+    inline_ok = await run_burst("Inline hashing (event loop)", logins)
+
+    user_service_module.verify_password_async = security.verify_password_async
+    executor_ok = await run_burst(f"Password executor ({security.PASSWORD_HASH_WORKERS} workers)", logins)
+
+    security.shutdown_password_executor()
+    app.dependency_overrides.clear()
+    settings.RATE_LIMIT_ENABLED = rate_limit_enabled
+    return inline_ok and executor_ok
+
+
+if __name__ == "__main__":
+    ok = asyncio.run(run_benchmark())
+    print("OK" if ok else "FAILED: some logins did not succeed")
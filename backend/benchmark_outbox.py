@@ -0,0 +1,105 @@
+"""
+Outbox delivery benchmark
+Fills a scratch database with pending outbox events and measures how many events per second
+one OutboxConsumer delivers to the default observers, then replays an interrupted batch
+to check that observers which already acknowledged an event are not called again
+"""
+import asyncio
+import logging
+import sys
+import time
+from datetime import datetime
+from uuid import uuid4
+from motor.motor_asyncio import AsyncIOMotorClient
+from app.core.config import settings
+from app.core.patterns.observer import EventManager, EventType, Observer, _initialize_default_observers
+from app.repositories.outbox_repository import OutboxRepository, OUTBOX_STATUS_PENDING
+from app.services.outbox_service import OutboxConsumer, OUTBOX_BATCH_SIZE
+
+EVENTS = 20000
+EVENT_TYPES = [EventType.BOOKING_CREATED, EventType.REVIEW_CREATED, EventType.USER_REGISTERED]
+
+
+class CountingObserver(Observer):
+    
+    deliver_once = True
+    
+    def __init__(self):
+        self.calls = {}
+    
+    async def update(self, event):
+        self.calls[event.event_id] = self.calls.get(event.event_id, 0) + 1
+
+
+async def fill_outbox(repo: OutboxRepository, events: int):
+    now = datetime.utcnow()
+    documents = [
+        {
+            "_id": uuid4().hex,
+            "event_type": EVENT_TYPES[index % len(EVENT_TYPES)].value,
+            "data": {"vendor_id": f"vendor-{index % 100}", "email": f"user{index}@example.com"},
+            "status": OUTBOX_STATUS_PENDING,
+            "attempts": 0,
+            "created_at": now
+        }
+        for index in range(events)
+    ]
+    for start in range(0, len(documents), 5000):
+        await repo.collection.insert_many(documents[start:start + 5000], ordered=False)
+
+
+async def drain(consumer: OutboxConsumer, repo: OutboxRepository) -> int:
+    delivered = 0
+    while True:
+        batch = await repo.claim_batch(OUTBOX_BATCH_SIZE, 60)
+        if not batch:
+            return delivered
+        await consumer.deliver_batch(batch)
+        delivered += len(batch)
+
+
+async def run_benchmark(events: int = EVENTS):
+    # The default observers log every event at INFO; keep that out of the measurement
+    logging.getLogger("app.core.patterns.observer").setLevel(logging.WARNING)
+    
+    client = AsyncIOMotorClient(settings.DATABASE_URL, maxPoolSize=100)
+    database_name = f"{settings.DATABASE_NAME}_outbox_benchmark"
+    db = client[database_name]
+    repo = OutboxRepository(db)
+    await repo.collection.delete_many({})
+    await repo.ensure_indexes()
+    
+    manager = EventManager()
+    _initialize_default_observers(manager)
+    counter = CountingObserver()
+    for event_type in EVENT_TYPES:
+        manager.subscribe(event_type, counter)
+    consumer = OutboxConsumer()
+    consumer._repo = repo
+    consumer._event_manager = manager
+    
+    try:
+        print(f"Outbox delivery: {events} pending events, batches of {OUTBOX_BATCH_SIZE}...")
+        await fill_outbox(repo, events)
+        started = time.perf_counter()
+        delivered = await drain(consumer, repo)
+        elapsed = time.perf_counter() - started
+        print(f"   delivered {delivered} events in {elapsed:.2f}s ({delivered / elapsed:,.0f} events/s)")
+        
+        # Simulate a worker that died after the observers ran but before the batch was marked delivered
+        replayed = await repo.collection.find({}, {"_id": 1}).limit(OUTBOX_BATCH_SIZE).to_list(length=OUTBOX_BATCH_SIZE)
+        await repo.collection.update_many(
+            {"_id": {"$in": [document["_id"] for document in replayed]}},
+            {"$set": {"status": OUTBOX_STATUS_PENDING}}
+        )
+        await drain(consumer, repo)
+        repeated = sum(1 for calls in counter.calls.values() if calls > 1)
+        print(f"   redelivered {len(replayed)} events, observer called twice for {repeated}")
+    finally:
+        await client.drop_database(database_name)
+        client.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(run_benchmark())
+    sys.stdout.flush()
@@ -0,0 +1,54 @@
+"""
+Request metrics middleware overhead benchmark
+Drives a minimal ASGI app directly, with and without RequestMetricsMiddleware,
+and reports the per-request cost the middleware adds
+"""
+import asyncio
+import time
+from app.core.request_metrics import RequestMetricsMiddleware
+
+REQUESTS = 100000
+
+
+class VendorRoute:
+    path = "/api/vendors/{vendor_id}"
+
+
+async def vendor_endpoint(scope, receive, send):
+    # Stand-in for the router: FastAPI sets scope["route"] before calling the endpoint
+    scope["route"] = VendorRoute
+    await send({"type": "http.response.start", "status": 200, "headers": [(b"content-type", b"application/json")]})
+    await send({"type": "http.response.body", "body": b'{"id": "65f0c0ffee0000000000beef"}'})
+
+
+async def time_per_request(app) -> float:
+    """Return the average cost of one request through app in microseconds"""
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        pass
+
+    started = time.perf_counter()
+    for _ in range(REQUESTS):
+        await app({"type": "http", "method": "GET", "path": "/api/vendors/1"}, receive, send)
+    return (time.perf_counter() - started) / REQUESTS * 1e6
+
+
+async def run_benchmark():
+    wrapped = RequestMetricsMiddleware(vendor_endpoint)
+
+    # Warm up both paths so histogram buckets and metric keys already exist
+    await time_per_request(vendor_endpoint)
+    await time_per_request(wrapped)
+
+    print(f"Sending {REQUESTS} requests through each app...\n")
+    bare = await time_per_request(vendor_endpoint)
+    measured = await time_per_request(wrapped)
+    print(f"   {'without middleware':<22} {bare:8.2f} us/request")
+    print(f"   {'with middleware':<22} {measured:8.2f} us/request")
+    print(f"\nMiddleware overhead: {measured - bare:.2f} us/request")
+
+
+if __name__ == "__main__":
+    asyncio.run(run_benchmark())
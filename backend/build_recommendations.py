@@ -0,0 +1,41 @@
+"""
+Script to rebuild "couples also booked / favorited" vendor recommendations
+Run this script periodically (e.g. nightly from cron) to refresh vendor_recommendations and user_recommendations
+"""
+import asyncio
+from motor.motor_asyncio import AsyncIOMotorClient
+from app.core.config import settings
+from app.repositories.vendor_repository import VendorRepository
+from app.repositories.favorite_repository import FavoriteRepository
+from app.repositories.booking_repository import BookingRepository
+from app.repositories.recommendation_repository import RecommendationRepository
+from app.services.recommendation_service import RecommendationService
+
+
+async def build_recommendations():
+    """Build item-item cosine neighbours from favorites and bookings and store the top-k per vendor and user"""
+    print("Building vendor recommendations...")
+
+    # Connect to database
+    client = AsyncIOMotorClient(settings.DATABASE_URL)
+    db = client[settings.DATABASE_NAME]
+
+    recommendation_service = RecommendationService(
+        RecommendationRepository(db, "vendor_recommendations"),
+        RecommendationRepository(db, "user_recommendations"),
+        vendor_repo=VendorRepository(db),
+        favorite_repo=FavoriteRepository(db),
+        booking_repo=BookingRepository(db)
+    )
+    summary = await recommendation_service.rebuild()
+
+    print(f"\n[SUMMARY]")
+    print(f"   Interactions: {summary['interactions']}")
+    print(f"   Vendors with neighbours: {summary['vendors']}")
+    print(f"   Users with recommendations: {summary['users']}")
+
+    client.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(build_recommendations())
@@ -0,0 +1,60 @@
+"""
+Script to geocode existing vendors against the offline gazetteer
+Run this script to backfill location, city and area for vendors created before geocoding
+"""
+import asyncio
+import sys
+from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import UpdateOne
+from app.core.config import settings
+from app.repositories.vendor_repository import VendorRepository
+from app.services.geocoding_service import geocoding_service
+
+BATCH_SIZE = 500
+
+
+async def geocode_vendors(force: bool = False):
+    """Geocode vendors in batches, skipping ones that already have a location unless forced"""
+    print("Geocoding vendors...")
+
+    # Connect to database
+    client = AsyncIOMotorClient(settings.DATABASE_URL)
+    db = client[settings.DATABASE_NAME]
+    vendor_repo = VendorRepository(db)
+    await vendor_repo.ensure_indexes()
+
+    # Matches vendors never geocoded and ones stored with location None, so unresolved addresses are retried
+    query = {} if force else {"location": None}
+    cursor = vendor_repo.collection.find(query, {"business_address": 1}).batch_size(BATCH_SIZE)
+
+    located_count = 0
+    unresolved_count = 0
+    batch = []
+
+    async for vendor in cursor:
+        fields = geocoding_service.geocode_fields(vendor.get("business_address"))
+        if fields["location"]:
+            located_count += 1
+        else:
+            unresolved_count += 1
+            print(f"[SKIP] Could not geocode '{vendor.get('business_address')}' ({vendor['_id']})")
+
+        batch.append(UpdateOne({"_id": vendor["_id"]}, {"$set": fields}))
+        if len(batch) >= BATCH_SIZE:
+            await vendor_repo.collection.bulk_write(batch, ordered=False)
+            print(f"[OK] Wrote batch of {len(batch)} vendors")
+            batch = []
+
+    if batch:
+        await vendor_repo.collection.bulk_write(batch, ordered=False)
+        print(f"[OK] Wrote batch of {len(batch)} vendors")
+
+    print(f"\n[SUMMARY]")
+    print(f"   Located: {located_count} vendors")
+    print(f"   Unresolved: {unresolved_count} vendors")
+
+    client.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(geocode_vendors(force="--force" in sys.argv))
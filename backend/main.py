@@ -1,11 +1,30 @@
+import logging
 from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import JSONResponse
-from app.api.routes import auth, users, vendors, bookings, admin, services, uploads, vendor_bookings, reviews, checklist, favorites
+from fastapi.responses import JSONResponse, PlainTextResponse
+from app.api.routes import auth, users, vendors, bookings, admin, services, uploads, vendor_bookings, reviews, checklist, favorites, budget
 from app.core.config import settings
+from app.core.logging_config import configure_logging, stop_logging
 from app.core.database import Database
+from app.core.rate_limit import RateLimitMiddleware
+from app.core.request_metrics import RequestMetricsMiddleware
+from app.core.profiling import ProfilingMiddleware, get_continuous_profiler
+from app.core.memory_profiling import MemorySamplingMiddleware, get_memory_profiler
+from app.repositories.indexes import ensure_indexes
+from app.services.job_queue import get_job_queue
+from app.services.outbox_service import get_outbox_consumer
+from app.services.email_service import email_service
+from app.core.security import shutdown_password_executor
+from app.services.token_revocation import get_revocation_list
+from app.core.patterns.observer import get_event_manager
+from app.core.patterns.singleton import get_metrics, enable_shared_metrics
+from app.services.vendor_stats_service import VENDOR_STATS_JOB, run_vendor_stats_job
+from app.services.bulk_email_service import BULK_EMAIL_JOB, VENDOR_DIGEST_JOB, run_bulk_email_job, run_vendor_digest_job, schedule_vendor_digest
+
+configure_logging()
+logger = logging.getLogger(__name__)
 
 app = FastAPI(
     title="PakWedding Portal API",
@@ -25,14 +44,20 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
         error_details.append(f"{field}: {message}")
     
     error_message = "; ".join(error_details)
-    print(f"[VALIDATION ERROR] {error_message}")
-    print(f"[VALIDATION ERROR] Full error: {errors}")
+    logger.info("Validation error", extra={"path": request.url.path, "detail": error_message})
+    logger.debug("Validation error details", extra={"path": request.url.path, "errors": errors})
     
     return JSONResponse(
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
         content={"detail": error_message, "errors": errors}
     )
 
+app.add_middleware(MemorySamplingMiddleware)
+
+app.add_middleware(ProfilingMiddleware)
+
+app.add_middleware(RateLimitMiddleware)
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["http://localhost:3000", "http://localhost:5173"],  
@@ -40,14 +65,37 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+app.add_middleware(RequestMetricsMiddleware)
+
 
 @app.on_event("startup")
 async def startup_event():
+    if settings.MEMORY_PROFILING_START:
+        get_memory_profiler().start()
+    if settings.METRICS_SHARED_DIR:
+        enable_shared_metrics(settings.METRICS_SHARED_DIR)
     await Database.connect_db()
+    await ensure_indexes(Database.get_database())
+    await get_revocation_list().start(Database.get_database())
+    job_queue = get_job_queue()
+    job_queue.register(VENDOR_STATS_JOB, run_vendor_stats_job)
+    job_queue.register(BULK_EMAIL_JOB, run_bulk_email_job)
+    job_queue.register(VENDOR_DIGEST_JOB, run_vendor_digest_job)
+    await job_queue.start(Database.get_database())
+    await schedule_vendor_digest()
+    await get_outbox_consumer().start(Database.get_database(), get_event_manager())
+    get_continuous_profiler().start()
 
 @app.on_event("shutdown")
 async def shutdown_event():
+    get_continuous_profiler().stop()
+    await get_revocation_list().stop()
+    await get_outbox_consumer().stop()
+    await get_job_queue().stop()
+    await email_service.close()
+    shutdown_password_executor()
     await Database.close_db()
+    stop_logging()
 
 
 app.include_router(auth.router, prefix="/api/auth", tags=["Authentication"])
@@ -61,6 +109,7 @@ app.include_router(vendor_bookings.router, prefix="/api/vendor", tags=["Vendor B
 app.include_router(reviews.router, prefix="/api/reviews", tags=["Reviews"])
 app.include_router(checklist.router, prefix="/api/checklist", tags=["Checklist"])
 app.include_router(favorites.router, prefix="/api/favorites", tags=["Favorites"])
+app.include_router(budget.router, prefix="/api/budget", tags=["Budget"])
 
 @app.get("/")
 async def root():
@@ -70,3 +119,7 @@ async def root():
 async def health_check():
     return {"status": "healthy"}
 
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    return PlainTextResponse(get_metrics().render_prometheus(), media_type="text/plain; version=0.0.4")
+
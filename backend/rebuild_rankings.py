@@ -0,0 +1,82 @@
+"""
+Script to rebuild vendor ranking scores from reviews and bookings
+Run this script once to backfill review_count, rating_sum, booking_activity and ranking_score,
+then periodically (e.g. nightly) to re-apply recency decay to vendors without recent events
+"""
+import asyncio
+from datetime import datetime
+from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import UpdateOne
+from app.core.config import settings
+from app.repositories.vendor_repository import VendorRepository
+from app.services.vendor_stats_service import activity_weight, ranking_score, RANKING_DEFAULT_PRIOR
+
+BATCH_SIZE = 500
+ACTIVE_BOOKING_STATUSES = ["approved", "confirmed", "completed"]
+
+
+async def rebuild_rankings():
+    """Recount review and booking totals per vendor and write ranking_score in batches"""
+    print("Rebuilding vendor rankings...")
+
+    # Connect to database
+    client = AsyncIOMotorClient(settings.DATABASE_URL)
+    db = client[settings.DATABASE_NAME]
+    vendor_repo = VendorRepository(db)
+    await vendor_repo.ensure_indexes()
+
+    # Review totals per vendor
+    review_totals = {}
+    pipeline = [{"$group": {"_id": "$vendor_id", "count": {"$sum": 1}, "total": {"$sum": "$rating"}}}]
+    async for row in db["reviews"].aggregate(pipeline):
+        totals = review_totals.setdefault(str(row["_id"]), [0, 0.0])
+        totals[0] += row["count"]
+        totals[1] += row["total"]
+
+    # Decayed booking activity per vendor
+    booking_activity = {}
+    cursor = db["bookings"].find(
+        {"status": {"$in": ACTIVE_BOOKING_STATUSES}},
+        {"vendor_id": 1, "created_at": 1}
+    )
+    async for booking in cursor:
+        at = booking.get("created_at") or datetime.utcnow()
+        vendor_id = str(booking.get("vendor_id"))
+        booking_activity[vendor_id] = booking_activity.get(vendor_id, 0.0) + activity_weight(at)
+
+    review_count = sum(t[0] for t in review_totals.values())
+    prior = sum(t[1] for t in review_totals.values()) / review_count if review_count else RANKING_DEFAULT_PRIOR
+    print(f"[OK] Prior rating: {prior:.2f} from {review_count} reviews")
+
+    now = datetime.utcnow()
+    updated_count = 0
+    batch = []
+    async for vendor in vendor_repo.collection.find({}, {"_id": 1}).batch_size(BATCH_SIZE):
+        vendor_id = str(vendor["_id"])
+        count, total = review_totals.get(vendor_id, (0, 0.0))
+        fields = {
+            "review_count": count,
+            "rating_sum": total,
+            "booking_activity": booking_activity.get(vendor_id, 0.0)
+        }
+        fields["ranking_score"] = ranking_score(fields, prior, now)
+        batch.append(UpdateOne({"_id": vendor["_id"]}, {"$set": fields}))
+        updated_count += 1
+
+        if len(batch) >= BATCH_SIZE:
+            await vendor_repo.collection.bulk_write(batch, ordered=False)
+            print(f"[OK] Wrote batch of {len(batch)} vendors")
+            batch = []
+
+    if batch:
+        await vendor_repo.collection.bulk_write(batch, ordered=False)
+        print(f"[OK] Wrote batch of {len(batch)} vendors")
+
+    print(f"\n[SUMMARY]")
+    print(f"   Ranked: {updated_count} vendors")
+
+    client.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(rebuild_rankings())
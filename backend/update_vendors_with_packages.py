@@ -6,6 +6,7 @@ import asyncio
 from motor.motor_asyncio import AsyncIOMotorClient
 from app.core.config import settings
 from app.repositories.vendor_repository import VendorRepository
+from app.services.vendor_service import package_price_fields
 
 # Category-based pricing
 CATEGORY_PRICES = {
@@ -45,6 +46,9 @@ async def update_vendors_with_packages():
             
             # Check if vendor already has packages
             if "packages" in vendor and vendor["packages"] and len(vendor["packages"]) > 0:
+                # Backfill the package price index for vendors created before it existed
+                if "min_package_price" not in vendor:
+                    await vendor_repo.update(vendor_id, package_price_fields(vendor["packages"]))
                 print(f"[SKIP] {vendor.get('business_name')} already has packages")
                 skipped_count += 1
                 continue
@@ -93,7 +97,7 @@ async def update_vendors_with_packages():
             ]
             
             # Update vendor with packages
-            await vendor_repo.update(vendor_id, {"packages": packages})
+            await vendor_repo.update(vendor_id, {"packages": packages, **package_price_fields(packages)})
             print(f"[OK] Updated {vendor.get('business_name')} ({service_category}) with packages")
             updated_count += 1
             
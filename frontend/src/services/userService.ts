@@ -1,4 +1,5 @@
 import api from './api'
+import { useAuthStore } from '../store/authStore'
 
 export type User = {
   id: string
@@ -21,10 +22,12 @@ export async function updateUserProfile(userData: Partial<User>) {
 }
 
 export async function updatePassword(oldPassword: string, newPassword: string) {
-  const { data } = await api.put<User>('/users/me/password', {
+  const { data } = await api.put<User & { access_token: string }>('/users/me/password', {
     old_password: oldPassword,
     new_password: newPassword
   })
+  // The password change revokes the old token; keep the session alive with the new one
+  useAuthStore.setState({ token: data.access_token })
   return data
 }
 